@@ -0,0 +1,320 @@
+"""Microbenchmarks for domain hot paths.
+
+    python -m benchmarks.domain
+    python -m benchmarks.domain --output before.json
+    python -m benchmarks.domain --baseline before.json --tolerance 0.10
+
+Each benchmark reports throughput (best of several timed rounds) and,
+measured separately under tracemalloc, the memory blocks and bytes each
+operation leaves alive plus its transient peak. With ``--baseline`` the
+run is compared with an earlier JSON result and exits non-zero when any
+benchmark lost more than ``--tolerance`` of its throughput.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+from trading.domain.order import Order
+from trading.domain.value_objects import (
+    Money,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    TradingPair,
+)
+from trading.infrastructure.models import (
+    OrderModel,
+    OrderSideDB,
+    OrderStatusDB,
+    OrderTypeDB,
+)
+from trading.infrastructure.repository import OrderRepository
+
+DEFAULT_ROUNDS = 5
+DEFAULT_MIN_TIME = 0.2  # seconds per timed round
+MEMORY_SAMPLES = 1000  # operations kept alive while measuring memory
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    # Builds the state an operation needs; never timed
+    setup: Callable[[], Any]
+    operation: Callable[[Any], Any]
+
+
+@dataclass
+class Result:
+    name: str
+    ops_per_sec: float
+    ns_per_op: float
+    blocks_per_op: float
+    bytes_per_op: float
+    peak_bytes_per_op: float
+
+
+BTC_USDT = TradingPair("BTC", "USDT")
+
+
+def _open_order() -> Order:
+    # Large enough that repeated small fills never complete it
+    return Order(
+        order_id="ORD-BENCH",
+        user_id="bench",
+        trading_pair=BTC_USDT,
+        side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        price=Money(Decimal("65000.5"), "USDT"),
+        quantity=Decimal("1000000000"),
+        status=OrderStatus.OPEN,
+    )
+
+
+def _order_model() -> OrderModel:
+    now = datetime.now(timezone.utc)
+    return OrderModel(
+        order_id="ORD-BENCH",
+        user_id="bench",
+        symbol="BTC/USDT",
+        side=OrderSideDB.BUY,
+        type=OrderTypeDB.LIMIT,
+        price=Decimal("65000.50000000"),
+        quantity=Decimal("0.25000000"),
+        filled_quantity=Decimal("0.10000000"),
+        status=OrderStatusDB.PARTIAL_FILLED,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _money_arithmetic(operands):
+    a, b, factor = operands
+    return a.add(b).multiply(factor).subtract(b)
+
+
+BENCHMARKS = [
+    Benchmark(
+        "Order.create",
+        lambda: (BTC_USDT, Money(Decimal("65000.5"), "USDT"), Decimal("0.25")),
+        lambda s: Order.create(
+            "bench", s[0], OrderSide.BUY, OrderType.LIMIT, s[1], s[2]
+        ),
+    ),
+    Benchmark(
+        "Order.place_limit_order",
+        lambda: (Decimal("65000.5"), Decimal("0.25")),
+        lambda s: Order.place_limit_order("bench", "BTC/USDT", OrderSide.BUY, *s),
+    ),
+    Benchmark(
+        "Order.fill",
+        _open_order,
+        lambda order: order.fill(Decimal("0.001")),
+    ),
+    Benchmark(
+        "TradingPair.from_symbol",
+        lambda: "BTC/USDT",
+        TradingPair.from_symbol,
+    ),
+    Benchmark(
+        "Money arithmetic",
+        lambda: (
+            Money(Decimal("100.25"), "USDT"),
+            Money(Decimal("3.5"), "USDT"),
+            Decimal("1.5"),
+        ),
+        _money_arithmetic,
+    ),
+    Benchmark(
+        "OrderRepository._model_to_domain",
+        lambda: (OrderRepository(None), _order_model()),
+        lambda s: s[0]._model_to_domain(s[1]),
+    ),
+]
+
+
+def measure_speed(
+    benchmark: Benchmark,
+    rounds: int = DEFAULT_ROUNDS,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> float:
+    """Best-of-``rounds`` nanoseconds per operation"""
+    state = benchmark.setup()
+    operation = benchmark.operation
+
+    # Calibrate: grow the loop until one round takes at least min_time
+    loops = 1
+    while True:
+        elapsed = _time_loop(operation, state, loops)
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed == 0 else max(2, int(min_time / elapsed * 1.2))
+
+    best = elapsed
+    for _ in range(rounds - 1):
+        best = min(best, _time_loop(operation, state, loops))
+    return best / loops * 1e9
+
+
+def _time_loop(operation, state, loops: int) -> float:
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation(state)
+        return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def measure_memory(benchmark: Benchmark, samples: int = MEMORY_SAMPLES) -> Dict:
+    """Blocks and bytes each operation keeps alive, and its transient peak"""
+    state = benchmark.setup()
+    operation = benchmark.operation
+    operation(state)  # warm caches so they are not charged to the samples
+    kept: List[Any] = []
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        base_current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(samples):
+            kept.append(operation(state))
+        current, _ = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+
+        # Peak of a single operation whose result is dropped straight away
+        single_base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        operation(state)
+        _, single_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    # The list holding the results is overhead, not the operation's
+    blocks -= 1 if samples else 0
+    retained = current - base_current - sys.getsizeof(kept)
+    return {
+        "blocks_per_op": max(0.0, blocks / samples),
+        "bytes_per_op": max(0.0, retained / samples),
+        "peak_bytes_per_op": float(max(0, single_peak - single_base)),
+    }
+
+
+def run(
+    benchmarks: List[Benchmark] = BENCHMARKS,
+    rounds: int = DEFAULT_ROUNDS,
+    min_time: float = DEFAULT_MIN_TIME,
+    memory_samples: int = MEMORY_SAMPLES,
+) -> List[Result]:
+    results = []
+    for benchmark in benchmarks:
+        ns = measure_speed(benchmark, rounds, min_time)
+        memory = measure_memory(benchmark, memory_samples)
+        results.append(
+            Result(
+                name=benchmark.name,
+                ops_per_sec=1e9 / ns if ns else float("inf"),
+                ns_per_op=ns,
+                **memory,
+            )
+        )
+    return results
+
+
+def to_json(results: List[Result]) -> Dict:
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(r) for r in results],
+    }
+
+
+def compare(results: List[Result], baseline: Dict, tolerance: float) -> List[str]:
+    """Benchmarks whose throughput fell more than ``tolerance`` below baseline"""
+    previous = {r["name"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        old = previous.get(result.name)
+        if old is None or not old["ops_per_sec"]:
+            continue
+        change = result.ops_per_sec / old["ops_per_sec"] - 1
+        if change < -tolerance:
+            regressions.append(
+                f"{result.name}: {result.ops_per_sec:,.0f} ops/s vs "
+                f"{old['ops_per_sec']:,.0f} baseline ({change:+.1%})"
+            )
+    return regressions
+
+
+def format_table(results: List[Result]) -> str:
+    header = (
+        f"{'benchmark':<34} {'ops/s':>12} {'ns/op':>10} "
+        f"{'blocks/op':>10} {'B/op':>8} {'peak B/op':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.name:<34} {r.ops_per_sec:>12,.0f} {r.ns_per_op:>10,.0f} "
+            f"{r.blocks_per_op:>10.1f} {r.bytes_per_op:>8,.0f} "
+            f"{r.peak_bytes_per_op:>10,.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON result of an earlier run")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="allowed throughput loss vs baseline, as a fraction (default 0.10)",
+    )
+    parser.add_argument("--filter", help="only run benchmarks containing this text")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    args = parser.parse_args(argv)
+
+    selected = [
+        b
+        for b in BENCHMARKS
+        if not args.filter or args.filter.lower() in b.name.lower()
+    ]
+    results = run(selected, rounds=args.rounds, min_time=args.min_time)
+    print(format_table(results))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(to_json(results), f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\nRegressions beyond {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.tolerance:.0%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,654 @@
+"""Synthetic market data for benchmarking at realistic table sizes.
+
+    python -m benchmarks.generate_data --users 10000 --symbols 20 --orders 6000000
+    python -m benchmarks.generate_data --database-url sqlite:///./big.db --reset
+
+Fills the database with N users (funded balances, one shared password
+hash), M trading pairs and a stream of orders spread over ``--days`` of
+history, plus the trades that filled them. Each symbol follows its own
+geometric random walk; order arrivals are Poisson, user and symbol
+activity is skewed (a few whales and majors carry most of the flow), and
+status depends on age: recent orders are often still open, old ones are
+filled or cancelled. Trades split each fill into one to four executions
+against recent resting orders on the other side of the book, so maker
+fills do not reconcile exactly with trade totals. Fees follow the fee
+engine: buyers pay in base currency, sellers in quote. The open remainder
+of every OPEN and PARTIAL_FILLED order is moved from ``available`` to
+``locked`` (topping up balances that cannot cover it), so cancelling a
+generated order releases a real hold.
+
+Rows are written with DB-API ``executemany`` in large batches, with the
+journal and fsync relaxed and the secondary indexes of ``orders`` and
+``trades`` dropped for the load and rebuilt once at the end. Candles are
+left empty. Runs append to existing data unless ``--reset`` is given.
+"""
+
+import argparse
+import itertools
+import math
+import random
+import sys
+import time
+from bisect import bisect_right
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from database import Base
+from trading.infrastructure.models import (
+    BalanceModel,
+    OrderModel,
+    TradeModel,
+    TradingPairModel,
+    UserModel,
+)
+from trading.infrastructure.password_hashing import password_pool
+
+DEFAULT_DATABASE_URL = "sqlite:///./trading.db"
+DEFAULT_BATCH_SIZE = 50_000
+SYNTHETIC_PASSWORD = "synthetic"
+
+QUOTE = "USDT"
+# (base, start price, daily volatility); further symbols are generated
+MAJORS = (
+    ("BTC", 65000.0, 0.030),
+    ("ETH", 3500.0, 0.040),
+    ("SOL", 150.0, 0.060),
+    ("BNB", 580.0, 0.035),
+    ("XRP", 0.52, 0.050),
+    ("ADA", 0.45, 0.055),
+    ("DOGE", 0.15, 0.070),
+    ("AVAX", 35.0, 0.065),
+)
+
+# Orders younger than RECENT_SECONDS are far more likely to still be working
+RECENT_SECONDS = 24 * 3600
+LIMIT_STATUS_WEIGHTS = {
+    "recent": (
+        ("OPEN", 30),
+        ("PARTIAL_FILLED", 8),
+        ("FILLED", 40),
+        ("CANCELLED", 20),
+        ("REJECTED", 2),
+    ),
+    "old": (
+        ("OPEN", 3),
+        ("PARTIAL_FILLED", 1),
+        ("FILLED", 62),
+        ("CANCELLED", 32),
+        ("REJECTED", 2),
+    ),
+}
+MARKET_STATUS_WEIGHTS = (("FILLED", 97), ("REJECTED", 3))
+MARKET_ORDER_SHARE = 0.15
+# Share of cancelled orders that were partly filled before the cancel
+CANCELLED_AFTER_FILL = 0.15
+MAX_FILLS_PER_ORDER = 4
+FEE_RATE = 0.001
+RESTING_BOOK_DEPTH = 256
+
+ORDER_COLUMNS = (
+    "order_id",
+    "user_id",
+    "symbol",
+    "side",
+    "type",
+    "price",
+    "quantity",
+    "filled_quantity",
+    "status",
+    "created_at",
+    "updated_at",
+)
+TRADE_COLUMNS = (
+    "trade_id",
+    "symbol",
+    "buy_order_id",
+    "sell_order_id",
+    "buyer_user_id",
+    "seller_user_id",
+    "price",
+    "quantity",
+    "buyer_fee",
+    "seller_fee",
+    "executed_at",
+)
+
+
+@dataclass
+class GeneratorConfig:
+    users: int = 1000
+    symbols: int = 8
+    orders: int = 100_000
+    days: float = 30.0
+    seed: int = 1
+    batch_size: int = DEFAULT_BATCH_SIZE
+    defer_indexes: bool = True
+
+
+@dataclass(frozen=True)
+class SymbolSpec:
+    symbol: str
+    base: str
+    start_price: float
+    daily_volatility: float
+    price_decimals: int
+    quantity_decimals: int
+
+
+def make_symbols(count: int, rng: random.Random) -> List[SymbolSpec]:
+    specs = []
+    for i in range(count):
+        if i < len(MAJORS):
+            base, price, volatility = MAJORS[i]
+        else:
+            base = f"SYN{i:03d}"
+            price = math.exp(rng.uniform(math.log(0.05), math.log(500)))
+            volatility = rng.uniform(0.04, 0.10)
+        # Roughly five significant digits of price, quantities to match
+        price_decimals = max(0, min(8, 4 - math.floor(math.log10(price))))
+        quantity_decimals = max(0, min(8, math.floor(math.log10(price)) + 2))
+        specs.append(
+            SymbolSpec(
+                symbol=f"{base}/{QUOTE}",
+                base=base,
+                start_price=price,
+                daily_volatility=volatility,
+                price_decimals=price_decimals,
+                quantity_decimals=quantity_decimals,
+            )
+        )
+    return specs
+
+
+class PriceWalk:
+    """Geometric random walk advanced by elapsed time"""
+
+    __slots__ = ("price", "_scale", "_last", "_rng")
+
+    def __init__(self, spec: SymbolSpec, start: float, rng: random.Random):
+        self.price = spec.start_price
+        self._scale = spec.daily_volatility / math.sqrt(86400)
+        self._last = start
+        self._rng = rng
+
+    def at(self, timestamp: float) -> float:
+        dt = timestamp - self._last
+        if dt > 0:
+            sigma = self._scale * math.sqrt(dt)
+            self.price *= math.exp(self._rng.gauss(-0.5 * sigma * sigma, sigma))
+            self._last = timestamp
+        return self.price
+
+
+def _cumulative(weights: Sequence[float]) -> List[float]:
+    return list(itertools.accumulate(weights))
+
+
+def _zipf_weights(count: int, exponent: float) -> List[float]:
+    return [1 / (rank**exponent) for rank in range(1, count + 1)]
+
+
+def _timestamp(epoch: float) -> str:
+    # SQLAlchemy's SQLite DateTime storage format (naive UTC)
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+class TimestampFormatter:
+    """``_timestamp`` with the date and minute prefix cached.
+
+    Orders arrive in time order, so almost every call reuses a prefix and
+    only the seconds are formatted; strftime per row dominated the load.
+    """
+
+    __slots__ = ("_prefixes",)
+
+    def __init__(self):
+        self._prefixes: Dict[int, str] = {}
+
+    def __call__(self, epoch: float) -> str:
+        minute = int(epoch // 60)
+        prefix = self._prefixes.get(minute)
+        if prefix is None:
+            if len(self._prefixes) > 4096:
+                self._prefixes.clear()
+            prefix = datetime.fromtimestamp(minute * 60, timezone.utc).strftime(
+                "%Y-%m-%d %H:%M:"
+            )
+            self._prefixes[minute] = prefix
+        # Truncate like datetime does, never rounding up to 60 seconds
+        micros = int((epoch - minute * 60) * 1_000_000)
+        return f"{prefix}{micros // 1_000_000:02d}.{micros % 1_000_000:06d}"
+
+
+def generate_rows(
+    config: GeneratorConfig,
+    symbols: List[SymbolSpec],
+    usernames: List[str],
+    end: float,
+    first_order: int = 0,
+    first_trade: int = 0,
+    holds: Optional[Dict[Tuple[str, str], float]] = None,
+) -> Iterator[Tuple[List[tuple], List[tuple]]]:
+    """Yield (order rows, trade rows) batches in ``created_at`` order.
+
+    ``holds`` accumulates the funds resting orders lock, per (user, currency).
+    """
+    rng = random.Random(config.seed)
+    start = end - config.days * 86400
+    mean_gap = (end - start) / max(1, config.orders)
+
+    walks = [PriceWalk(spec, start, rng) for spec in symbols]
+    symbol_weights = _cumulative(_zipf_weights(len(symbols), 1.0))
+    user_weights = _cumulative(_zipf_weights(len(usernames), 0.8))
+    limit_weights = {
+        age: (
+            [status for status, _ in table],
+            _cumulative([weight for _, weight in table]),
+        )
+        for age, table in LIMIT_STATUS_WEIGHTS.items()
+    }
+    market_statuses = [status for status, _ in MARKET_STATUS_WEIGHTS]
+    market_weights = _cumulative([weight for _, weight in MARKET_STATUS_WEIGHTS])
+    # Recent resting orders per (symbol, side) that takers trade against
+    books: Dict[Tuple[int, str], deque] = {
+        (i, side): deque(maxlen=RESTING_BOOK_DEPTH)
+        for i in range(len(symbols))
+        for side in ("BUY", "SELL")
+    }
+
+    uniform = rng.random
+    timestamp = TimestampFormatter()
+    symbol_index = list(range(len(symbols)))
+
+    def pick(values, cum_weights):
+        # random.choices without its per-call setup
+        return values[bisect_right(cum_weights, uniform() * cum_weights[-1])]
+
+    order_seq = first_order
+    trade_seq = first_trade
+    now = start
+    orders: List[tuple] = []
+    trades: List[tuple] = []
+
+    for _ in range(config.orders):
+        # Poisson arrivals; the sum may overshoot the window by a few gaps
+        now = min(now + rng.expovariate(1 / mean_gap), end)
+        s = pick(symbol_index, symbol_weights)
+        spec = symbols[s]
+        user = pick(usernames, user_weights)
+        side = "BUY" if uniform() < 0.5 else "SELL"
+        market = uniform() < MARKET_ORDER_SHARE
+        mid = walks[s].at(now)
+
+        # Notional is log-normal around ~250 USDT: many small, a few whales
+        notional = math.exp(rng.gauss(5.5, 1.4))
+        quantity = round(notional / mid, spec.quantity_decimals)
+        if quantity <= 0:
+            quantity = 10**-spec.quantity_decimals
+
+        if market:
+            order_type = "MARKET"
+            price = 0.0
+            status = pick(market_statuses, market_weights)
+        else:
+            order_type = "LIMIT"
+            price = round(mid * (1 + rng.gauss(0, 0.004)), spec.price_decimals)
+            statuses, weights = limit_weights[
+                "recent" if end - now < RECENT_SECONDS else "old"
+            ]
+            status = pick(statuses, weights)
+
+        if status == "FILLED":
+            filled = quantity
+        elif status == "PARTIAL_FILLED" or (
+            status == "CANCELLED" and uniform() < CANCELLED_AFTER_FILL
+        ):
+            filled = round(quantity * rng.uniform(0.05, 0.95), spec.quantity_decimals)
+        else:
+            filled = 0.0
+
+        if status in ("OPEN", "REJECTED"):
+            updated = now + (0.0 if status == "OPEN" else rng.uniform(0.001, 0.05))
+        elif market:
+            updated = now + rng.uniform(0.001, 0.05)
+        else:
+            updated = now + rng.expovariate(1 / 600)
+        updated = max(now, min(updated, end))
+
+        if holds is not None and status in ("OPEN", "PARTIAL_FILLED"):
+            resting = quantity - filled
+            if side == "BUY":
+                key, amount = (user, QUOTE), price * resting
+            else:
+                key, amount = (user, spec.base), resting
+            holds[key] = holds.get(key, 0.0) + amount
+
+        order_id = f"ORD-G{order_seq:011X}"
+        order_seq += 1
+        created_text = timestamp(now)
+        orders.append(
+            (
+                order_id,
+                user,
+                spec.symbol,
+                side,
+                order_type,
+                price,
+                quantity,
+                filled,
+                status,
+                created_text,
+                created_text if updated == now else timestamp(updated),
+            )
+        )
+
+        if filled > 0:
+            counter_book = books[(s, "SELL" if side == "BUY" else "BUY")]
+            if counter_book:
+                fills = 1
+                while fills < MAX_FILLS_PER_ORDER and uniform() < 0.35:
+                    fills += 1
+                executed = timestamp(updated)
+                trade_price = round(walks[s].price, spec.price_decimals)
+                remaining = filled
+                for n in range(fills):
+                    if n == fills - 1:
+                        part = round(remaining, spec.quantity_decimals)
+                    else:
+                        part = round(
+                            remaining * rng.uniform(0.2, 0.8), spec.quantity_decimals
+                        )
+                    if part <= 0:
+                        continue
+                    remaining -= part
+                    maker_id, maker_user = counter_book[
+                        int(uniform() * len(counter_book))
+                    ]
+                    if side == "BUY":
+                        buy, sell = (order_id, user), (maker_id, maker_user)
+                    else:
+                        buy, sell = (maker_id, maker_user), (order_id, user)
+                    # Buyer pays in the base it receives, seller in quote
+                    buyer_fee = round(part * FEE_RATE, 8)
+                    seller_fee = round(trade_price * part * FEE_RATE, 8)
+                    trades.append(
+                        (
+                            f"TRD-G{trade_seq:011X}",
+                            spec.symbol,
+                            buy[0],
+                            sell[0],
+                            buy[1],
+                            sell[1],
+                            trade_price,
+                            part,
+                            buyer_fee,
+                            seller_fee,
+                            executed,
+                        )
+                    )
+                    trade_seq += 1
+
+        if not market and status != "REJECTED":
+            books[(s, side)].append((order_id, user))
+
+        if len(orders) >= config.batch_size:
+            yield orders, trades
+            orders, trades = [], []
+
+    if orders or trades:
+        yield orders, trades
+
+
+def _insert_sql(table: str, columns: Sequence[str], ignore: bool = False) -> str:
+    verb = "INSERT OR IGNORE" if ignore else "INSERT"
+    placeholders = ", ".join("?" for _ in columns)
+    return f"{verb} INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+@contextmanager
+def bulk_load(engine: Engine):
+    """Raw DB-API connection with the journal and fsync relaxed for the load"""
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        journal = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = cursor.execute("PRAGMA synchronous").fetchone()[0]
+        cursor.execute("PRAGMA journal_mode = MEMORY")
+        cursor.execute("PRAGMA synchronous = OFF")
+        cursor.execute("PRAGMA cache_size = -262144")  # 256 MiB
+        try:
+            yield connection
+        finally:
+            connection.commit()
+            cursor.execute(f"PRAGMA journal_mode = {journal}")
+            cursor.execute(f"PRAGMA synchronous = {synchronous}")
+    finally:
+        connection.close()
+
+
+@contextmanager
+def deferred_indexes(engine: Engine, enabled: bool = True):
+    """Drop the secondary indexes of orders and trades, rebuild them after"""
+    indexes = [
+        index
+        for table in (OrderModel.__table__, TradeModel.__table__)
+        for index in table.indexes
+    ]
+    if enabled:
+        for index in indexes:
+            index.drop(engine, checkfirst=True)
+    try:
+        yield
+    finally:
+        if enabled:
+            for index in indexes:
+                index.create(engine, checkfirst=True)
+
+
+# Holds come out of available; balances that cannot cover them are topped up
+HOLD_SQL = (
+    "INSERT INTO balances (user_id, currency, available, locked, updated_at) "
+    "VALUES (?, ?, 0, ?, ?) ON CONFLICT (user_id, currency) DO UPDATE SET "
+    "available = MAX(available - excluded.locked, 0), "
+    "locked = locked + excluded.locked, updated_at = excluded.updated_at"
+)
+
+
+def _next_sequence(cursor, table: str, column: str, prefix: str) -> int:
+    """First free synthetic id, so repeated runs append instead of colliding"""
+    row = cursor.execute(
+        f"SELECT MAX({column}) FROM {table} WHERE {column} LIKE ?", (prefix + "%",)
+    ).fetchone()
+    return int(row[0][len(prefix) :], 16) + 1 if row and row[0] else 0
+
+
+def _reference_rows(
+    config: GeneratorConfig,
+    symbols: List[SymbolSpec],
+    usernames: List[str],
+    hashed_password: str,
+    created: str,
+) -> Dict[str, List[tuple]]:
+    users = [(name, hashed_password, "user", created, created) for name in usernames]
+    pairs = [
+        (
+            spec.symbol,
+            spec.base,
+            QUOTE,
+            1,
+            10**-spec.price_decimals,
+            10**-spec.quantity_decimals,
+            10**-spec.price_decimals,
+            1_000_000_000,
+            10**-spec.quantity_decimals,
+            1_000_000,
+            0,
+            created,
+            created,
+        )
+        for spec in symbols
+    ]
+    rng = random.Random(config.seed + 1)
+    balances = []
+    for name in usernames:
+        balances.append((name, QUOTE, round(rng.uniform(1_000, 1_000_000), 2), 0))
+        for spec in rng.sample(symbols, min(3, len(symbols))):
+            amount = round(
+                rng.uniform(100, 100_000) / spec.start_price, spec.quantity_decimals
+            )
+            balances.append((name, spec.base, amount, 0))
+    return {
+        "users": users,
+        "trading_pairs": pairs,
+        "balances": [row + (created,) for row in balances],
+    }
+
+
+def generate(
+    engine: Engine,
+    config: GeneratorConfig,
+    progress: Optional[Callable[[str], None]] = print,
+) -> dict:
+    """Write the synthetic data set; returns row counts and throughput"""
+    rng = random.Random(config.seed)
+    symbols = make_symbols(config.symbols, rng)
+    usernames = [f"sim-user-{i:06d}" for i in range(config.users)]
+    end = time.time()
+    created = _timestamp(end - config.days * 86400)
+
+    Base.metadata.create_all(engine)
+    # Hashing once keeps the generator fast; logins still verify normally
+    hashed = password_pool.hash_blocking(SYNTHETIC_PASSWORD)
+
+    counts = {"users": 0, "trading_pairs": 0, "balances": 0, "orders": 0, "trades": 0}
+    started = time.perf_counter()
+    with deferred_indexes(engine, config.defer_indexes), bulk_load(engine) as conn:
+        cursor = conn.cursor()
+        holds: Dict[Tuple[str, str], float] = {}
+        reference = _reference_rows(config, symbols, usernames, hashed, created)
+        columns = {
+            "users": [c.name for c in UserModel.__table__.columns],
+            "trading_pairs": [c.name for c in TradingPairModel.__table__.columns],
+            "balances": [c.name for c in BalanceModel.__table__.columns],
+        }
+        for table, rows in reference.items():
+            # Users, pairs and balances may exist from an earlier run
+            cursor.executemany(_insert_sql(table, columns[table], ignore=True), rows)
+            counts[table] = cursor.rowcount
+        conn.commit()
+
+        order_sql = _insert_sql("orders", ORDER_COLUMNS)
+        trade_sql = _insert_sql("trades", TRADE_COLUMNS)
+        batches = generate_rows(
+            config,
+            symbols,
+            usernames,
+            end,
+            first_order=_next_sequence(cursor, "orders", "order_id", "ORD-G"),
+            first_trade=_next_sequence(cursor, "trades", "trade_id", "TRD-G"),
+            holds=holds,
+        )
+        for orders, trades in batches:
+            cursor.executemany(order_sql, orders)
+            cursor.executemany(trade_sql, trades)
+            conn.commit()
+            counts["orders"] += len(orders)
+            counts["trades"] += len(trades)
+            if progress:
+                elapsed = time.perf_counter() - started
+                written = counts["orders"] + counts["trades"]
+                progress(
+                    f"{counts['orders']:>12,} orders {counts['trades']:>12,} trades "
+                    f"{written / elapsed:>10,.0f} rows/s"
+                )
+
+        updated = _timestamp(end)
+        cursor.executemany(
+            HOLD_SQL,
+            [
+                (user, currency, round(amount, 8), updated)
+                for (user, currency), amount in holds.items()
+            ],
+        )
+        conn.commit()
+        load_seconds = time.perf_counter() - started
+
+    total_seconds = time.perf_counter() - started
+    rows = sum(counts.values())
+    return {
+        "counts": counts,
+        "rows": rows,
+        "load_seconds": round(load_seconds, 3),
+        "index_seconds": round(total_seconds - load_seconds, 3),
+        "rows_per_second": round(rows / total_seconds) if total_seconds else 0,
+    }
+
+
+def reset_database(engine: Engine):
+    Base.metadata.drop_all(engine)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--users", type=int, default=GeneratorConfig.users)
+    parser.add_argument("--symbols", type=int, default=GeneratorConfig.symbols)
+    parser.add_argument("--orders", type=int, default=GeneratorConfig.orders)
+    parser.add_argument(
+        "--days",
+        type=float,
+        default=GeneratorConfig.days,
+        help="history the orders are spread over (default 30)",
+    )
+    parser.add_argument("--seed", type=int, default=GeneratorConfig.seed)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--keep-indexes",
+        action="store_true",
+        help="maintain indexes during the load instead of rebuilding them after",
+    )
+    parser.add_argument(
+        "--reset", action="store_true", help="drop all tables before generating"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.database_url.startswith("sqlite"):
+        parser.error("only SQLite databases are supported")
+    if args.users < 1 or args.symbols < 1:
+        parser.error("--users and --symbols must be at least 1")
+
+    config = GeneratorConfig(
+        users=args.users,
+        symbols=args.symbols,
+        orders=args.orders,
+        days=args.days,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        defer_indexes=not args.keep_indexes,
+    )
+    engine = create_engine(args.database_url)
+    try:
+        if args.reset:
+            reset_database(engine)
+        report = generate(engine, config)
+    finally:
+        engine.dispose()
+
+    counts = ", ".join(f"{n:,} {table}" for table, n in report["counts"].items())
+    print(
+        f"\n{counts}\n{report['rows']:,} rows in "
+        f"{report['load_seconds'] + report['index_seconds']:.1f} s "
+        f"(indexes {report['index_seconds']:.1f} s), "
+        f"{report['rows_per_second']:,} rows/s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
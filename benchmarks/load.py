@@ -0,0 +1,428 @@
+"""HTTP load generator for the real FastAPI app.
+
+    python -m benchmarks.load --users 50 --duration 30
+    python -m benchmarks.load --transport uvicorn --users 50 --duration 30
+    python -m benchmarks.load --mix place=50,cancel=20,get=20,list=10 --output run.json
+
+N simulated users each loop over a weighted mix of place / cancel / get /
+list calls against ``main.app``, either in-process over httpx's ASGI
+transport (no sockets; isolates app cost) or over real sockets against
+uvicorn started in a background thread of this process. Throughput and
+p50/p95/p99/p99.9 latency are reported per endpoint.
+
+The run uses its own database (``--database-url``, recreated each run)
+and funds the simulated users directly in the in-memory ledger, so
+numbers are repeatable and ``trading.db`` is untouched: importing
+``main`` does no startup work, the harness warms the app from the load
+database itself, and orders are priced around its last trade. Pointing
+``--database-url`` at the app's database is refused unless ``--force``.
+Rate limits are lifted for the run unless ``--keep-rate-limits`` is
+given.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from database import SQLALCHEMY_DATABASE_URL, get_db, get_session_factory
+from main import app, startup
+from trading.api.auth import create_access_token
+from trading.api.rate_limit import rate_limiter
+from trading.application.ledger import balance_ledger
+from trading.application.market_data import reference_prices
+from trading.domain.balance import Balance
+from trading.domain.user import User
+from trading.infrastructure.password_hashing import password_pool
+from trading.infrastructure.repository import UserRepository
+
+ENDPOINTS = ("place", "cancel", "get", "list")
+DEFAULT_MIX = {"place": 40, "cancel": 20, "get": 25, "list": 15}
+PERCENTILES = (("p50", 50), ("p95", 95), ("p99", 99), ("p999", 99.9))
+
+DEFAULT_DATABASE_URL = "sqlite:///./loadtest.db"
+SYMBOL = "BTC/USDT"
+# Orders are priced around the last trade, or this with no trades stored
+DEFAULT_PRICE = Decimal("100")
+PRICE_TICK = Decimal("0.01")
+STARTING_BALANCES = (("USDT", Decimal("1000000000")), ("BTC", Decimal("1000000")))
+
+
+@dataclass
+class LoadConfig:
+    users: int = 10
+    duration: float = 10.0
+    warmup: float = 1.0
+    max_requests: Optional[int] = None
+    mix: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    seed: int = 1
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    """``place=40,cancel=20`` -> weights; unknown endpoints are an error"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{name}', expected one of {ENDPOINTS}")
+        mix[name] = int(weight)
+    if not any(mix.values()):
+        raise ValueError("Mix needs at least one endpoint with a positive weight")
+    return mix
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(len(ordered) * q / 100))
+    return ordered[min(len(ordered), rank) - 1]
+
+
+class LatencyRecorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.total = 0
+
+    def record(self, endpoint: str, seconds: float, status: int):
+        self.latencies[endpoint].append(seconds)
+        self.statuses[endpoint][status] += 1
+        self.total += 1
+
+    def summary(self, elapsed: float) -> Dict[str, dict]:
+        report = {}
+        for endpoint in ENDPOINTS:
+            values = sorted(self.latencies.get(endpoint, []))
+            if not values:
+                continue
+            statuses = self.statuses[endpoint]
+            entry = {
+                "requests": len(values),
+                "errors": sum(c for s, c in statuses.items() if s >= 400),
+                "rps": len(values) / elapsed if elapsed else 0.0,
+                "statuses": {str(s): c for s, c in sorted(statuses.items())},
+            }
+            for label, q in PERCENTILES:
+                entry[f"{label}_ms"] = percentile(values, q) * 1000
+            entry["max_ms"] = values[-1] * 1000
+            report[endpoint] = entry
+        return report
+
+
+class SimulatedUser:
+    def __init__(
+        self,
+        username: str,
+        token: str,
+        rng: random.Random,
+        base_price: Decimal = DEFAULT_PRICE,
+    ):
+        self.username = username
+        self.base_price = base_price
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.rng = rng
+        self.open_orders: List[str] = []
+
+    def choose(self, endpoints: List[str], weights: List[int]) -> str:
+        endpoint = self.rng.choices(endpoints, weights)[0]
+        # Nothing to cancel or look up yet: place one first
+        if endpoint in ("cancel", "get") and not self.open_orders:
+            return "place"
+        return endpoint
+
+    async def call(self, client: httpx.AsyncClient, endpoint: str) -> int:
+        params = {"user_id": self.username}
+        if endpoint == "place":
+            resp = await client.post(
+                "/api/orders/", json=self._order_payload(), headers=self.headers
+            )
+            if resp.status_code == 201:
+                self.open_orders.append(resp.json()["order_id"])
+        elif endpoint == "cancel":
+            order_id = self.open_orders.pop(self.rng.randrange(len(self.open_orders)))
+            resp = await client.delete(
+                f"/api/orders/{order_id}", params=params, headers=self.headers
+            )
+        elif endpoint == "get":
+            order_id = self.rng.choice(self.open_orders)
+            resp = await client.get(
+                f"/api/orders/{order_id}", params=params, headers=self.headers
+            )
+        else:
+            resp = await client.get("/api/orders/", params=params, headers=self.headers)
+        return resp.status_code
+
+    def _order_payload(self) -> dict:
+        return {
+            "user_id": self.username,
+            "symbol": SYMBOL,
+            "side": self.rng.choice(("BUY", "SELL")),
+            "order_type": "LIMIT",
+            # Within ±5%, well inside the 10% price band
+            "price": str(
+                (self.base_price * (95 + self.rng.randint(0, 10)) / 100).quantize(
+                    PRICE_TICK
+                )
+            ),
+            "quantity": str(Decimal("0.01") * self.rng.randint(1, 10)),
+        }
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    users: List[SimulatedUser],
+    config: LoadConfig,
+    duration: float,
+    recorder: LatencyRecorder,
+) -> float:
+    """Run every user until ``duration`` passes or the request cap is hit"""
+    endpoints = [e for e in ENDPOINTS if config.mix.get(e)]
+    weights = [config.mix[e] for e in endpoints]
+    deadline = time.perf_counter() + duration
+    issued = 0
+
+    async def user_loop(user: SimulatedUser):
+        nonlocal issued
+        while time.perf_counter() < deadline:
+            # Counted when issued, so concurrent users cannot overshoot the cap
+            if config.max_requests and issued >= config.max_requests:
+                return
+            issued += 1
+            endpoint = user.choose(endpoints, weights)
+            start = time.perf_counter()
+            try:
+                status = await user.call(client, endpoint)
+            except httpx.HTTPError:
+                status = 599  # transport failure, counted as an error
+            recorder.record(endpoint, time.perf_counter() - start, status)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(user_loop(user) for user in users))
+    return time.perf_counter() - start
+
+
+def sqlite_path(database_url: str) -> Optional[str]:
+    """Absolute file path of a file-backed SQLite URL, else None"""
+    if database_url.startswith("sqlite:///") and ":memory:" not in database_url:
+        return os.path.abspath(database_url[len("sqlite:///") :])
+    return None
+
+
+def prepare_database(database_url: str, force: bool = False) -> Callable[[], Session]:
+    """Fresh database on its own engine, wired into the app's dependencies.
+
+    The SQLite file is deleted first, so the app's own database is refused
+    unless ``force`` is given.
+    """
+    path = sqlite_path(database_url)
+    if not force and (
+        database_url == SQLALCHEMY_DATABASE_URL
+        or (path is not None and path == sqlite_path(SQLALCHEMY_DATABASE_URL))
+    ):
+        raise ValueError(
+            f"{database_url} is the application database; pass --force to "
+            "recreate it for a load run"
+        )
+    if path is not None and os.path.exists(path):
+        os.remove(path)
+
+    engine = create_engine(database_url, connect_args={"check_same_thread": False})
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    # The app's lifespan is not run here; warm from the load database instead
+    startup(session_factory)
+    return session_factory
+
+
+def base_price() -> Decimal:
+    """Last traded price of the load symbol, as seeded at startup"""
+    reference = reference_prices.get(SYMBOL)
+    return reference.price if reference is not None else DEFAULT_PRICE
+
+
+def prepare_users(
+    session_factory: Callable[[], Session], config: LoadConfig
+) -> List[SimulatedUser]:
+    """Create, fund and issue tokens for the simulated users.
+
+    Tokens are minted directly: logging in would only measure Argon2.
+    """
+    hashed = password_pool.hash_blocking("load-test")
+    db = session_factory()
+    try:
+        repo = UserRepository(db)
+        usernames = [f"load-user-{i:04d}" for i in range(config.users)]
+        for username in usernames:
+            if repo.find_by_username(username) is None:
+                repo.save(User.create(username, hashed))
+        db.commit()
+    finally:
+        db.close()
+
+    price = base_price()
+    users = []
+    for i, username in enumerate(usernames):
+        balance_ledger.load(
+            username,
+            [Balance(currency, amount) for currency, amount in STARTING_BALANCES],
+        )
+        token = create_access_token({"sub": username})
+        users.append(
+            SimulatedUser(
+                username, token, random.Random(config.seed * 100003 + i), price
+            )
+        )
+    return users
+
+
+async def run_load(client: httpx.AsyncClient, users, config: LoadConfig) -> dict:
+    if config.warmup:
+        await drive(client, users, config, config.warmup, LatencyRecorder())
+
+    recorder = LatencyRecorder()
+    elapsed = await drive(client, users, config, config.duration, recorder)
+    return {
+        "elapsed_s": elapsed,
+        "requests": recorder.total,
+        "rps": recorder.total / elapsed if elapsed else 0.0,
+        "endpoints": recorder.summary(elapsed),
+    }
+
+
+async def run_asgi(users, config: LoadConfig) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://loadtest"
+    ) as client:
+        return await run_load(client, users, config)
+
+
+def start_uvicorn(host: str = "127.0.0.1") -> Tuple[object, threading.Thread, int]:
+    """uvicorn serving ``main.app`` from a background thread on a free port"""
+    import uvicorn
+
+    with socket.socket() as probe:
+        probe.bind((host, 0))
+        port = probe.getsockname()[1]
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host=host, port=port, log_level="warning", lifespan="off")
+    )
+    thread = threading.Thread(target=server.run, name="uvicorn", daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("uvicorn failed to start")
+        time.sleep(0.01)
+    return server, thread, port
+
+
+async def run_uvicorn(users, config: LoadConfig) -> dict:
+    server, thread, port = start_uvicorn()
+    try:
+        limits = httpx.Limits(max_connections=config.users)
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits
+        ) as client:
+            return await run_load(client, users, config)
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+def format_report(report: dict) -> str:
+    header = (
+        f"{'endpoint':<8} {'reqs':>8} {'err':>6} {'rps':>9} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'p999 ms':>8} {'max ms':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for endpoint, e in report["endpoints"].items():
+        lines.append(
+            f"{endpoint:<8} {e['requests']:>8} {e['errors']:>6} {e['rps']:>9.1f} "
+            f"{e['p50_ms']:>8.2f} {e['p95_ms']:>8.2f} {e['p99_ms']:>8.2f} "
+            f"{e['p999_ms']:>8.2f} {e['max_ms']:>8.2f}"
+        )
+    lines.append(
+        f"\n{report['requests']} requests in {report['elapsed_s']:.1f}s "
+        f"= {report['rps']:.1f} req/s ({report['transport']}, {report['users']} users)"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--transport", choices=("asgi", "uvicorn"), default="asgi")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--warmup", type=float, default=1.0, help="seconds, unrecorded")
+    parser.add_argument("--requests", type=int, help="stop after this many requests")
+    parser.add_argument("--mix", type=parse_mix, default=dict(DEFAULT_MIX))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument(
+        "--force", action="store_true", help="allow recreating the app's database"
+    )
+    parser.add_argument("--keep-rate-limits", action="store_true")
+    parser.add_argument("--output", help="write the report as JSON to this file")
+    args = parser.parse_args(argv)
+
+    config = LoadConfig(
+        users=args.users,
+        duration=args.duration,
+        warmup=args.warmup,
+        max_requests=args.requests,
+        mix=args.mix,
+        seed=args.seed,
+    )
+
+    try:
+        session_factory = prepare_database(args.database_url, args.force)
+    except ValueError as e:
+        parser.error(str(e))
+    if not args.keep_rate_limits:
+        rate_limiter.limits.clear()
+    users = prepare_users(session_factory, config)
+
+    runner = run_asgi if args.transport == "asgi" else run_uvicorn
+    try:
+        report = asyncio.run(runner(users, config))
+    finally:
+        app.dependency_overrides.clear()
+        password_pool.shutdown()
+
+    report.update(transport=args.transport, users=config.users, mix=config.mix)
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
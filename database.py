@@ -1,12 +1,21 @@
+import os
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from trading.infrastructure.query_log import slow_query_log
+
 SQLALCHEMY_DATABASE_URL = "sqlite:///./trading.db"
 
+# Full statement echo is for local debugging only (SQL_ECHO=1); statements
+# over SLOW_QUERY_MS are logged with attribution by the slow-query log
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, echo=True
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    echo=os.getenv("SQL_ECHO") == "1",
 )
+slow_query_log.install(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -19,3 +28,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_session_factory():
+    """Session factory for responses that outlive the request, e.g. streams"""
+    return SessionLocal
@@ -1,17 +1,81 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import Callable
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from database import engine, Base
+from sqlalchemy.orm import Session
+
+from database import Base, get_session_factory
 from trading.api.routes import router as orders_router
 from trading.api.auth_routes import router as auth_router  # ← Tambah import
+from trading.api.trade_routes import router as trades_router
+from trading.api.market_routes import router as markets_router
+from trading.api.balance_routes import router as balances_router
+from trading.api.pair_routes import router as pairs_router
+from trading.api.user_routes import router as users_router
+from trading.api.api_key_routes import router as api_keys_router
+from trading.api.order_stream import router as order_stream_router
+from trading.api.profiler_routes import router as profiler_router
+from trading.api.query_budgets import QueryBudgetMiddleware
+from trading.api.rate_limit import RateLimitMiddleware
+from trading.api.request_metrics import RequestMetricsMiddleware
+from trading.api.server_timing import ServerTimingMiddleware
+from trading.api.token_cache import token_cache
+from trading.application.users import bootstrap_admin, user_cache
+from trading.application.market_data import warm_market_data
+from trading.application.market_stream import load_depth_books
+from trading.infrastructure.metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    metrics,
+    register_pool_metrics,
+)
+from trading.infrastructure.password_hashing import password_pool
+
+
+def startup(session_factory: Callable[[], Session]):
+    """Schema, first admin and warm in-memory state for one database"""
+    db = session_factory()
+    try:
+        bind = db.get_bind()
+    finally:
+        db.close()
+    Base.metadata.create_all(bind=bind)
+    bootstrap_admin(session_factory)
+    load_depth_books(session_factory)
+    warm_market_data(session_factory)
+    register_pool_metrics(bind)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Importing the app touches no database; tests and benchmarks override
+    # the session factory and are warmed from their own
+    factory = app.dependency_overrides.get(get_session_factory, get_session_factory)
+    startup(factory())
+    yield
 
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="Trading Platform API",
     description="RESTful API untuk trading cryptocurrency dengan DDD",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# SQL statement / row budgets per route (QUERY_BUDGET_MODE)
+app.add_middleware(QueryBudgetMiddleware)
+
+# Per-request stage breakdown in the Server-Timing header
+app.add_middleware(ServerTimingMiddleware)
+
+# Latency is labelled by the matched route; requests refused by the rate
+# limiter never reach a route and are not timed
+app.add_middleware(RequestMetricsMiddleware)
+
+# Over-budget clients get a 429 before routing, auth or the DB session;
+# registered before CORS so rejections still carry CORS headers
+app.add_middleware(RateLimitMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -22,6 +86,14 @@ app.add_middleware(
 
 app.include_router(auth_router)  # ← Register auth router
 app.include_router(orders_router)  # ← Register orders router
+app.include_router(trades_router)
+app.include_router(markets_router)
+app.include_router(balances_router)
+app.include_router(pairs_router)
+app.include_router(users_router)
+app.include_router(api_keys_router)
+app.include_router(order_stream_router)
+app.include_router(profiler_router)
 
 
 @app.get("/")
@@ -31,7 +103,18 @@ def root():
 
 @app.get("/health")
 def health():
-    return {"status": "healthy", "database": "connected"}
+    return {
+        "status": "healthy",
+        "database": "connected",
+        "password_pool": password_pool.stats(),
+        "token_cache": token_cache.stats(),
+        "user_cache": user_cache.stats(),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics_endpoint():
+    return Response(metrics.render(), media_type=METRICS_CONTENT_TYPE)
 
 
 if __name__ == "__main__":
@@ -4,16 +4,30 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
 import pytest
+from decimal import Decimal
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from main import app
-from database import Base, get_db
+from database import Base, get_db, get_session_factory
 
 # Import models agar tabel ter-register
 from trading.infrastructure import models
+from trading.application import market_data
+from trading.application.fee_service import fee_engine
+from trading.application.ledger import balance_ledger
+from trading.application.pairs import pair_registry
+from trading.api.rate_limit import rate_limiter
+from trading.api.token_cache import token_cache
+from trading.application.users import bootstrap_admin, user_cache
+from trading.application.api_keys import api_key_index, replay_guard
+from trading.application.order_events import order_events
+from trading.application.market_stream import clear_market_stream
+from trading.infrastructure.metrics import metrics
+from trading.infrastructure.query_budget import MODE_RAISE, query_budgets
+from trading.domain.balance import Balance
 
 # In-memory test database
 TEST_DATABASE_URL = "sqlite:///:memory:"
@@ -23,6 +37,9 @@ test_engine = create_engine(
     poolclass=StaticPool,  # Use StaticPool to ensure single connection for :memory: database
     echo=True,  # ✅ Debug: print semua SQL query
 )
+# Over-budget requests fail the test that issued them
+query_budgets.mode = MODE_RAISE
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
 
@@ -47,6 +64,33 @@ def setup_database():
 def client(setup_database):
     """Test client dengan dependency override"""
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
+    bootstrap_admin(TestingSessionLocal, "LeonArif", "password123")
+    # Fund the test user so order placement passes the pre-trade balance check
+    balance_ledger.load(
+        "LeonArif",
+        [Balance("USDT", Decimal("100000000")), Balance("BTC", Decimal("1000"))],
+    )
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_in_memory_state():
+    """In-memory caches are process-wide; start every test from a clean slate"""
+    market_data.candle_aggregator.clear()
+    market_data.ticker_book.clear()
+    market_data.reference_prices.clear()
+    balance_ledger.clear()
+    fee_engine.clear()
+    pair_registry.clear()
+    rate_limiter.clear()
+    token_cache.clear()
+    user_cache.clear()
+    api_key_index.clear()
+    replay_guard.clear()
+    order_events.clear()
+    clear_market_stream()
+    metrics.clear()
+    yield
@@ -0,0 +1,187 @@
+"""Tests for API-key + HMAC request signing"""
+
+import json
+import time
+import uuid
+
+from trading.application.api_keys import ApiKeyService
+from trading.domain.api_key import ApiKey, ApiKeyIndex, ReplayGuard, sign_request
+
+
+def get_token(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return resp.json()["access_token"]
+
+
+def create_key(client):
+    headers = {"Authorization": f"Bearer {get_token(client)}"}
+    resp = client.post("/api/keys/", headers=headers)
+    assert resp.status_code == 201
+    return resp.json()
+
+
+def signed_headers(key, method, path, body=b"", timestamp=None, nonce=None):
+    timestamp = str(timestamp or int(time.time() * 1000))
+    nonce = nonce or uuid.uuid4().hex
+    return {
+        "X-API-Key": key["key_id"],
+        "X-API-Timestamp": timestamp,
+        "X-API-Nonce": nonce,
+        "X-API-Signature": sign_request(
+            key["secret"].encode(), timestamp, nonce, method, path, body
+        ),
+        "Content-Type": "application/json",
+    }
+
+
+# ============= Signing Tests =============
+
+
+def test_signature_covers_every_part():
+    key = ApiKey.create("alice")
+    sig = key.signature("1", "n", "POST", "/api/orders/", b"{}")
+
+    assert key.verify(sig, "1", "n", "POST", "/api/orders/", b"{}")
+    assert not key.verify(sig, "2", "n", "POST", "/api/orders/", b"{}")
+    assert not key.verify(sig, "1", "m", "POST", "/api/orders/", b"{}")
+    assert not key.verify(sig, "1", "n", "GET", "/api/orders/", b"{}")
+    assert not key.verify(sig, "1", "n", "POST", "/api/orders/?x=1", b"{}")
+    assert not key.verify(sig, "1", "n", "POST", "/api/orders/", b"{ }")
+
+
+def test_replay_guard_window_and_nonce():
+    guard = ReplayGuard(window_seconds=30)
+
+    assert guard.check("AK-1", "n1", 1_000_000, 1_000_000)
+    assert not guard.check("AK-1", "n1", 1_000_000, 1_000_500)
+    assert guard.check("AK-2", "n1", 1_000_000, 1_000_500)
+    assert not guard.check("AK-1", "n2", 1_000_000, 1_031_000)
+
+
+def test_replay_guard_forgets_expired_nonces():
+    guard = ReplayGuard(window_seconds=1)
+    guard.check("AK-1", "n1", 0, 0)
+    guard.check("AK-1", "n2", 5_000, 5_000)
+
+    assert ("AK-1", "n1") not in guard._seen
+
+
+def test_index_entries_expire():
+    index = ApiKeyIndex(ttl_seconds=60)
+    key = ApiKey.create("alice")
+    index.put(key, now=100.0)
+
+    assert index.get(key.key_id, now=159.0) is key
+    assert index.get(key.key_id, now=160.0) is None
+    # Expired entries are dropped, not kept around
+    assert index.get(key.key_id, now=100.0) is None
+
+
+def test_index_ignores_revoked_keys():
+    index = ApiKeyIndex()
+    key = ApiKey.create("alice")
+    key.revoke()
+    index.put(key)
+
+    assert index.get(key.key_id) is None
+
+
+# ============= API Tests =============
+
+
+def test_signed_request_places_order(client):
+    key = create_key(client)
+    body = json.dumps(
+        {
+            "user_id": "LeonArif",
+            "symbol": "BTC/USDT",
+            "side": "BUY",
+            "order_type": "LIMIT",
+            "quantity": 1,
+            "price": 100,
+        }
+    ).encode()
+
+    headers = signed_headers(key, "POST", "/api/orders/", body)
+    resp = client.post("/api/orders/", content=body, headers=headers)
+    assert resp.status_code == 201
+
+    # Same nonce again is a replay
+    resp = client.post("/api/orders/", content=body, headers=headers)
+    assert resp.status_code == 401
+    assert "replayed" in resp.json()["detail"]
+
+
+def test_signed_get_with_query(client):
+    key = create_key(client)
+    path = "/api/orders/?user_id=LeonArif"
+
+    resp = client.get(path, headers=signed_headers(key, "GET", path))
+    assert resp.status_code == 200
+
+
+def test_tampered_and_stale_requests_rejected(client):
+    key = create_key(client)
+
+    headers = signed_headers(key, "GET", "/api/balances/")
+    headers["X-API-Signature"] = "0" * 64
+    assert client.get("/api/balances/", headers=headers).status_code == 401
+
+    stale = int(time.time() * 1000) - 60_000
+    headers = signed_headers(key, "GET", "/api/balances/", timestamp=stale)
+    assert client.get("/api/balances/", headers=headers).status_code == 401
+
+
+def test_revoked_key_rejected(client):
+    key = create_key(client)
+    path = "/api/balances/"
+    assert client.get(path, headers=signed_headers(key, "GET", path)).status_code == 200
+
+    headers = {"Authorization": f"Bearer {get_token(client)}"}
+    resp = client.delete(f"/api/keys/{key['key_id']}", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["is_active"] is False
+    assert resp.json()["secret"] is None
+
+    resp = client.get(path, headers=signed_headers(key, "GET", path))
+    assert resp.status_code == 401
+
+
+def test_key_revoked_by_another_process_expires(client):
+    from conftest import TestingSessionLocal
+    from trading.application.api_keys import api_key_index
+
+    key = create_key(client)
+    path = "/api/balances/"
+    assert client.get(path, headers=signed_headers(key, "GET", path)).status_code == 200
+
+    # Revoked through a separate index, as another worker would
+    db = TestingSessionLocal()
+    try:
+        ApiKeyService(db, ApiKeyIndex()).revoke("LeonArif", key["key_id"])
+        db.commit()
+    finally:
+        db.close()
+    assert client.get(path, headers=signed_headers(key, "GET", path)).status_code == 200
+
+    # Once the entry is past its TTL the key is re-read from storage
+    later = time.monotonic() + api_key_index.ttl_seconds
+    assert api_key_index.get(key["key_id"], now=later) is None
+    resp = client.get(path, headers=signed_headers(key, "GET", path))
+    assert resp.status_code == 401
+
+
+def test_unknown_key_rejected(client):
+    key = {"key_id": "AK-UNKNOWN", "secret": "x"}
+    path = "/api/balances/"
+    resp = client.get(path, headers=signed_headers(key, "GET", path))
+    assert resp.status_code == 401
+
+
+def test_bearer_token_still_accepted(client):
+    headers = {"Authorization": f"Bearer {get_token(client)}"}
+    assert client.get("/api/balances/", headers=headers).status_code == 200
+    assert client.get("/api/balances/").status_code == 401
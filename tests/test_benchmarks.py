@@ -0,0 +1,55 @@
+"""Tests for the domain microbenchmark harness"""
+
+import json
+
+from benchmarks.domain import BENCHMARKS, Result, compare, main, run
+
+
+def result(name, ops_per_sec):
+    return Result(name, ops_per_sec, 1e9 / ops_per_sec, 1.0, 100.0, 200.0)
+
+
+# ============= Comparison Tests =============
+
+
+def test_compare_flags_only_losses_beyond_tolerance():
+    baseline = {
+        "results": [
+            {"name": "fast", "ops_per_sec": 1000},
+            {"name": "slow", "ops_per_sec": 1000},
+        ]
+    }
+    current = [result("fast", 950), result("slow", 800), result("new", 10)]
+
+    regressions = compare(current, baseline, tolerance=0.10)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slow:")
+    assert "-20.0%" in regressions[0]
+
+
+# ============= Run Tests =============
+
+
+def test_every_benchmark_runs_and_reports_memory():
+    results = run(BENCHMARKS, rounds=1, min_time=0.001, memory_samples=10)
+
+    assert [r.name for r in results] == [b.name for b in BENCHMARKS]
+    for r in results:
+        assert r.ops_per_sec > 0
+        assert r.peak_bytes_per_op >= 0
+    by_name = {r.name: r for r in results}
+    assert by_name["Order.create"].bytes_per_op > 0
+
+
+def test_main_writes_json_and_fails_on_regression(tmp_path):
+    output = tmp_path / "run.json"
+    args = ["--filter", "from_symbol", "--rounds", "1", "--min-time", "0.001"]
+
+    assert main(args + ["--output", str(output)]) == 0
+    data = json.loads(output.read_text())
+    assert data["results"][0]["name"] == "TradingPair.from_symbol"
+
+    data["results"][0]["ops_per_sec"] *= 1000
+    output.write_text(json.dumps(data))
+    assert main(args + ["--baseline", str(output)]) == 1
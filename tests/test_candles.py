@@ -0,0 +1,435 @@
+"""Tests for incremental OHLCV candle aggregation"""
+
+from decimal import Decimal
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from trading.application import market_data
+from trading.application.dto import RecordTradesRequest, TradeFillRequest
+from trading.application.ledger import LedgerService
+from trading.application.record_trades import RecordTradesUseCase
+from trading.domain.balance import order_reservation
+from trading.domain.candle import Candle, CandleAggregator, CandleInterval
+from trading.domain.exceptions import InvalidTradeException
+from trading.domain.order import Order
+from trading.domain.ticker import TickerBook
+from trading.domain.value_objects import OrderSide, OrderStatus
+from trading.infrastructure import models  # Import to register models
+from trading.infrastructure.repository import CandleRepository, OrderRepository
+
+
+TEST_DATABASE_URL = "sqlite:///:memory:"
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+T0 = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=test_engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=test_engine)
+
+
+def get_token(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return resp.json()["access_token"]
+
+
+def open_order(repo, user_id, side, price="100", quantity="10", symbol="BTC/USDT"):
+    order = Order.place_limit_order(
+        user_id, symbol, side, Decimal(price), Decimal(quantity)
+    )
+    order.open()
+    repo.save(order)
+
+    # Hold funds the way PlaceOrderUseCase does so the fill can settle
+    ledger = LedgerService(repo.db)
+    held = order_reservation(order)
+    ledger.adjust(user_id, held.currency, held.amount)
+    ledger.lock(user_id, held)
+    return order
+
+
+# ============= Interval Tests =============
+def test_interval_bucket_start():
+    ts = datetime(2024, 1, 1, 12, 7, 42, tzinfo=timezone.utc)
+
+    assert CandleInterval.ONE_MINUTE.bucket_start(ts) == T0 + timedelta(minutes=7)
+    assert CandleInterval.FIVE_MINUTES.bucket_start(ts) == T0 + timedelta(minutes=5)
+    assert CandleInterval.ONE_HOUR.bucket_start(ts) == T0
+    assert CandleInterval.ONE_DAY.bucket_start(ts) == T0 - timedelta(hours=12)
+
+
+def test_interval_bucket_start_naive_is_utc():
+    ts = datetime(2024, 1, 1, 12, 7, 42)
+    assert CandleInterval.ONE_HOUR.bucket_start(ts) == T0
+
+
+# ============= Aggregator Tests =============
+def test_aggregator_builds_ohlcv():
+    aggregator = CandleAggregator()
+    for seconds, price in [(0, "100"), (10, "105"), (20, "95"), (30, "101")]:
+        aggregator.apply_trade(
+            "BTC/USDT", Decimal(price), Decimal("2"), T0 + timedelta(seconds=seconds)
+        )
+
+    candle = aggregator.current("BTC/USDT", CandleInterval.ONE_MINUTE)
+    assert (candle.open, candle.high, candle.low, candle.close) == (
+        Decimal("100"),
+        Decimal("105"),
+        Decimal("95"),
+        Decimal("101"),
+    )
+    assert candle.volume == Decimal("8")
+    assert candle.quote_volume == Decimal("802")
+    assert candle.trade_count == 4
+
+
+def test_aggregator_rolls_up_higher_intervals():
+    aggregator = CandleAggregator()
+    aggregator.apply_trade("BTC/USDT", Decimal("100"), Decimal("1"), T0)
+    aggregator.apply_trade(
+        "BTC/USDT", Decimal("120"), Decimal("1"), T0 + timedelta(minutes=3)
+    )
+    aggregator.apply_trade(
+        "BTC/USDT", Decimal("90"), Decimal("1"), T0 + timedelta(minutes=7)
+    )
+
+    five = aggregator.current("BTC/USDT", CandleInterval.FIVE_MINUTES)
+    assert five.open_time == T0 + timedelta(minutes=5)
+    assert five.open == Decimal("90")
+    assert five.trade_count == 1
+
+    hour = aggregator.current("BTC/USDT", CandleInterval.ONE_HOUR)
+    assert hour.open == Decimal("100")
+    assert hour.high == Decimal("120")
+    assert hour.low == Decimal("90")
+    assert hour.close == Decimal("90")
+    assert hour.volume == Decimal("3")
+
+
+def test_aggregator_late_trade_keeps_close():
+    aggregator = CandleAggregator()
+    aggregator.apply_trade("BTC/USDT", Decimal("100"), Decimal("1"), T0)
+    aggregator.apply_trade(
+        "BTC/USDT", Decimal("110"), Decimal("1"), T0 + timedelta(seconds=30)
+    )
+    aggregator.apply_trade(
+        "BTC/USDT", Decimal("80"), Decimal("1"), T0 + timedelta(seconds=10)
+    )
+
+    candle = aggregator.current("BTC/USDT", CandleInterval.ONE_MINUTE)
+    assert candle.close == Decimal("110")
+    assert candle.low == Decimal("80")
+
+
+def test_aggregator_uses_loader_for_uncached_bucket():
+    stored = Candle(
+        "BTC/USDT",
+        CandleInterval.ONE_MINUTE,
+        T0,
+        Decimal("100"),
+        Decimal("150"),
+        Decimal("100"),
+        Decimal("120"),
+        volume=Decimal("5"),
+        trade_count=5,
+        last_trade_at=T0,
+    )
+    calls = []
+
+    def loader(symbol, interval, open_time):
+        calls.append(interval)
+        return stored if interval == CandleInterval.ONE_MINUTE else None
+
+    aggregator = CandleAggregator()
+    touched = aggregator.apply_trade(
+        "BTC/USDT", Decimal("130"), Decimal("1"), T0 + timedelta(seconds=5), loader
+    )
+
+    assert touched[0] is stored
+    assert stored.volume == Decimal("6")
+    assert stored.high == Decimal("150")
+    assert len(calls) == 4
+
+    # Cached now, no more loader calls for the same buckets
+    aggregator.apply_trade(
+        "BTC/USDT", Decimal("130"), Decimal("1"), T0 + timedelta(seconds=6), loader
+    )
+    assert len(calls) == 4
+
+
+def test_staged_trade_leaves_cache_until_installed():
+    aggregator = CandleAggregator()
+    aggregator.apply_trade("BTC/USDT", Decimal("100"), Decimal("1"), T0)
+    cached = aggregator.current("BTC/USDT", CandleInterval.ONE_MINUTE)
+
+    staged = {}
+    aggregator.stage_trade(
+        staged, "BTC/USDT", Decimal("120"), Decimal("2"), T0 + timedelta(seconds=5)
+    )
+
+    assert aggregator.current("BTC/USDT", CandleInterval.ONE_MINUTE) is cached
+    assert cached.volume == Decimal("1")
+    assert len(staged) == len(CandleInterval)
+
+    aggregator.install(staged.values())
+    current = aggregator.current("BTC/USDT", CandleInterval.ONE_MINUTE)
+    assert current.volume == Decimal("3")
+    assert current.high == Decimal("120")
+
+
+def test_install_keeps_newer_cached_bucket():
+    aggregator = CandleAggregator()
+    aggregator.apply_trade(
+        "BTC/USDT", Decimal("100"), Decimal("1"), T0 + timedelta(minutes=1)
+    )
+    older = Candle.start("BTC/USDT", CandleInterval.ONE_MINUTE, T0, Decimal("90"))
+
+    aggregator.install([older])
+
+    current = aggregator.current("BTC/USDT", CandleInterval.ONE_MINUTE)
+    assert current.open_time == T0 + timedelta(minutes=1)
+
+
+# ============= Record Trades Tests =============
+def test_record_trades_fills_orders_and_persists_candles(db_session):
+    order_repo = OrderRepository(db_session)
+    buy = open_order(order_repo, "alice", OrderSide.BUY, price="110")
+    sell = open_order(order_repo, "bob", OrderSide.SELL)
+    db_session.commit()
+
+    use_case = RecordTradesUseCase(db_session, candles=CandleAggregator())
+    result = use_case.execute(
+        RecordTradesRequest(
+            fills=[
+                TradeFillRequest(
+                    buy_order_id=buy.order_id,
+                    sell_order_id=sell.order_id,
+                    price=Decimal("100"),
+                    quantity=Decimal("4"),
+                    executed_at=T0,
+                ),
+                TradeFillRequest(
+                    buy_order_id=buy.order_id,
+                    sell_order_id=sell.order_id,
+                    price=Decimal("101"),
+                    quantity=Decimal("6"),
+                    executed_at=T0 + timedelta(seconds=1),
+                ),
+            ]
+        )
+    )
+    db_session.commit()
+
+    assert len(result) == 2
+    assert result[0].buyer_user_id == "alice"
+    assert order_repo.find_by_id(buy.order_id).status == OrderStatus.FILLED
+    assert order_repo.find_by_id(sell.order_id).status == OrderStatus.FILLED
+
+    candle_repo = CandleRepository(db_session)
+    for interval in CandleInterval:
+        candles = candle_repo.find_recent("BTC/USDT", interval, 10)
+        assert len(candles) == 1
+        assert candles[0].volume == Decimal("10")
+        assert candles[0].close == Decimal("101")
+
+
+def test_record_trades_rejects_same_side(db_session):
+    order_repo = OrderRepository(db_session)
+    first = open_order(order_repo, "alice", OrderSide.BUY)
+    second = open_order(order_repo, "bob", OrderSide.BUY)
+    db_session.commit()
+
+    use_case = RecordTradesUseCase(db_session, candles=CandleAggregator())
+    with pytest.raises(InvalidTradeException):
+        use_case.execute(
+            RecordTradesRequest(
+                fills=[
+                    TradeFillRequest(
+                        buy_order_id=first.order_id,
+                        sell_order_id=second.order_id,
+                        price=Decimal("100"),
+                        quantity=Decimal("1"),
+                    )
+                ]
+            )
+        )
+
+
+def test_rolled_back_batch_leaves_market_data_untouched(db_session):
+    order_repo = OrderRepository(db_session)
+    buy = open_order(order_repo, "alice", OrderSide.BUY)
+    sell = open_order(order_repo, "bob", OrderSide.SELL)
+    db_session.commit()
+
+    candles, tickers = CandleAggregator(), TickerBook()
+    RecordTradesUseCase(db_session, candles=candles, tickers=tickers).execute(
+        RecordTradesRequest(
+            fills=[
+                TradeFillRequest(
+                    buy_order_id=buy.order_id,
+                    sell_order_id=sell.order_id,
+                    price=Decimal("100"),
+                    quantity=Decimal("1"),
+                    executed_at=T0,
+                )
+            ]
+        )
+    )
+    assert candles.current("BTC/USDT", CandleInterval.ONE_MINUTE) is None
+    db_session.rollback()
+
+    assert candles.current("BTC/USDT", CandleInterval.ONE_MINUTE) is None
+    assert tickers.snapshot("BTC/USDT", T0) is None
+
+
+def test_warm_market_data_seeds_caches_from_storage(db_session):
+    order_repo = OrderRepository(db_session)
+    buy = open_order(order_repo, "alice", OrderSide.BUY)
+    sell = open_order(order_repo, "bob", OrderSide.SELL)
+    db_session.commit()
+
+    executed_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+    RecordTradesUseCase(db_session, candles=CandleAggregator()).execute(
+        RecordTradesRequest(
+            fills=[
+                TradeFillRequest(
+                    buy_order_id=buy.order_id,
+                    sell_order_id=sell.order_id,
+                    price=Decimal("100"),
+                    quantity=Decimal("3"),
+                    executed_at=executed_at,
+                )
+            ]
+        )
+    )
+    db_session.commit()
+    # A restarted process starts with nothing cached
+    market_data.candle_aggregator.clear()
+    market_data.ticker_book.clear()
+    market_data.reference_prices.clear()
+
+    market_data.warm_market_data(TestingSessionLocal)
+
+    candle = market_data.candle_aggregator.current(
+        "BTC/USDT", CandleInterval.ONE_MINUTE
+    )
+    assert candle.volume == Decimal("3")
+    assert market_data.reference_prices.get("BTC/USDT").price == Decimal("100")
+    ticker = market_data.ticker_book.snapshot("BTC/USDT", datetime.now(timezone.utc))
+    assert ticker.trade_count == 1
+    assert ticker.volume == Decimal("3")
+
+
+# ============= Candle Endpoint Tests =============
+def test_get_candles_endpoint(client):
+    from conftest import TestingSessionLocal as ApiSessionLocal
+
+    db = ApiSessionLocal()
+    order_repo = OrderRepository(db)
+    buy = open_order(order_repo, "alice", OrderSide.BUY)
+    sell = open_order(order_repo, "bob", OrderSide.SELL)
+    db.commit()
+    RecordTradesUseCase(db).execute(
+        RecordTradesRequest(
+            fills=[
+                TradeFillRequest(
+                    buy_order_id=buy.order_id,
+                    sell_order_id=sell.order_id,
+                    price=Decimal("100"),
+                    quantity=Decimal("1"),
+                    executed_at=T0,
+                )
+            ]
+        )
+    )
+    db.commit()
+    db.close()
+
+    resp = client.get("/api/markets/BTC-USDT/candles?interval=5m")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["symbol"] == "BTC/USDT"
+    assert body["interval"] == "5m"
+    assert len(body["candles"]) == 1
+    assert Decimal(body["candles"][0]["close"]) == Decimal("100")
+
+
+def test_get_candles_invalid_interval(client):
+    resp = client.get("/api/markets/BTC-USDT/candles?interval=3m")
+    assert resp.status_code == 422
+
+
+def test_get_candles_invalid_symbol(client):
+    resp = client.get("/api/markets/BTCUSDT/candles")
+    assert resp.status_code == 400
+
+
+def test_get_candles_unlisted_symbol(client):
+    resp = client.get("/api/markets/DOGE-USDT/candles")
+    assert resp.status_code == 404
+
+
+# ============= Record Trades Endpoint Tests =============
+
+
+def test_admin_records_trade_between_resting_orders(client):
+    headers = {"Authorization": f"Bearer {get_token(client)}"}
+    base = {"user_id": "LeonArif", "symbol": "BTC/USDT", "order_type": "LIMIT"}
+    buy = client.post(
+        "/api/orders/",
+        json={**base, "side": "BUY", "price": 100, "quantity": 1},
+        headers=headers,
+    ).json()
+    sell = client.post(
+        "/api/orders/",
+        json={**base, "side": "SELL", "price": 100, "quantity": 1},
+        headers=headers,
+    ).json()
+    fill = {
+        "buy_order_id": buy["order_id"],
+        "sell_order_id": sell["order_id"],
+        "price": "100",
+        "quantity": "1",
+    }
+
+    resp = client.post("/api/trades/", json={"fills": [fill]}, headers=headers)
+
+    assert resp.status_code == 201
+    assert Decimal(resp.json()[0]["quantity"]) == Decimal("1")
+    order = client.get(
+        f"/api/orders/{buy['order_id']}?user_id=LeonArif", headers=headers
+    ).json()
+    assert order["status"] == "FILLED"
+    candles = client.get("/api/markets/BTC-USDT/candles?interval=1m").json()
+    assert Decimal(candles["candles"][-1]["volume"]) == Decimal("1")
+
+    # The orders are filled now; recording the fill again is rejected
+    resp = client.post("/api/trades/", json={"fills": [fill]}, headers=headers)
+    assert resp.status_code == 400
+
+
+def test_record_trades_requires_admin(client):
+    fill = {
+        "buy_order_id": "ORD-1",
+        "sell_order_id": "ORD-2",
+        "price": "100",
+        "quantity": "1",
+    }
+    assert client.post("/api/trades/", json={"fills": [fill]}).status_code == 401
@@ -0,0 +1,123 @@
+"""Tests for ETag / If-None-Match on order detail and listings"""
+
+from trading.api.conditional import etag_matches, make_etag
+
+
+def auth_headers(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def place_order(client, headers, symbol="BTC/USDT"):
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": symbol,
+        "side": "BUY",
+        "order_type": "LIMIT",
+        "quantity": 1,
+        "price": 100,
+    }
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 201
+    return resp.json()["order_id"]
+
+
+# ============= ETag Helper Tests =============
+
+
+def test_etag_matching_is_weak_and_accepts_lists():
+    etag = make_etag("v1")
+
+    assert etag.startswith('W/"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(etag.removeprefix("W/"), etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(make_etag("v2"), etag)
+
+
+# ============= Order Detail Tests =============
+
+
+def test_order_detail_revalidates_with_304(client):
+    headers = auth_headers(client)
+    order_id = place_order(client, headers)
+    url = f"/api/orders/{order_id}?user_id=LeonArif"
+
+    first = client.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    second = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+
+def test_order_detail_etag_changes_when_order_changes(client):
+    headers = auth_headers(client)
+    order_id = place_order(client, headers)
+    url = f"/api/orders/{order_id}?user_id=LeonArif"
+    etag = client.get(url, headers=headers).headers["ETag"]
+
+    client.delete(url, headers=headers)
+
+    resp = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "CANCELLED"
+    assert resp.headers["ETag"] != etag
+
+
+def test_conditional_get_still_checks_access(client):
+    headers = auth_headers(client)
+    etag = make_etag("anything")
+
+    resp = client.get(
+        "/api/orders/ORD-MISSING?user_id=LeonArif",
+        headers={**headers, "If-None-Match": "*"},
+    )
+    assert resp.status_code == 404
+
+    resp = client.get(
+        "/api/orders/?user_id=someone_else",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert resp.status_code == 403
+
+
+# ============= Order List Tests =============
+
+
+def test_order_list_etag_tracks_new_orders(client):
+    headers = auth_headers(client)
+    place_order(client, headers)
+    url = "/api/orders/?user_id=LeonArif"
+
+    etag = client.get(url, headers=headers).headers["ETag"]
+    assert (
+        client.get(url, headers={**headers, "If-None-Match": etag}).status_code == 304
+    )
+
+    place_order(client, headers)
+    resp = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["total"] == 2
+
+
+def test_order_list_etag_is_per_symbol(client):
+    headers = auth_headers(client)
+    place_order(client, headers)
+    url = "/api/orders/?user_id=LeonArif&symbol=ETH/USDT"
+
+    etag = client.get(url, headers=headers).headers["ETag"]
+    place_order(client, headers)
+
+    # An order on another symbol leaves this view unchanged
+    assert (
+        client.get(url, headers={**headers, "If-None-Match": etag}).status_code == 304
+    )
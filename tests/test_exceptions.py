@@ -130,9 +130,18 @@ def test_price_out_of_range_exception():
     assert exc.max_price == "100000"
     assert "Price 150000 out of range" in str(exc)
     assert "Allowed range: 10000 - 100000" in str(exc)
+    assert isinstance(exc, InvalidPriceException)
     assert isinstance(exc, TradingDomainException)
 
 
+def test_price_out_of_range_exception_keeps_reason():
+    exc = PriceOutOfRangeException("150000", "10000", "100000", "Outside band")
+    assert str(exc) == (
+        "Price 150000 out of range. Allowed range: 10000 - 100000. Outside band"
+    )
+    assert exc.args == (str(exc),)
+
+
 # ============= Quantity Exceptions =============
 def test_invalid_quantity_exception():
     exc = InvalidQuantityException("0", "Quantity must be positive")
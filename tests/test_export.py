@@ -0,0 +1,139 @@
+"""Tests for NDJSON order and trade history export"""
+
+import gzip
+import json
+from decimal import Decimal
+
+from conftest import TestingSessionLocal
+from trading.application.export_history import encode_ndjson
+from trading.domain.trade import Trade
+from trading.domain.value_objects import Money, TradingPair
+from trading.infrastructure.repository import TradeRepository
+
+
+def get_token(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return resp.json()["access_token"]
+
+
+def place_order(client, headers, symbol="BTC/USDT"):
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": symbol,
+        "side": "BUY",
+        "order_type": "LIMIT",
+        "price": 65000,
+        "quantity": 0.5,
+    }
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 201
+    return resp.json()["order_id"]
+
+
+# ============= Encoder Tests =============
+def test_encode_ndjson_chunks_lines():
+    chunks = list(encode_ndjson(['{"a":1}', '{"a":2}', '{"a":3}'], chunk_size=10))
+
+    assert len(chunks) > 1
+    assert b"".join(chunks) == b'{"a":1}\n{"a":2}\n{"a":3}\n'
+
+
+def test_encode_ndjson_gzip_roundtrip():
+    lines = [json.dumps({"n": i}) for i in range(1000)]
+    body = b"".join(encode_ndjson(lines, gzip=True, chunk_size=256))
+
+    assert gzip.decompress(body).decode().splitlines() == lines
+
+
+def test_encode_ndjson_empty():
+    assert list(encode_ndjson([])) == []
+
+
+# ============= Order Export Tests =============
+def test_export_orders_ndjson(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    ids = {place_order(client, headers) for _ in range(3)}
+
+    resp = client.get("/api/orders/export?user_id=LeonArif", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert {row["order_id"] for row in rows} == ids
+    assert all(row["status"] == "OPEN" for row in rows)
+
+
+def test_export_orders_symbol_filter(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    place_order(client, headers, "BTC/USDT")
+    place_order(client, headers, "ETH/USDT")
+
+    resp = client.get(
+        "/api/orders/export?user_id=LeonArif&symbol=ETH/USDT", headers=headers
+    )
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [row["symbol"] for row in rows] == ["ETH/USDT"]
+
+
+def test_export_orders_gzip(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    place_order(client, headers)
+
+    resp = client.get("/api/orders/export?user_id=LeonArif&gzip=true", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    # httpx transparently decodes the gzip body
+    assert len(resp.text.splitlines()) == 1
+
+
+def test_export_orders_different_user_forbidden(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    resp = client.get("/api/orders/export?user_id=OtherUser", headers=headers)
+    assert resp.status_code == 403
+
+
+# ============= Trade Export Tests =============
+def test_export_trades_ndjson(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    db = TestingSessionLocal()
+    pair = TradingPair("BTC", "USDT")
+    repo = TradeRepository(db)
+    for buyer, seller in [("LeonArif", "bob"), ("bob", "LeonArif"), ("bob", "eve")]:
+        repo.save(
+            Trade.create(
+                trading_pair=pair,
+                buy_order_id="ORD-B",
+                sell_order_id="ORD-S",
+                buyer_user_id=buyer,
+                seller_user_id=seller,
+                price=Money(Decimal("100"), "USDT"),
+                quantity=Decimal("2"),
+            )
+        )
+    db.commit()
+    db.close()
+
+    resp = client.get("/api/trades/export?user_id=LeonArif", headers=headers)
+    assert resp.status_code == 200
+
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(rows) == 2
+    assert Decimal(rows[0]["price"]) == Decimal("100")
+
+
+def test_export_trades_different_user_forbidden(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    resp = client.get("/api/trades/export?user_id=OtherUser", headers=headers)
+    assert resp.status_code == 403
@@ -0,0 +1,166 @@
+"""Tests for the tiered maker/taker fee engine"""
+
+from decimal import Decimal
+from datetime import date, datetime, timedelta, timezone
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from trading.application.fee_service import FeeService
+from trading.domain.fees import (
+    DEFAULT_FEE_SCHEDULE,
+    FeeEngine,
+    FeeSchedule,
+    FeeTier,
+)
+from trading.domain.trade import Trade
+from trading.domain.value_objects import Money, OrderSide, TradingPair
+from trading.infrastructure import models  # Import to register models
+from trading.infrastructure.repository import TradeRepository
+
+
+TEST_DATABASE_URL = "sqlite:///:memory:"
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+SCHEDULE = FeeSchedule(
+    [
+        FeeTier(Decimal("0"), Decimal("0.002"), Decimal("0.004")),
+        FeeTier(Decimal("1000"), Decimal("0.001"), Decimal("0.002")),
+    ]
+)
+
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=test_engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=test_engine)
+
+
+def make_trade(
+    price="100", quantity="1", buyer="alice", seller="bob", executed_at=None
+):
+    return Trade.create(
+        trading_pair=TradingPair("BTC", "USDT"),
+        buy_order_id="ORD-B",
+        sell_order_id="ORD-S",
+        buyer_user_id=buyer,
+        seller_user_id=seller,
+        price=Money(Decimal(price), "USDT"),
+        quantity=Decimal(quantity),
+        executed_at=executed_at,
+    )
+
+
+# ============= Schedule Tests =============
+def test_schedule_tier_lookup():
+    assert DEFAULT_FEE_SCHEDULE.tier_for(Decimal("0")).taker_rate == Decimal("0.0010")
+    assert DEFAULT_FEE_SCHEDULE.tier_for(Decimal("50000")).maker_rate == Decimal(
+        "0.0009"
+    )
+    assert DEFAULT_FEE_SCHEDULE.tier_for(Decimal("99999999")).maker_rate == Decimal(
+        "0.0005"
+    )
+
+
+def test_schedule_requires_zero_tier():
+    with pytest.raises(ValueError):
+        FeeSchedule([FeeTier(Decimal("10"), Decimal("0"), Decimal("0"))])
+
+
+# ============= Engine Tests =============
+def test_assign_fees_taker_buy():
+    engine = FeeEngine(SCHEDULE)
+    trade = make_trade(price="100", quantity="2")
+    engine.assign_fees([trade], [OrderSide.BUY])
+
+    # Buyer is taker, charged in base; seller is maker, charged in quote
+    assert trade.buyer_fee == Decimal("0.008")
+    assert trade.seller_fee == Decimal("0.4")
+
+
+def test_assign_fees_taker_sell():
+    engine = FeeEngine(SCHEDULE)
+    trade = make_trade(price="100", quantity="2")
+    engine.assign_fees([trade], [OrderSide.SELL])
+
+    assert trade.buyer_fee == Decimal("0.004")
+    assert trade.seller_fee == Decimal("0.8")
+
+
+def test_record_promotes_tier_incrementally():
+    engine = FeeEngine(SCHEDULE)
+    engine.record([make_trade(price="600")])
+    assert engine.tier("alice").taker_rate == Decimal("0.004")
+
+    engine.record([make_trade(price="600")])
+    assert engine.volume("alice") == Decimal("1200")
+    assert engine.tier("alice").taker_rate == Decimal("0.002")
+    assert engine.tier("bob").taker_rate == Decimal("0.002")
+
+
+def test_batch_uses_tiers_from_batch_start():
+    engine = FeeEngine(SCHEDULE)
+    trades = [make_trade(price="900"), make_trade(price="900")]
+    engine.assign_fees(trades, [OrderSide.BUY, OrderSide.BUY])
+
+    assert trades[0].buyer_fee == trades[1].buyer_fee == Decimal("0.004")
+
+
+def test_old_volume_expires():
+    engine = FeeEngine(SCHEDULE)
+    today = date(2024, 6, 30)
+    engine.seed("alice", {today - timedelta(days=40): Decimal("5000")})
+    engine.seed("alice", {today: Decimal("1")})  # Ignored, already cached
+
+    assert engine.tier("alice", today=today - timedelta(days=40)) == SCHEDULE.tiers[1]
+    assert engine.tier("alice", today=today) == SCHEDULE.tiers[0]
+    assert engine.volume("alice") == Decimal("0")
+
+
+def test_record_undo():
+    engine = FeeEngine(SCHEDULE)
+    trades = [make_trade(price="5000")]
+    engine.record(trades)
+    engine.record(trades, sign=-1)
+
+    assert engine.volume("alice") == Decimal("0")
+    assert engine.tier("alice") == SCHEDULE.tiers[0]
+
+
+# ============= Fee Service Tests =============
+def test_fee_service_warms_volume_from_history(db_session):
+    repo = TradeRepository(db_session)
+    now = datetime.now(timezone.utc)
+    repo.save(make_trade(price="800", executed_at=now - timedelta(days=1)))
+    repo.save(make_trade(price="400", buyer="carol", seller="alice"))
+    repo.save(make_trade(price="9999", executed_at=now - timedelta(days=45)))
+    db_session.commit()
+
+    engine = FeeEngine(SCHEDULE)
+    trade = make_trade(price="100")
+    FeeService(db_session, engine).apply([trade], [OrderSide.BUY])
+
+    # alice had 1200 of recent volume on both sides: second tier taker rate
+    assert trade.buyer_fee == Decimal("0.002")
+    # bob only had 800: first tier maker rate
+    assert trade.seller_fee == Decimal("0.2")
+    assert engine.volume("alice") == Decimal("1300")
+
+
+def test_fee_service_rollback_takes_back_volume(db_session):
+    engine = FeeEngine(SCHEDULE)
+    FeeService(db_session, engine).apply([make_trade(price="5000")], [OrderSide.BUY])
+    assert engine.volume("alice") == Decimal("5000")
+
+    db_session.rollback()
+    assert engine.volume("alice") == Decimal("0")
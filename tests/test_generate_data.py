@@ -0,0 +1,211 @@
+"""Tests for the synthetic market data generator"""
+
+import random
+from collections import Counter
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from benchmarks.generate_data import (
+    GeneratorConfig,
+    TimestampFormatter,
+    generate,
+    generate_rows,
+    make_symbols,
+)
+from trading.application.cancel_order import CancelOrderUseCase
+from trading.application.dto import CancelOrderRequest
+from trading.application.ledger import balance_ledger
+from trading.domain.value_objects import OrderStatus
+from trading.infrastructure.repository import (
+    BalanceRepository,
+    OrderRepository,
+    TradeRepository,
+    TradingPairRepository,
+)
+
+CONFIG = GeneratorConfig(users=20, symbols=10, orders=3000, days=10, batch_size=700)
+
+
+@pytest.fixture
+def generated(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'generated.db'}")
+    report = generate(engine, CONFIG, progress=None)
+    yield engine, report
+    engine.dispose()
+
+
+def rows(engine, sql):
+    connection = engine.raw_connection()
+    try:
+        return connection.cursor().execute(sql).fetchall()
+    finally:
+        connection.close()
+
+
+# ============= Row Generation Tests =============
+
+
+def test_rows_are_deterministic_for_a_seed():
+    symbols = make_symbols(3, random.Random(1))
+    config = GeneratorConfig(users=5, symbols=3, orders=200, batch_size=1000)
+
+    first = list(generate_rows(config, symbols, ["a", "b"], end=1_700_000_000.0))
+    second = list(generate_rows(config, symbols, ["a", "b"], end=1_700_000_000.0))
+
+    assert first == second
+
+
+def test_timestamps_match_sqlalchemy_storage_format():
+    formatter = TimestampFormatter()
+    epoch = 1_700_000_000.25
+
+    assert formatter(epoch) == "2023-11-14 22:13:20.250000"
+    assert formatter(epoch + 61) == "2023-11-14 22:14:21.250000"
+
+
+# ============= Database Tests =============
+
+
+def test_generate_writes_requested_counts(generated):
+    engine, report = generated
+
+    assert report["counts"]["orders"] == 3000
+    assert report["counts"]["users"] == 20
+    assert report["counts"]["trading_pairs"] == 10
+    assert rows(engine, "SELECT COUNT(*) FROM orders") == [(3000,)]
+    assert rows(engine, "SELECT COUNT(*) FROM trades") == [
+        (report["counts"]["trades"],)
+    ]
+    assert report["counts"]["trades"] > 1000
+
+
+def test_status_distribution_and_fills_are_consistent(generated):
+    engine, _ = generated
+    statuses = Counter(
+        dict(rows(engine, "SELECT status, COUNT(*) FROM orders GROUP BY status"))
+    )
+
+    assert statuses["FILLED"] > statuses["CANCELLED"] > statuses["OPEN"]
+    assert rows(
+        engine,
+        "SELECT COUNT(*) FROM orders WHERE status = 'FILLED' "
+        "AND filled_quantity != quantity",
+    ) == [(0,)]
+    assert rows(
+        engine,
+        "SELECT COUNT(*) FROM orders WHERE status IN ('OPEN', 'REJECTED') "
+        "AND filled_quantity != 0",
+    ) == [(0,)]
+    assert rows(
+        engine, "SELECT COUNT(*) FROM orders WHERE updated_at < created_at"
+    ) == [(0,)]
+
+
+def test_market_order_trades_sum_to_their_fill(generated):
+    engine, _ = generated
+    # Market orders never rest, so every trade naming one is its own fill
+    mismatched = rows(
+        engine,
+        "SELECT o.order_id FROM orders o JOIN ("
+        "  SELECT order_id, SUM(quantity) AS traded FROM ("
+        "    SELECT buy_order_id AS order_id, quantity FROM trades"
+        "    UNION ALL SELECT sell_order_id, quantity FROM trades"
+        "  ) GROUP BY order_id"
+        ") t ON t.order_id = o.order_id "
+        "WHERE o.type = 'MARKET' AND ABS(t.traded - o.filled_quantity) > 1e-6",
+    )
+
+    assert mismatched == []
+
+
+def test_generated_rows_load_through_repositories(generated):
+    engine, _ = generated
+    order_id, trade_id = rows(
+        engine,
+        "SELECT o.order_id, t.trade_id FROM trades t "
+        "JOIN orders o ON o.order_id = t.buy_order_id LIMIT 1",
+    )[0]
+
+    with Session(engine) as db:
+        order = OrderRepository(db).find_by_id(order_id)
+        trade = TradeRepository(db).find_by_id(trade_id)
+        listings = TradingPairRepository(db).find_all()
+
+    assert order.status in set(OrderStatus)
+    assert order.filled_quantity <= order.quantity
+    assert trade.buy_order_id == order_id
+    assert trade.price.amount > 0
+    assert len(listings) == 10
+
+
+def test_second_run_appends_without_id_collisions(generated):
+    engine, report = generated
+    again = generate(engine, CONFIG, progress=None)
+
+    assert rows(engine, "SELECT COUNT(*) FROM orders") == [(6000,)]
+    assert rows(engine, "SELECT COUNT(*) FROM users") == [(20,)]
+    assert again["counts"]["trades"] == report["counts"]["trades"]
+    # Reference rows already existed; only new rows are counted
+    assert again["counts"]["users"] == 0
+    assert again["counts"]["trading_pairs"] == 0
+    assert again["counts"]["balances"] == 0
+    # Secondary indexes are rebuilt after the load
+    indexes = {name for (name,) in rows(engine, "SELECT name FROM sqlite_master")}
+    assert {"ix_orders_user_id", "ix_trades_executed_at"} <= indexes
+
+
+def test_locked_balances_cover_resting_orders(generated):
+    engine, _ = generated
+    mismatched = rows(
+        engine,
+        "SELECT h.user_id, h.currency, h.held, b.locked FROM ("
+        "  SELECT o.user_id, CASE o.side WHEN 'BUY' THEN 'USDT'"
+        "    ELSE substr(o.symbol, 1, instr(o.symbol, '/') - 1) END AS currency,"
+        "    SUM(CASE o.side WHEN 'BUY' THEN o.price ELSE 1 END"
+        "      * (o.quantity - o.filled_quantity)) AS held"
+        "  FROM orders o WHERE o.status IN ('OPEN', 'PARTIAL_FILLED')"
+        "  GROUP BY 1, 2"
+        ") h LEFT JOIN balances b"
+        "  ON b.user_id = h.user_id AND b.currency = h.currency "
+        "WHERE b.locked IS NULL OR ABS(b.locked - h.held) > 1e-6 * (1 + h.held)",
+    )
+
+    assert mismatched == []
+    assert rows(engine, "SELECT COUNT(*) FROM balances WHERE available < 0") == [(0,)]
+
+
+def test_generated_open_order_can_be_cancelled(generated):
+    engine, _ = generated
+    order_id, user_id = rows(
+        engine,
+        "SELECT order_id, user_id FROM orders "
+        "WHERE status = 'OPEN' AND side = 'BUY' LIMIT 1",
+    )[0]
+
+    with Session(engine) as db:
+        locked = BalanceRepository(db).find_by_user_id(user_id)
+        before = next(b.locked for b in locked if b.currency == "USDT")
+        response = CancelOrderUseCase(db).execute(
+            CancelOrderRequest(order_id=order_id, user_id=user_id)
+        )
+        db.commit()
+
+    assert response.status == "CANCELLED"
+    released = response.price * response.quantity
+    assert balance_ledger.get(user_id).locked("USDT") == pytest.approx(
+        before - released, abs=1e-6
+    )
+
+
+def test_buyer_fee_is_in_base_currency(generated):
+    engine, _ = generated
+    off = rows(
+        engine,
+        "SELECT COUNT(*) FROM trades "
+        "WHERE ABS(buyer_fee - quantity * 0.001) > 1e-8 "
+        "OR ABS(seller_fee - price * quantity * 0.001) > 1e-8",
+    )
+
+    assert off == [(0,)]
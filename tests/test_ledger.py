@@ -0,0 +1,410 @@
+"""Tests for the in-memory balance ledger"""
+
+from decimal import Decimal
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from trading.application.cancel_order import CancelOrderUseCase
+from trading.application.dto import (
+    CancelOrderRequest,
+    RecordTradesRequest,
+    TradeFillRequest,
+)
+from trading.application.ledger import LedgerService, balance_ledger
+from trading.application.record_trades import RecordTradesUseCase
+from trading.domain.balance import (
+    Balance,
+    BalanceAccount,
+    BalanceLedger,
+    order_reservation,
+)
+from trading.domain.exceptions import (
+    BalanceLockException,
+    InsufficientBalanceException,
+)
+from trading.domain.order import Order
+from trading.domain.value_objects import Money, OrderSide
+from trading.infrastructure import models  # Import to register models
+from trading.infrastructure.repository import BalanceRepository, OrderRepository
+
+
+TEST_DATABASE_URL = "sqlite:///:memory:"
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=test_engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=test_engine)
+
+
+def get_token(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return resp.json()["access_token"]
+
+
+# ============= Account Tests =============
+def test_account_lock_moves_available_to_locked():
+    account = BalanceAccount("alice", [Balance("USDT", Decimal("100"))])
+    account.apply("USDT", Decimal("-40"), Decimal("40"))
+
+    assert account.available("USDT") == Decimal("60")
+    assert account.locked("USDT") == Decimal("40")
+
+
+def test_account_insufficient_balance():
+    account = BalanceAccount("alice", [Balance("USDT", Decimal("10"))])
+
+    with pytest.raises(InsufficientBalanceException):
+        account.apply("USDT", Decimal("-11"), Decimal("11"))
+    assert account.available("USDT") == Decimal("10")
+
+
+def test_account_release_more_than_locked():
+    account = BalanceAccount("alice", [Balance("USDT", Decimal("10"))])
+
+    with pytest.raises(BalanceLockException):
+        account.apply("USDT", Decimal("5"), Decimal("-5"))
+
+
+def test_account_release_up_to_caps_at_locked():
+    account = BalanceAccount("alice", [Balance("USDT", Decimal("10"), Decimal("4"))])
+
+    assert account.release_up_to("USDT", Decimal("5")) == Decimal("4")
+    assert account.available("USDT") == Decimal("14")
+    assert account.locked("USDT") == Decimal("0")
+    assert account.release_up_to("BTC", Decimal("1")) == Decimal("0")
+
+
+def test_account_unknown_currency_is_zero():
+    account = BalanceAccount("alice")
+    assert account.available("BTC") == Decimal("0")
+
+
+def test_order_reservation():
+    buy = Order.place_limit_order(
+        "alice", "BTC/USDT", OrderSide.BUY, Decimal("100"), Decimal("2")
+    )
+    sell = Order.place_limit_order(
+        "alice", "BTC/USDT", OrderSide.SELL, Decimal("100"), Decimal("2")
+    )
+    market = Order.place_market_order("alice", "BTC/USDT", OrderSide.BUY, Decimal("1"))
+
+    assert order_reservation(buy) == Money(Decimal("200"), "USDT")
+    assert order_reservation(sell) == Money(Decimal("2"), "BTC")
+    assert order_reservation(buy, Decimal("0.5")) == Money(Decimal("50"), "USDT")
+    assert order_reservation(market) is None
+
+
+# ============= Ledger Service Tests =============
+def test_ledger_loads_account_once(db_session):
+    db_session.add(
+        models.BalanceModel(
+            user_id="alice",
+            currency="USDT",
+            available=Decimal("500"),
+            locked=Decimal("0"),
+            updated_at=datetime.now(),
+        )
+    )
+    db_session.commit()
+
+    ledger = BalanceLedger()
+    service = LedgerService(db_session, ledger)
+    assert service.account("alice").available("USDT") == Decimal("500")
+
+    # Database changes are not re-read once the account is resident
+    db_session.query(models.BalanceModel).delete()
+    db_session.commit()
+    assert service.account("alice").available("USDT") == Decimal("500")
+
+
+def test_ledger_rollback_undoes_lock(db_session):
+    ledger = BalanceLedger()
+    ledger.load("alice", [Balance("USDT", Decimal("100"))])
+    service = LedgerService(db_session, ledger)
+
+    service.lock("alice", Money(Decimal("30"), "USDT"))
+    assert ledger.get("alice").available("USDT") == Decimal("70")
+
+    db_session.rollback()
+    assert ledger.get("alice").available("USDT") == Decimal("100")
+    assert ledger.get("alice").locked("USDT") == Decimal("0")
+
+
+def test_ledger_close_without_commit_undoes_lock(db_session):
+    ledger = BalanceLedger()
+    ledger.load("alice", [Balance("USDT", Decimal("100"))])
+    service = LedgerService(db_session, ledger)
+
+    service.lock("alice", Money(Decimal("30"), "USDT"))
+    # get_db only closes; an unexpected exception never reaches rollback()
+    db_session.close()
+
+    assert ledger.get("alice").available("USDT") == Decimal("100")
+    assert ledger.get("alice").locked("USDT") == Decimal("0")
+
+
+def test_ledger_release_rolls_back_only_what_it_released(db_session):
+    ledger = BalanceLedger()
+    ledger.load("alice", [Balance("USDT", Decimal("100"), Decimal("20"))])
+    service = LedgerService(db_session, ledger)
+
+    assert service.release("alice", Money(Decimal("50"), "USDT")) == Decimal("20")
+    db_session.rollback()
+
+    assert ledger.get("alice").available("USDT") == Decimal("100")
+    assert ledger.get("alice").locked("USDT") == Decimal("20")
+
+
+def test_cancel_order_opened_before_the_ledger(db_session):
+    # Orders placed before balances were tracked hold nothing
+    order = Order.place_limit_order(
+        "alice", "BTC/USDT", OrderSide.BUY, Decimal("65000"), Decimal("0.5")
+    )
+    order.open()
+    OrderRepository(db_session).save(order)
+    db_session.commit()
+
+    response = CancelOrderUseCase(db_session).execute(
+        CancelOrderRequest(order_id=order.order_id, user_id="alice")
+    )
+    db_session.commit()
+
+    assert response.status == "CANCELLED"
+    assert balance_ledger.get("alice").locked("USDT") == Decimal("0")
+    assert balance_ledger.get("alice").available("USDT") == Decimal("0")
+
+
+def test_ledger_commit_keeps_lock(db_session):
+    ledger = BalanceLedger()
+    ledger.load("alice", [Balance("USDT", Decimal("100"))])
+    service = LedgerService(db_session, ledger)
+
+    service.lock("alice", Money(Decimal("30"), "USDT"))
+    db_session.commit()
+    db_session.rollback()
+
+    assert ledger.get("alice").locked("USDT") == Decimal("30")
+
+
+def test_ledger_flush_persists_dirty_accounts(db_session):
+    ledger = BalanceLedger()
+    ledger.load("alice", [Balance("USDT", Decimal("100"))])
+    ledger.load("bob", [Balance("BTC", Decimal("1"))])
+    service = LedgerService(db_session, ledger)
+
+    service.lock("alice", Money(Decimal("25"), "USDT"))
+    service.flush()
+    db_session.commit()
+
+    assert ledger.dirty_count == 0
+    balances = BalanceRepository(db_session).find_by_user_id("alice")
+    assert [(b.currency, b.available, b.locked) for b in balances] == [
+        ("USDT", Decimal("75"), Decimal("25"))
+    ]
+    # Untouched accounts are not written
+    assert BalanceRepository(db_session).find_by_user_id("bob") == []
+
+
+def test_record_trades_settles_both_sides(db_session):
+    ledger = balance_ledger
+    ledger.load("alice", [Balance("USDT", Decimal("1000"))])
+    ledger.load("bob", [Balance("BTC", Decimal("5"))])
+    service = LedgerService(db_session, ledger)
+    order_repo = OrderRepository(db_session)
+
+    buy = Order.place_limit_order(
+        "alice", "BTC/USDT", OrderSide.BUY, Decimal("100"), Decimal("2")
+    )
+    sell = Order.place_limit_order(
+        "bob", "BTC/USDT", OrderSide.SELL, Decimal("90"), Decimal("2")
+    )
+    for order in (buy, sell):
+        service.lock(order.user_id, order_reservation(order))
+        order.open()
+        order_repo.save(order)
+    db_session.commit()
+
+    RecordTradesUseCase(db_session).execute(
+        RecordTradesRequest(
+            fills=[
+                TradeFillRequest(
+                    buy_order_id=buy.order_id,
+                    sell_order_id=sell.order_id,
+                    price=Decimal("95"),
+                    quantity=Decimal("2"),
+                )
+            ]
+        )
+    )
+    db_session.commit()
+
+    alice, bob = ledger.get("alice"), ledger.get("bob")
+    # Bought below the limit: the difference returns to available
+    assert alice.available("USDT") == Decimal("810")
+    assert alice.locked("USDT") == Decimal("0")
+    # Both sides pay the base-tier 0.1% fee on what they receive
+    assert alice.available("BTC") == Decimal("1.998")
+    assert bob.available("BTC") == Decimal("3")
+    assert bob.locked("BTC") == Decimal("0")
+    assert bob.available("USDT") == Decimal("189.81")
+
+
+def test_record_trades_settles_orders_opened_before_the_ledger(db_session):
+    # Nothing was locked when these orders opened; funds sit in available
+    ledger = balance_ledger
+    ledger.load("alice", [Balance("USDT", Decimal("1000"))])
+    ledger.load("bob", [Balance("BTC", Decimal("5"))])
+    order_repo = OrderRepository(db_session)
+
+    buy = Order.place_limit_order(
+        "alice", "BTC/USDT", OrderSide.BUY, Decimal("100"), Decimal("2")
+    )
+    sell = Order.place_limit_order(
+        "bob", "BTC/USDT", OrderSide.SELL, Decimal("90"), Decimal("2")
+    )
+    for order in (buy, sell):
+        order.open()
+        order_repo.save(order)
+    db_session.commit()
+
+    RecordTradesUseCase(db_session).execute(
+        RecordTradesRequest(
+            fills=[
+                TradeFillRequest(
+                    buy_order_id=buy.order_id,
+                    sell_order_id=sell.order_id,
+                    price=Decimal("95"),
+                    quantity=Decimal("2"),
+                )
+            ]
+        )
+    )
+    db_session.commit()
+
+    alice, bob = ledger.get("alice"), ledger.get("bob")
+    assert alice.available("USDT") == Decimal("810")
+    assert alice.locked("USDT") == Decimal("0")
+    assert alice.available("BTC") == Decimal("1.998")
+    assert bob.available("BTC") == Decimal("3")
+    assert bob.locked("BTC") == Decimal("0")
+    assert bob.available("USDT") == Decimal("189.81")
+
+
+# ============= API Tests =============
+def test_place_order_locks_funds(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": "BTC/USDT",
+        "side": "BUY",
+        "order_type": "LIMIT",
+        "price": 100,
+        "quantity": 2,
+    }
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 201
+
+    balances = client.get("/api/balances/", headers=headers).json()["balances"]
+    usdt = next(b for b in balances if b["currency"] == "USDT")
+    assert Decimal(usdt["locked"]) == Decimal("200")
+
+    # Cancelling releases the hold
+    order_id = resp.json()["order_id"]
+    client.delete(f"/api/orders/{order_id}?user_id=LeonArif", headers=headers)
+    balances = client.get("/api/balances/", headers=headers).json()["balances"]
+    usdt = next(b for b in balances if b["currency"] == "USDT")
+    assert Decimal(usdt["locked"]) == Decimal("0")
+
+
+def test_place_order_insufficient_balance(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": "ETH/USDT",
+        "side": "SELL",
+        "order_type": "LIMIT",
+        "price": 3000,
+        "quantity": 1,
+    }
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 400
+    assert "Insufficient balance" in resp.json()["detail"]
+
+
+def test_recorded_trade_releases_locked_funds(client):
+    headers = {"Authorization": f"Bearer {get_token(client)}"}
+    base = {"user_id": "LeonArif", "symbol": "BTC/USDT", "order_type": "LIMIT"}
+    buy = client.post(
+        "/api/orders/",
+        json={**base, "side": "BUY", "price": 100, "quantity": 1},
+        headers=headers,
+    ).json()
+    sell = client.post(
+        "/api/orders/",
+        json={**base, "side": "SELL", "price": 100, "quantity": 1},
+        headers=headers,
+    ).json()
+    fill = {
+        "buy_order_id": buy["order_id"],
+        "sell_order_id": sell["order_id"],
+        "price": "100",
+        "quantity": "1",
+    }
+
+    resp = client.post("/api/trades/", json={"fills": [fill]}, headers=headers)
+
+    assert resp.status_code == 201
+    balances = client.get("/api/balances/", headers=headers).json()["balances"]
+    for balance in balances:
+        assert Decimal(balance["locked"]) == Decimal("0")
+
+
+def test_admin_deposit_funds_user(client):
+    headers = {"Authorization": f"Bearer {get_token(client)}"}
+    client.post(
+        "/api/users/",
+        json={"username": "alice", "password": "alice-password"},
+        headers=headers,
+    )
+
+    resp = client.post(
+        "/api/balances/deposit",
+        json={"username": "alice", "currency": "USDT", "amount": "250.5"},
+        headers=headers,
+    )
+
+    assert resp.status_code == 200
+    assert resp.json()["balances"] == [
+        {"currency": "USDT", "available": "250.5", "locked": "0", "total": "250.5"}
+    ]
+    assert balance_ledger.dirty_count == 0
+
+
+def test_deposit_requires_known_user_and_admin(client):
+    headers = {"Authorization": f"Bearer {get_token(client)}"}
+    payload = {"username": "nobody", "currency": "USDT", "amount": "1"}
+
+    assert (
+        client.post("/api/balances/deposit", json=payload, headers=headers).status_code
+        == 404
+    )
+    assert client.post("/api/balances/deposit", json=payload).status_code == 401
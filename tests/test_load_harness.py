@@ -0,0 +1,117 @@
+"""Tests for the HTTP load generator"""
+
+import asyncio
+
+import pytest
+
+from benchmarks.load import (
+    LatencyRecorder,
+    LoadConfig,
+    main,
+    parse_mix,
+    percentile,
+    prepare_database,
+    prepare_users,
+    run_asgi,
+)
+from main import app
+from trading.api.rate_limit import rate_limiter
+
+
+# ============= Helper Tests =============
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(i) for i in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 99.9) == 100.0
+    assert percentile([], 50) == 0.0
+
+
+def test_parse_mix_validates_endpoints():
+    assert parse_mix("place=3, list=1") == {"place": 3, "list": 1}
+    with pytest.raises(ValueError):
+        parse_mix("trade=1")
+    with pytest.raises(ValueError):
+        parse_mix("place=0")
+
+
+def test_recorder_summarises_per_endpoint():
+    recorder = LatencyRecorder()
+    for ms in (1, 2, 3, 4):
+        recorder.record("get", ms / 1000, 200)
+    recorder.record("get", 0.005, 404)
+
+    summary = recorder.summary(elapsed=1.0)["get"]
+    assert summary["requests"] == 5
+    assert summary["errors"] == 1
+    assert summary["p50_ms"] == pytest.approx(3.0)
+    assert summary["max_ms"] == pytest.approx(5.0)
+
+
+# ============= Run Tests =============
+
+
+def test_prepare_database_refuses_app_database(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "trading.db").write_bytes(b"keep")
+
+    for url in ("sqlite:///./trading.db", f"sqlite:///{tmp_path / 'trading.db'}"):
+        with pytest.raises(ValueError, match="--force"):
+            prepare_database(url)
+    assert (tmp_path / "trading.db").read_bytes() == b"keep"
+
+    with pytest.raises(SystemExit):
+        main(["--database-url", "sqlite:///./trading.db"])
+    assert (tmp_path / "trading.db").read_bytes() == b"keep"
+
+
+def test_asgi_run_exercises_every_endpoint(tmp_path):
+    rate_limiter.limits.clear()
+    config = LoadConfig(users=3, duration=30, warmup=0, max_requests=60, seed=7)
+    try:
+        session_factory = prepare_database(f"sqlite:///{tmp_path / 'load.db'}")
+        users = prepare_users(session_factory, config)
+        report = asyncio.run(run_asgi(users, config))
+    finally:
+        app.dependency_overrides.clear()
+
+    assert report["requests"] == 60
+    assert set(report["endpoints"]) == {"place", "cancel", "get", "list"}
+    for endpoint in report["endpoints"].values():
+        assert endpoint["errors"] == 0
+        assert endpoint["p50_ms"] <= endpoint["p99_ms"] <= endpoint["max_ms"]
+
+
+def test_orders_are_priced_around_the_reference(tmp_path):
+    from datetime import datetime, timezone
+    from decimal import Decimal
+
+    from trading.application.market_data import reference_prices
+    from trading.domain.order import Order
+    from trading.domain.value_objects import OrderSide
+
+    config = LoadConfig(users=2, seed=3)
+    try:
+        session_factory = prepare_database(f"sqlite:///{tmp_path / 'load.db'}")
+        # As if the load database held a trade at a realistic BTC price
+        reference_prices.update(
+            "BTC/USDT", Decimal("65000"), datetime.now(timezone.utc)
+        )
+        users = prepare_users(session_factory, config)
+    finally:
+        app.dependency_overrides.clear()
+
+    for user in users:
+        for _ in range(50):
+            payload = user._order_payload()
+            order = Order.place_limit_order(
+                user.username,
+                payload["symbol"],
+                OrderSide(payload["side"]),
+                Decimal(payload["price"]),
+                Decimal(payload["quantity"]),
+            )
+            reference_prices.check(order)
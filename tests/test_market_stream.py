@@ -0,0 +1,179 @@
+"""Tests for the public market-data WebSocket and its conflation"""
+
+import asyncio
+import json
+from decimal import Decimal
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from trading.application.market_stream import (
+    DepthDelta,
+    MarketSubscription,
+    _apply_and_publish,
+    depth_books,
+    market_events,
+    snapshot_text,
+)
+from trading.domain.depth import DepthBook
+from trading.domain.value_objects import OrderSide
+
+BUY, SELL = OrderSide.BUY, OrderSide.SELL
+
+
+def get_token(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return resp.json()["access_token"]
+
+
+def place_order(client, headers, side="BUY", price=100, quantity=1):
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": "BTC/USDT",
+        "side": side,
+        "order_type": "LIMIT",
+        "quantity": quantity,
+        "price": price,
+    }
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 201
+    return resp.json()["order_id"]
+
+
+# ============= Depth Book Tests =============
+
+
+def test_depth_book_aggregates_levels():
+    book = DepthBook("BTC/USDT")
+    book.apply(
+        [(BUY, Decimal("100"), Decimal("1")), (BUY, Decimal("100"), Decimal("2"))]
+    )
+    seq, levels = book.apply(
+        [(BUY, Decimal("99"), Decimal("1")), (SELL, Decimal("101"), Decimal("5"))]
+    )
+
+    assert seq == 2
+    assert len(levels) == 2
+    _, bids, asks = book.snapshot()
+    assert bids == [(Decimal("100"), Decimal("3")), (Decimal("99"), Decimal("1"))]
+    assert asks == [(Decimal("101"), Decimal("5"))]
+
+
+def test_depth_book_removes_empty_level():
+    book = DepthBook("BTC/USDT")
+    book.apply([(BUY, Decimal("100"), Decimal("1"))])
+    _, levels = book.apply([(BUY, Decimal("100"), Decimal("-1"))])
+
+    assert levels == [(BUY, Decimal("100"), Decimal("0"))]
+    assert book.snapshot()[1] == []
+
+
+# ============= Conflation Tests =============
+
+
+def test_subscription_starts_with_snapshot():
+    async def scenario():
+        depth_books.get("BTC/USDT").apply([(BUY, Decimal("100"), Decimal("1"))])
+        subscription = MarketSubscription("BTC/USDT")
+        return json.loads(await subscription.get())
+
+    message = asyncio.run(scenario())
+    assert message["type"] == "snapshot"
+    assert message["bids"] == [["100", "1"]]
+
+
+def test_slow_consumer_gets_conflated_snapshot():
+    async def scenario():
+        subscription = market_events.add(MarketSubscription("BTC/USDT", max_pending=4))
+        await subscription.get()  # initial snapshot
+
+        market_events.publish("market:BTC/USDT", "trade-1")
+        for price in range(100, 110):
+            _apply_and_publish("BTC/USDT", [(BUY, Decimal(price), Decimal("1"))])
+
+        received = [await subscription.get() for _ in range(subscription.pending)]
+        return received, subscription
+
+    received, subscription = asyncio.run(scenario())
+
+    assert received[0] == "trade-1"
+    snapshot = json.loads(received[-1])
+    assert snapshot["type"] == "snapshot"
+    assert len(snapshot["bids"]) == 10
+    assert subscription.conflations == 1
+    assert not subscription.closed
+    # Never more than the bound, however far behind
+    assert len(received) <= 4
+
+
+def test_trade_flood_closes_subscriber():
+    async def scenario():
+        subscription = market_events.add(MarketSubscription("BTC/USDT", max_pending=3))
+        await subscription.get()
+        for i in range(5):
+            market_events.publish("market:BTC/USDT", f"trade-{i}")
+        return subscription
+
+    subscription = asyncio.run(scenario())
+    assert subscription.overflowed
+    assert subscription.closed
+
+
+def test_messages_serialized_once_for_all_subscribers():
+    async def scenario():
+        first = market_events.add(MarketSubscription("BTC/USDT"))
+        second = market_events.add(MarketSubscription("BTC/USDT"))
+        snapshots = (await first.get(), await second.get())
+
+        _apply_and_publish("BTC/USDT", [(BUY, Decimal("100"), Decimal("1"))])
+        return snapshots, (await first.get(), await second.get())
+
+    snapshots, deltas = asyncio.run(scenario())
+    assert snapshots[0] is snapshots[1]
+    assert deltas[0] is deltas[1]
+    assert snapshot_text("BTC/USDT") is snapshot_text("BTC/USDT")
+
+
+# ============= WebSocket Tests =============
+
+
+def test_market_ws_streams_depth_changes(client):
+    headers = {"Authorization": f"Bearer {get_token(client)}"}
+    place_order(client, headers, price=100, quantity=2)
+
+    with client.websocket_connect("/api/markets/BTC-USDT/ws") as ws:
+        snapshot = json.loads(ws.receive_text())
+        assert snapshot["type"] == "snapshot"
+        assert snapshot["bids"] == [["100", "2"]]
+
+        order_id = place_order(client, headers, side="SELL", price=105)
+        delta = json.loads(ws.receive_text())
+        assert delta["type"] == "depth"
+        assert delta["asks"] == [["105", "1"]]
+        assert delta["seq"] > snapshot["seq"]
+
+        client.delete(f"/api/orders/{order_id}?user_id=LeonArif", headers=headers)
+        delta = json.loads(ws.receive_text())
+        assert delta["asks"] == [["105", "0"]]
+
+
+def test_market_ws_rejects_bad_symbol(client):
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect("/api/markets/BTCUSDT/ws") as ws:
+            ws.receive_text()
+    assert exc.value.code == 1008
+
+
+def test_market_ws_rejects_unlisted_symbol(client):
+    from trading.application.market_stream import _snapshots
+
+    for symbol in ("DOGE-USDT", "AAA-BBB"):
+        with pytest.raises(WebSocketDisconnect) as exc:
+            with client.websocket_connect(f"/api/markets/{symbol}/ws") as ws:
+                ws.receive_text()
+        assert exc.value.code == 1008
+    # Nothing was allocated for the made-up symbols
+    assert "DOGE/USDT" not in _snapshots
+    assert "AAA/BBB" not in _snapshots
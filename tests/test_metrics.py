@@ -0,0 +1,118 @@
+"""Tests for latency histograms and the /metrics endpoint"""
+
+import threading
+
+from trading.infrastructure.metrics import (
+    Histogram,
+    MetricsRegistry,
+    timed_repository,
+)
+
+
+def auth_headers(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+# ============= Histogram Tests =============
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency", "help", ("route",), buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(seconds, "/a")
+
+    counts, total = histogram.collect()[("/a",)]
+    assert counts == [2, 3, 4]
+    assert total == 3.65
+
+
+def test_histogram_merges_thread_shards():
+    histogram = Histogram("latency", "help", ("route",), buckets=(1.0,))
+
+    def record():
+        for _ in range(1000):
+            histogram.observe(0.5, "/a")
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    histogram.observe(0.5, "/a")
+
+    counts, _ = histogram.collect()[("/a",)]
+    assert counts == [4001, 4001]
+
+
+def test_registry_renders_text_format():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("req_seconds", "Request latency", ("route",))
+    registry.gauge("pool_size", "Pool size", lambda: 5)
+    histogram.observe(0.002, '/a"b')
+
+    text = registry.render()
+
+    assert "# TYPE req_seconds histogram" in text
+    assert 'req_seconds_bucket{route="/a\\"b",le="0.0025"} 1' in text
+    assert 'req_seconds_bucket{route="/a\\"b",le="+Inf"} 1' in text
+    assert 'req_seconds_count{route="/a\\"b"} 1' in text
+    assert "# TYPE pool_size gauge\npool_size 5" in text
+
+
+def test_timed_repository_skips_private_and_generator_methods():
+    @timed_repository
+    class FakeRepository:
+        def find(self):
+            return 1
+
+        def iter_all(self):
+            yield 1
+
+        def _helper(self):
+            return 2
+
+    assert FakeRepository.find.__wrapped__ is not None
+    assert not hasattr(FakeRepository.iter_all, "__wrapped__")
+    assert not hasattr(FakeRepository._helper, "__wrapped__")
+    assert list(FakeRepository().iter_all()) == [1]
+
+
+# ============= Endpoint Tests =============
+
+
+def test_metrics_endpoint_reports_routes_use_cases_and_repositories(client):
+    headers = auth_headers(client)
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": "BTC/USDT",
+        "side": "BUY",
+        "order_type": "LIMIT",
+        "quantity": 1,
+        "price": 100,
+    }
+    order_id = client.post("/api/orders/", json=payload, headers=headers).json()[
+        "order_id"
+    ]
+    client.get(f"/api/orders/{order_id}?user_id=LeonArif", headers=headers)
+
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    text = resp.text
+
+    # Labelled by route template, not by the order id in the path
+    assert (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="/api/orders/{order_id}",status="200"} 1'
+    ) in text
+    assert order_id not in text
+    assert 'use_case_duration_seconds_count{use_case="PlaceOrderUseCase"} 1' in text
+    assert (
+        'repository_duration_seconds_count{repository="OrderRepository",'
+        'method="find_by_id"} 1'
+    ) in text
+    assert "db_pool_checked_out" in text
@@ -0,0 +1,197 @@
+"""Tests for pushing order updates over WebSocket"""
+
+import asyncio
+import json
+from datetime import timedelta
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from trading.infrastructure.pubsub import PubSub, Subscription, SubscriptionClosed
+
+
+def get_token(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return resp.json()["access_token"]
+
+
+def place_order(client, headers):
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": "BTC/USDT",
+        "side": "BUY",
+        "order_type": "LIMIT",
+        "quantity": 1,
+        "price": 100,
+    }
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 201
+    return resp.json()["order_id"]
+
+
+# ============= PubSub Tests =============
+
+
+def test_publish_reaches_topic_subscribers_only():
+    async def scenario():
+        hub = PubSub()
+        mine = hub.add(Subscription("orders:alice"))
+        other = hub.add(Subscription("orders:bob"))
+
+        hub.publish("orders:alice", "m1")
+        return await mine.get(), other.pending
+
+    assert asyncio.run(scenario()) == ("m1", 0)
+
+
+def test_publish_from_other_thread():
+    async def scenario():
+        hub = PubSub()
+        subscription = hub.add(Subscription("t"))
+        await asyncio.to_thread(hub.publish, "t", "from-thread")
+        return await asyncio.wait_for(subscription.get(), 1)
+
+    assert asyncio.run(scenario()) == "from-thread"
+
+
+def test_overflow_closes_subscription():
+    async def scenario():
+        hub = PubSub()
+        subscription = hub.add(Subscription("t", max_pending=2))
+        for i in range(3):
+            hub.publish("t", str(i))
+
+        received = [await subscription.get(), await subscription.get()]
+        with pytest.raises(SubscriptionClosed):
+            await subscription.get()
+        return received, subscription.overflowed
+
+    assert asyncio.run(scenario()) == (["0", "1"], True)
+
+
+def test_removed_subscription_gets_nothing():
+    async def scenario():
+        hub = PubSub()
+        subscription = hub.add(Subscription("t"))
+        hub.remove(subscription)
+        hub.publish("t", "m")
+        return subscription.pending, hub.subscriber_count("t")
+
+    assert asyncio.run(scenario()) == (0, 0)
+
+
+# ============= WebSocket Tests =============
+
+
+def test_stream_pushes_open_and_cancel(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with client.websocket_connect(f"/api/orders/ws?token={token}") as ws:
+        order_id = place_order(client, headers)
+        opened = json.loads(ws.receive_text())
+        assert opened["event"] == "open"
+        assert opened["order"]["order_id"] == order_id
+        assert opened["order"]["status"] == "OPEN"
+
+        client.delete(f"/api/orders/{order_id}?user_id=LeonArif", headers=headers)
+        cancelled = json.loads(ws.receive_text())
+        assert cancelled["event"] == "cancel"
+        assert cancelled["order"]["status"] == "CANCELLED"
+
+
+def test_stream_accepts_authorization_header(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with client.websocket_connect("/api/orders/ws", headers=headers) as ws:
+        place_order(client, headers)
+        assert json.loads(ws.receive_text())["event"] == "open"
+
+
+def test_stream_rejects_bad_token(client):
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect("/api/orders/ws?token=garbage") as ws:
+            ws.receive_text()
+    assert exc.value.code == 1008
+
+
+def test_stream_closes_when_token_expires(client):
+    from trading.api.auth import create_access_token
+
+    # exp is whole seconds, so this token lives between one and two seconds
+    token = create_access_token({"sub": "LeonArif"}, timedelta(seconds=2))
+
+    with client.websocket_connect(f"/api/orders/ws?token={token}") as ws:
+        message = ws.receive()
+    assert message["type"] == "websocket.close"
+    assert message["code"] == 1008
+
+
+def test_failed_order_publishes_nothing(client):
+    from trading.application.order_events import order_events, order_topic
+
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    published = order_events.published
+
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": "BTC/USDT",
+        "side": "BUY",
+        "order_type": "LIMIT",
+        "quantity": 10_000_000,
+        "price": 100,
+    }
+    with client.websocket_connect(f"/api/orders/ws?token={token}"):
+        resp = client.post("/api/orders/", json=payload, headers=headers)
+        assert resp.status_code == 400
+    assert order_events.published == published
+
+
+def test_stream_pushes_fills(client):
+    from decimal import Decimal
+    from conftest import TestingSessionLocal
+    from trading.application.dto import RecordTradesRequest, TradeFillRequest
+    from trading.application.record_trades import RecordTradesUseCase
+
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    buy_id = place_order(client, headers)
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": "BTC/USDT",
+        "side": "SELL",
+        "order_type": "LIMIT",
+        "quantity": 1,
+        "price": 100,
+    }
+    sell_id = client.post("/api/orders/", json=payload, headers=headers).json()[
+        "order_id"
+    ]
+
+    with client.websocket_connect(f"/api/orders/ws?token={token}") as ws:
+        db = TestingSessionLocal()
+        try:
+            RecordTradesUseCase(db).execute(
+                RecordTradesRequest(
+                    fills=[
+                        TradeFillRequest(
+                            buy_order_id=buy_id,
+                            sell_order_id=sell_id,
+                            price=Decimal("100"),
+                            quantity=Decimal("1"),
+                        )
+                    ]
+                )
+            )
+            db.commit()
+        finally:
+            db.close()
+
+        events = [json.loads(ws.receive_text()) for _ in range(2)]
+        assert {e["event"] for e in events} == {"fill"}
+        assert {e["order"]["order_id"] for e in events} == {buy_id, sell_id}
+        assert {e["order"]["status"] for e in events} == {"FILLED"}
@@ -0,0 +1,190 @@
+"""Tests for the cached trading-pair registry"""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from trading.api.auth import get_current_admin
+from trading.application.pairs import DEFAULT_PAIRS, PairRegistryService
+from trading.domain.exceptions import (
+    InvalidTradingPairException,
+    TradingPairNotActiveException,
+)
+from trading.domain.pair_registry import PairListing, TradingPairRegistry
+from trading.domain.value_objects import TradingPair
+from trading.infrastructure import models  # Import to register models
+from trading.infrastructure.repository import TradingPairRepository
+
+
+TEST_DATABASE_URL = "sqlite:///:memory:"
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=test_engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=test_engine)
+
+
+def get_token(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return resp.json()["access_token"]
+
+
+def order_payload(symbol):
+    return {
+        "user_id": "LeonArif",
+        "symbol": symbol,
+        "side": "BUY",
+        "order_type": "LIMIT",
+        "quantity": 1,
+        "price": 10,
+    }
+
+
+# ============= Registry Tests =============
+
+
+def test_registry_resolves_both_spellings():
+    registry = TradingPairRegistry()
+    registry.replace([PairListing(TradingPair("BTC", "USDT"))])
+
+    assert registry.require("BTC/USDT").trading_pair == TradingPair("BTC", "USDT")
+    assert registry.require("BTC-USDT").trading_pair == TradingPair("BTC", "USDT")
+    assert registry.require(" btc/usdt ").trading_pair == TradingPair("BTC", "USDT")
+    assert len(registry.listings()) == 1
+
+
+def test_registry_rejects_unlisted_and_inactive():
+    registry = TradingPairRegistry()
+    registry.replace(
+        [
+            PairListing(TradingPair("BTC", "USDT")),
+            PairListing(TradingPair("LUNA", "USDT"), is_active=False),
+        ]
+    )
+
+    with pytest.raises(InvalidTradingPairException):
+        registry.require("DOGE/USDT")
+    with pytest.raises(InvalidTradingPairException):
+        registry.require("not-a-pair-at-all")
+    with pytest.raises(TradingPairNotActiveException):
+        registry.require("LUNA/USDT")
+
+
+def test_replace_swaps_index_reference():
+    registry = TradingPairRegistry()
+    registry.replace([PairListing(TradingPair("BTC", "USDT"))])
+    old_index = registry._index
+
+    registry.replace([PairListing(TradingPair("ETH", "USDT"))])
+
+    # Readers holding the old dict keep a consistent view
+    assert "BTC/USDT" in old_index
+    assert registry.get("BTC/USDT") is None
+
+
+# ============= Service Tests =============
+
+
+def test_service_serves_defaults_without_writing(db_session):
+    service = PairRegistryService(db_session, TradingPairRegistry())
+    service.ensure_loaded()
+
+    assert [l.symbol for l in service.registry.listings()] == sorted(DEFAULT_PAIRS)
+    assert TradingPairRepository(db_session).find_all() == []
+
+
+def test_listing_applies_only_after_commit(db_session):
+    registry = TradingPairRegistry()
+    service = PairRegistryService(db_session, registry)
+
+    service.set_active("DOGE/USDT", True)
+    assert registry.get("DOGE/USDT") is None
+
+    db_session.commit()
+    assert registry.require("DOGE-USDT").trading_pair == TradingPair("DOGE", "USDT")
+
+    # Defaults were persisted alongside the first change
+    stored = {l.symbol for l in TradingPairRepository(db_session).find_all()}
+    assert stored == set(DEFAULT_PAIRS) | {"DOGE/USDT"}
+
+
+def test_rolled_back_delisting_keeps_pair(db_session):
+    registry = TradingPairRegistry()
+    service = PairRegistryService(db_session, registry)
+
+    service.set_active("BTC/USDT", False)
+    db_session.rollback()
+
+    assert registry.require("BTC/USDT").trading_pair == TradingPair("BTC", "USDT")
+
+
+def test_delisting_unknown_pair_fails(db_session):
+    service = PairRegistryService(db_session, TradingPairRegistry())
+
+    with pytest.raises(InvalidTradingPairException):
+        service.set_active("DOGE/USDT", False)
+
+
+def test_admin_dependency_rejects_regular_user():
+    with pytest.raises(HTTPException) as exc:
+        get_current_admin({"username": "someone"})
+    assert exc.value.status_code == 403
+
+
+# ============= API Tests =============
+
+
+def test_list_pairs_endpoint(client):
+    resp = client.get("/api/pairs/")
+    assert resp.status_code == 200
+    symbols = [p["symbol"] for p in resp.json()]
+    assert "BTC/USDT" in symbols
+
+
+def test_order_on_unlisted_pair_rejected(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    resp = client.post("/api/orders/", json=order_payload("DOGE/USDT"), headers=headers)
+    assert resp.status_code == 400
+
+
+def test_list_then_delist_pair(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    resp = client.post("/api/pairs/", json={"symbol": "DOGE/USDT"}, headers=headers)
+    assert resp.status_code == 201
+    assert resp.json()["is_active"] is True
+
+    resp = client.post("/api/orders/", json=order_payload("DOGE/USDT"), headers=headers)
+    assert resp.status_code == 201
+
+    resp = client.delete("/api/pairs/DOGE-USDT", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["is_active"] is False
+
+    resp = client.post("/api/orders/", json=order_payload("DOGE/USDT"), headers=headers)
+    assert resp.status_code == 400
+    assert "not active" in resp.json()["detail"].lower()
+
+
+def test_manage_pairs_requires_auth(client):
+    resp = client.post("/api/pairs/", json={"symbol": "DOGE/USDT"})
+    assert resp.status_code == 401
@@ -0,0 +1,150 @@
+"""Tests for Argon2 verification in the password process pool"""
+
+import asyncio
+import os
+import signal
+import pytest
+from argon2 import PasswordHasher
+
+from trading.infrastructure.password_hashing import (
+    PasswordPoolSaturated,
+    PasswordVerifierPool,
+)
+
+# Cheap parameters keep the tests fast; the pool does not care
+HASH = PasswordHasher(time_cost=1, memory_cost=1024, parallelism=1).hash("secret")
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordVerifierPool(workers=1, max_pending=4)
+    yield pool
+    pool.shutdown()
+
+
+# ============= Pool Tests =============
+
+
+def test_verify_in_worker_process(pool):
+    assert asyncio.run(pool.verify(HASH, "secret")) is True
+    assert asyncio.run(pool.verify(HASH, "wrong")) is False
+
+    stats = pool.stats()
+    assert stats["completed"] == 2
+    assert stats["pending"] == 0
+    assert stats["max_seconds"] > 0
+
+
+def test_hash_in_worker_process(pool):
+    hashed = asyncio.run(pool.hash("other"))
+
+    assert asyncio.run(pool.verify(hashed, "other")) is True
+    assert pool.stats()["completed"] == 2
+    assert pool.stats()["pending"] == 0
+
+
+def test_malformed_hash_is_a_mismatch(pool):
+    assert asyncio.run(pool.verify("not-a-hash", "secret")) is False
+
+
+def test_saturated_pool_rejects_fast():
+    pool = PasswordVerifierPool(workers=1, max_pending=1)
+
+    async def burst():
+        return await asyncio.gather(
+            pool.verify(HASH, "secret"),
+            pool.verify(HASH, "secret"),
+            return_exceptions=True,
+        )
+
+    try:
+        first, second = asyncio.run(burst())
+    finally:
+        pool.shutdown()
+
+    assert first is True
+    assert isinstance(second, PasswordPoolSaturated)
+    assert pool.stats()["rejected"] == 1
+
+
+def test_blocking_calls_share_the_pending_limit():
+    pool = PasswordVerifierPool(workers=1, max_pending=0)
+
+    with pytest.raises(PasswordPoolSaturated):
+        pool.hash_blocking("secret")
+    with pytest.raises(PasswordPoolSaturated):
+        pool.verify_blocking(HASH, "secret")
+    assert pool.stats()["rejected"] == 2
+    assert pool.stats()["pending"] == 0
+
+
+def test_blocking_calls_are_counted(pool):
+    assert pool.verify_blocking(HASH, "secret") is True
+    assert pool.verify_blocking(pool.hash_blocking("other"), "other") is True
+
+    stats = pool.stats()
+    assert stats["completed"] == 3
+    assert stats["pending"] == 0
+
+
+def test_pool_recovers_after_worker_dies(pool):
+    assert pool.verify_blocking(HASH, "secret") is True
+    broken = pool._executor
+    for pid in list(broken._processes):
+        os.kill(pid, signal.SIGKILL)
+
+    assert asyncio.run(pool.verify(HASH, "secret")) is True
+    assert pool._executor is not broken
+    assert pool.verify_blocking(HASH, "wrong") is False
+
+
+# ============= API Tests =============
+
+
+def test_login_returns_503_when_saturated(client, monkeypatch):
+    from trading.infrastructure.password_hashing import password_pool
+
+    monkeypatch.setattr(password_pool, "max_pending", 0)
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "1"
+
+
+def test_health_reports_pool_stats(client):
+    client.post("/api/token", data={"username": "LeonArif", "password": "wrong"})
+    stats = client.get("/health").json()["password_pool"]
+    assert stats["completed"] >= 1
+
+
+def test_register_returns_503_when_saturated(client, monkeypatch):
+    from trading.infrastructure.password_hashing import password_pool
+
+    token = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    ).json()["access_token"]
+    monkeypatch.setattr(password_pool, "max_pending", 0)
+    resp = client.post(
+        "/api/users/",
+        json={"username": "newbie", "password": "secret123"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "1"
+
+
+def test_change_password_returns_503_when_saturated(client, monkeypatch):
+    from trading.infrastructure.password_hashing import password_pool
+
+    token = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    ).json()["access_token"]
+    monkeypatch.setattr(password_pool, "max_pending", 0)
+    resp = client.put(
+        "/api/users/me/password",
+        json={"current_password": "password123", "new_password": "newpassword"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "1"
@@ -0,0 +1,177 @@
+"""Tests for the price band guard on LIMIT orders"""
+
+from decimal import Decimal
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from trading.application.dto import RecordTradesRequest, TradeFillRequest
+from trading.application.ledger import LedgerService
+from trading.application.record_trades import RecordTradesUseCase
+from trading.domain.balance import order_reservation
+from trading.domain.candle import CandleAggregator
+from trading.domain.exceptions import PriceOutOfRangeException
+from trading.domain.order import Order
+from trading.domain.price_band import ReferencePriceCache
+from trading.domain.ticker import TickerBook
+from trading.domain.value_objects import OrderSide
+from trading.infrastructure import models  # Import to register models
+from trading.infrastructure.repository import OrderRepository
+
+
+TEST_DATABASE_URL = "sqlite:///:memory:"
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+T0 = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=test_engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=test_engine)
+
+
+def limit_order(price, side=OrderSide.BUY):
+    return Order.place_limit_order(
+        "alice", "BTC/USDT", side, Decimal(price), Decimal("1")
+    )
+
+
+def open_order(repo, user_id, side, price="100", quantity="1"):
+    order = Order.place_limit_order(
+        user_id, "BTC/USDT", side, Decimal(price), Decimal(quantity)
+    )
+    order.open()
+    repo.save(order)
+
+    ledger = LedgerService(repo.db)
+    held = order_reservation(order)
+    ledger.adjust(user_id, held.currency, held.amount)
+    ledger.lock(user_id, held)
+    return order
+
+
+def record_fill(db_session, references, price):
+    order_repo = OrderRepository(db_session)
+    buy = open_order(order_repo, "alice", OrderSide.BUY, price=price)
+    sell = open_order(order_repo, "bob", OrderSide.SELL, price=price)
+    db_session.commit()
+
+    RecordTradesUseCase(
+        db_session,
+        candles=CandleAggregator(),
+        tickers=TickerBook(),
+        references=references,
+    ).execute(
+        RecordTradesRequest(
+            fills=[
+                TradeFillRequest(
+                    buy_order_id=buy.order_id,
+                    sell_order_id=sell.order_id,
+                    price=Decimal(price),
+                    quantity=Decimal("1"),
+                    executed_at=T0,
+                )
+            ]
+        )
+    )
+
+
+# ============= Cache Tests =============
+
+
+def test_no_reference_means_no_band():
+    cache = ReferencePriceCache(Decimal("0.10"))
+    cache.check(limit_order("1000000"))
+
+
+def test_band_bounds_precomputed():
+    cache = ReferencePriceCache(Decimal("0.10"))
+    cache.update("BTC/USDT", Decimal("100"), T0)
+
+    reference = cache.get("BTC/USDT")
+    assert reference.low == Decimal("90")
+    assert reference.high == Decimal("110")
+
+    cache.check(limit_order("90"))
+    cache.check(limit_order("110", OrderSide.SELL))
+    with pytest.raises(PriceOutOfRangeException, match="last traded price 100"):
+        cache.check(limit_order("110.01"))
+    with pytest.raises(PriceOutOfRangeException):
+        cache.check(limit_order("89.99", OrderSide.SELL))
+
+
+def test_older_trade_does_not_move_reference():
+    cache = ReferencePriceCache(Decimal("0.10"))
+    cache.update("BTC/USDT", Decimal("100"), T0)
+    cache.update("BTC/USDT", Decimal("50"), T0 - timedelta(seconds=1))
+
+    assert cache.get("BTC/USDT").price == Decimal("100")
+
+
+def test_market_orders_bypass_band():
+    cache = ReferencePriceCache(Decimal("0.10"))
+    cache.update("BTC/USDT", Decimal("100"), T0)
+    order = Order.place_market_order("alice", "BTC/USDT", OrderSide.BUY, Decimal("1"))
+
+    cache.check(order)
+
+
+# ============= Matching Path Tests =============
+
+
+def test_recorded_trade_sets_reference_on_commit(db_session):
+    cache = ReferencePriceCache(Decimal("0.10"))
+    record_fill(db_session, cache, "200")
+    assert cache.get("BTC/USDT") is None
+
+    db_session.commit()
+    assert cache.get("BTC/USDT").price == Decimal("200")
+
+
+def test_rolled_back_trade_keeps_old_reference(db_session):
+    cache = ReferencePriceCache(Decimal("0.10"))
+    record_fill(db_session, cache, "200")
+    db_session.rollback()
+
+    assert cache.get("BTC/USDT") is None
+
+
+# ============= API Tests =============
+
+
+def test_order_outside_band_rejected(client):
+    from trading.application.market_data import reference_prices
+
+    reference_prices.update("BTC/USDT", Decimal("100"), T0)
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": "BTC/USDT",
+        "side": "BUY",
+        "order_type": "LIMIT",
+        "quantity": 1,
+        "price": 150,
+    }
+
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 400
+    assert "deviates" in resp.json()["detail"]
+
+    payload["price"] = 105
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 201
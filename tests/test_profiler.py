@@ -0,0 +1,101 @@
+"""Tests for the on-demand sampling profiler"""
+
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from trading.infrastructure.sampling_profiler import (
+    ProfilerBusy,
+    SamplingProfiler,
+    collapse,
+)
+
+
+def busy_worker(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def run_in_thread(target, *args, name="worker"):
+    thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+    thread.start()
+    return thread
+
+
+# ============= Sampling Tests =============
+
+
+def test_profile_captures_busy_thread_stacks():
+    stop = threading.Event()
+    thread = run_in_thread(busy_worker, stop, name="busy")
+    try:
+        stacks = SamplingProfiler().profile(0.2, interval=0.002)
+    finally:
+        stop.set()
+        thread.join()
+
+    busy = [s for s in stacks if s.startswith("busy;")]
+    assert busy
+    assert any("test_profiler:busy_worker" in s for s in busy)
+    assert all(";" in s for s in stacks)
+
+
+def test_idle_threads_are_skipped_unless_requested():
+    stop = threading.Event()
+    thread = run_in_thread(stop.wait, name="idle")
+    try:
+        profiler = SamplingProfiler()
+        quiet = profiler.profile(0.05, interval=0.002)
+        noisy = profiler.profile(0.05, interval=0.002, include_idle=True)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert not any(s.startswith("idle;") for s in quiet)
+    assert any(s.startswith("idle;") for s in noisy)
+
+
+def test_only_one_profile_at_a_time():
+    profiler = SamplingProfiler()
+    thread = run_in_thread(profiler.profile, 0.3)
+    time.sleep(0.05)
+    try:
+        with pytest.raises(ProfilerBusy):
+            profiler.profile(0.01)
+    finally:
+        thread.join()
+    assert not profiler.is_running
+
+
+def test_collapse_orders_by_weight_and_applies_minimum():
+    stacks = Counter({"main;a;b": 3, "main;a": 7, "main;c": 1})
+
+    assert list(collapse(stacks)) == ["main;a 7", "main;a;b 3", "main;c 1"]
+    assert list(collapse(stacks, min_count=3)) == ["main;a 7", "main;a;b 3"]
+
+
+# ============= Endpoint Tests =============
+
+
+def test_profile_endpoint_requires_admin(client):
+    assert client.get("/api/admin/profile?seconds=0.01").status_code == 401
+
+
+def test_profile_endpoint_returns_collapsed_stacks(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+    resp = client.get(
+        "/api/admin/profile?seconds=0.05&interval_ms=1&include_idle=true",
+        headers=headers,
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    lines = resp.text.strip().splitlines()
+    assert lines
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
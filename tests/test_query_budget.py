@@ -0,0 +1,169 @@
+"""Tests for per-request SQL statement and row budgets"""
+
+import asyncio
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from trading.api.query_budgets import QueryBudgetMiddleware
+from trading.infrastructure.query_budget import (
+    MODE_RAISE,
+    MODE_WARN,
+    QueryBudget,
+    QueryBudgetExceeded,
+    QueryBudgets,
+    QueryCounter,
+    current_counter,
+    query_budgets,
+)
+
+
+def auth_headers(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def place_order(client, headers):
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": "BTC/USDT",
+        "side": "BUY",
+        "order_type": "LIMIT",
+        "quantity": 1,
+        "price": 100,
+    }
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 201
+    return resp.json()["order_id"]
+
+
+# ============= Counter Tests =============
+
+
+def test_counter_reports_violations_and_repeated_statement():
+    counter = QueryCounter()
+    for _ in range(3):
+        counter.statements += 1
+        counter.by_statement["SELECT * FROM orders WHERE order_id = ?"] += 1
+    counter.statements += 1
+    counter.by_statement["UPDATE orders SET status=?"] += 1
+    counter.rows = 10
+
+    assert counter.violations(QueryBudget(max_statements=4, max_rows=10)) == []
+    assert counter.violations(QueryBudget(max_statements=2, max_rows=None)) == [
+        "4 statements (budget 2)"
+    ]
+    assert counter.most_repeated() == ("SELECT * FROM orders WHERE order_id = ?", 3)
+
+
+def test_route_budget_overrides_default():
+    budgets = QueryBudgets(mode=MODE_WARN, default=QueryBudget(max_statements=1))
+    budgets.set_route("/api/orders/export", QueryBudget(max_rows=None))
+
+    assert budgets.budget_for("/api/orders/export").max_rows is None
+    assert budgets.budget_for("/api/other").max_statements == 1
+
+
+def test_warn_mode_logs_instead_of_raising():
+    budgets = QueryBudgets(mode=MODE_WARN, default=QueryBudget(max_statements=0))
+    counter = QueryCounter()
+    counter.statements = 1
+
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = logging.getLogger("trading.sql.budget")
+    logger.addHandler(handler)
+    try:
+        budgets.check("GET", "/api/orders/", counter)
+    finally:
+        logger.removeHandler(handler)
+
+    assert len(records) == 1
+    assert records[0].statements == 1
+    assert "over query budget" in records[0].getMessage()
+
+
+def test_counter_exists_only_inside_a_request():
+    assert current_counter() is None
+    token = query_budgets.start()
+    try:
+        assert current_counter().statements == 0
+    finally:
+        query_budgets.end(token)
+    assert current_counter() is None
+
+
+def test_rows_counted_for_core_and_column_queries():
+    engine = create_engine("sqlite://")
+    token = query_budgets.start()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3")).all()
+            conn.execute(text("SELECT 1")).first()
+            conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        assert current_counter().rows == 4
+        assert current_counter().statements == 3
+    finally:
+        query_budgets.end(token)
+        engine.dispose()
+
+
+def test_raise_mode_fails_before_response_starts():
+    engine = create_engine("sqlite://")
+    budgets = QueryBudgets(mode=MODE_RAISE, default=QueryBudget(max_statements=0))
+    sent = []
+
+    async def app(scope, receive, send):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1")).all()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/x"}
+    with pytest.raises(QueryBudgetExceeded):
+        asyncio.run(QueryBudgetMiddleware(app, budgets)(scope, None, send))
+    engine.dispose()
+
+    assert sent == []
+
+
+# ============= Request Budget Tests =============
+
+
+def test_requests_within_budget_pass(client):
+    headers = auth_headers(client)
+    order_id = place_order(client, headers)
+
+    resp = client.delete(f"/api/orders/{order_id}?user_id=LeonArif", headers=headers)
+    assert resp.status_code == 200
+
+
+def test_over_budget_request_fails_in_test_mode(client, monkeypatch):
+    headers = auth_headers(client)
+    place_order(client, headers)
+    monkeypatch.setitem(
+        query_budgets._routes, "/api/orders/", QueryBudget(max_statements=1)
+    )
+
+    with pytest.raises(QueryBudgetExceeded) as exc:
+        client.get("/api/orders/?user_id=LeonArif", headers=headers)
+    assert "GET /api/orders/ over query budget" in str(exc.value)
+
+
+def test_row_budget_catches_wide_listing(client, monkeypatch):
+    headers = auth_headers(client)
+    for _ in range(3):
+        place_order(client, headers)
+    monkeypatch.setitem(query_budgets._routes, "/api/orders/", QueryBudget(max_rows=2))
+
+    with pytest.raises(QueryBudgetExceeded) as exc:
+        client.get("/api/orders/?user_id=LeonArif", headers=headers)
+    assert "rows (budget 2)" in str(exc.value)
@@ -0,0 +1,117 @@
+"""Tests for the slow-query log"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from trading.infrastructure.query_log import SlowQueryLog
+from trading.infrastructure.request_timing import (
+    current_timings,
+    end_request,
+    enter_use_case,
+    exit_use_case,
+    start_request,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE orders (order_id TEXT, user_id TEXT)"))
+        conn.execute(text("CREATE INDEX ix_orders_user_id ON orders (user_id)"))
+    yield engine
+    engine.dispose()
+
+
+def run(engine, statement, **params):
+    with engine.begin() as conn:
+        return conn.execute(text(statement), params).fetchall()
+
+
+# ============= Threshold & Sampling Tests =============
+
+
+def test_fast_statements_are_not_logged(engine):
+    log = SlowQueryLog(threshold_ms=10_000)
+    log.install(engine)
+
+    run(engine, "SELECT * FROM orders")
+
+    assert log.recent() == []
+
+
+def test_slow_statement_logged_with_query_plan(engine):
+    log = SlowQueryLog(threshold_ms=0)
+    log.install(engine)
+
+    run(engine, "SELECT * FROM orders WHERE user_id = :user_id", user_id="u1")
+
+    slow = [q for q in log.recent() if "WHERE user_id" in q.statement]
+    assert len(slow) == 1
+    assert slow[0].duration_ms >= 0
+    assert any("ix_orders_user_id" in line for line in slow[0].plan)
+
+
+def test_plan_skipped_for_ddl_and_when_disabled(engine):
+    log = SlowQueryLog(threshold_ms=0)
+    log.install(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE extra (id INTEGER)"))
+    assert log.recent()[-1].plan is None
+
+    quiet = SlowQueryLog(threshold_ms=0, explain=False)
+    log.uninstall(engine)
+    quiet.install(engine)
+    run(engine, "SELECT * FROM orders")
+    assert quiet.recent()[-1].plan is None
+
+
+def test_sample_rate_zero_times_nothing(engine):
+    log = SlowQueryLog(threshold_ms=0, sample_rate=0.0)
+    log.install(engine)
+
+    run(engine, "SELECT * FROM orders")
+
+    assert log.recent() == []
+
+
+def test_executemany_explains_first_parameter_set(engine):
+    log = SlowQueryLog(threshold_ms=0)
+    log.install(engine)
+
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO orders VALUES (:order_id, :user_id)"),
+            [{"order_id": "o1", "user_id": "u1"}, {"order_id": "o2", "user_id": "u2"}],
+        )
+
+    insert = [q for q in log.recent() if q.statement.startswith("INSERT")]
+    assert insert and insert[0].plan is not None
+    assert run(engine, "SELECT COUNT(*) FROM orders") == [(2,)]
+
+
+# ============= Attribution Tests =============
+
+
+def test_slow_query_tagged_with_route_and_use_case(engine):
+    log = SlowQueryLog(threshold_ms=0)
+    log.install(engine)
+
+    request = start_request()
+    current_timings().route = "/api/orders/"
+    use_case = enter_use_case("ListOrdersUseCase")
+    try:
+        run(engine, "SELECT * FROM orders")
+    finally:
+        exit_use_case(use_case)
+        end_request(request)
+    run(engine, "SELECT order_id FROM orders")
+
+    tagged, untagged = log.recent()[-2:]
+    assert (tagged.route, tagged.use_case) == ("/api/orders/", "ListOrdersUseCase")
+    assert (untagged.route, untagged.use_case) == (None, None)
@@ -0,0 +1,125 @@
+"""Tests for the Server-Timing stage breakdown"""
+
+import logging
+
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+
+from trading.api.server_timing import TimedRoute
+from trading.infrastructure.request_timing import (
+    add_stage,
+    current_timings,
+    end_request,
+    start_request,
+    timed_stage,
+)
+
+
+def auth_headers(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def parse_server_timing(header):
+    stages = {}
+    for entry in header.split(","):
+        name, duration = entry.strip().split(";dur=")
+        stages[name] = float(duration)
+    return stages
+
+
+ORDER = {
+    "user_id": "LeonArif",
+    "symbol": "BTC/USDT",
+    "side": "BUY",
+    "order_type": "LIMIT",
+    "quantity": 1,
+    "price": 100,
+}
+
+
+# ============= Request Timing Tests =============
+
+
+def test_stages_are_ignored_outside_a_request():
+    add_stage("db", 1.0)
+    with timed_stage("auth"):
+        pass
+    assert current_timings() is None
+
+
+def test_stages_accumulate_within_a_request():
+    token = start_request()
+    try:
+        add_stage("db", 0.25)
+        add_stage("db", 0.5)
+        assert current_timings().stages == {"db": 0.75}
+    finally:
+        end_request(token)
+    assert current_timings() is None
+
+
+def test_included_routes_wrap_endpoint_once():
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/ping")
+    def ping():
+        return "pong"
+
+    app = FastAPI()
+    app.include_router(router, prefix="/v1")
+    route = next(r for r in app.routes if isinstance(r, APIRoute))
+
+    assert isinstance(route, TimedRoute)
+    assert route.endpoint is router.routes[0].endpoint
+    assert route.endpoint.__wrapped__ is ping
+
+
+# ============= Server-Timing Header Tests =============
+
+
+def test_place_order_reports_every_stage(client):
+    headers = auth_headers(client)
+
+    resp = client.post("/api/orders/", json=ORDER, headers=headers)
+
+    assert resp.status_code == 201
+    stages = parse_server_timing(resp.headers["Server-Timing"])
+    for stage in ("auth", "validation", "handler", "db", "commit", "serialize"):
+        assert stage in stages
+    assert stages["total"] >= stages["handler"]
+
+
+def test_rejected_request_still_reports_auth_and_total(client):
+    resp = client.get(
+        "/api/orders/?user_id=LeonArif",
+        headers={"Authorization": "Bearer not-a-token"},
+    )
+
+    assert resp.status_code == 401
+    stages = parse_server_timing(resp.headers["Server-Timing"])
+    assert "auth" in stages and "total" in stages
+    assert "handler" not in stages
+
+
+def test_timings_logged_as_structured_fields(client):
+    headers = auth_headers(client)
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = logging.getLogger("trading.request")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        client.get("/api/orders/?user_id=LeonArif", headers=headers)
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+
+    record = records[-1]
+    assert record.route == "/api/orders/"
+    assert record.status == 200
+    assert "db" in record.timings_ms and "total" in record.timings_ms
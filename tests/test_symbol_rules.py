@@ -0,0 +1,159 @@
+"""Tests for per-symbol tick/lot/notional rules"""
+
+from decimal import Decimal
+import pytest
+
+from trading.domain.exceptions import (
+    InvalidPriceException,
+    InvalidQuantityException,
+    OrderValidationException,
+    PriceOutOfRangeException,
+    QuantityBelowMinimumException,
+    QuantityAboveMaximumException,
+)
+from trading.domain.order import Order
+from trading.domain.symbol_rules import DEFAULT_SYMBOL_RULES, SymbolRules
+from trading.domain.value_objects import Money, OrderSide, OrderType, TradingPair
+
+BTC_RULES = SymbolRules(
+    tick_size=Decimal("0.5"),
+    step_size=Decimal("0.001"),
+    min_price=Decimal("10"),
+    max_price=Decimal("500000"),
+    min_quantity=Decimal("0.001"),
+    max_quantity=Decimal("100"),
+    min_notional=Decimal("5"),
+)
+
+
+def make_order(price, quantity, order_type=OrderType.LIMIT, rules=BTC_RULES):
+    return Order.create(
+        user_id="alice",
+        trading_pair=TradingPair("BTC", "USDT"),
+        side=OrderSide.BUY,
+        order_type=order_type,
+        price=Money(Decimal(price), "USDT"),
+        quantity=Decimal(quantity),
+        rules=rules,
+    )
+
+
+# ============= Compilation Tests =============
+
+
+def test_rules_compile_to_integer_units():
+    assert BTC_RULES.price_exp == 1
+    assert BTC_RULES.quantity_exp == 3
+    assert BTC_RULES.price_units(Decimal("100.5")) == 1005
+    assert BTC_RULES.quantity_units(Decimal("0.25")) == 250
+
+
+def test_inconsistent_rules_rejected():
+    with pytest.raises(ValueError):
+        SymbolRules(tick_size=Decimal("0"))
+    with pytest.raises(ValueError):
+        SymbolRules(min_price=Decimal("10"), max_price=Decimal("1"))
+
+
+# ============= Order Validation Tests =============
+
+
+def test_valid_order_passes():
+    order = make_order("30000.5", "0.015")
+    assert order.price.amount == Decimal("30000.5")
+
+
+def test_price_off_tick_rejected():
+    with pytest.raises(InvalidPriceException):
+        make_order("30000.25", "1")
+
+
+def test_price_out_of_range():
+    with pytest.raises(PriceOutOfRangeException):
+        make_order("5", "1")
+    with pytest.raises(PriceOutOfRangeException):
+        make_order("600000", "0.001")
+
+
+def test_quantity_off_step_rejected():
+    with pytest.raises(InvalidQuantityException):
+        make_order("100", "0.0015")
+
+
+def test_quantity_bounds():
+    with pytest.raises(QuantityAboveMaximumException):
+        make_order("100", "101")
+    with pytest.raises(QuantityBelowMinimumException):
+        make_order("100", "0.0005")
+
+
+def test_min_notional():
+    with pytest.raises(OrderValidationException):
+        make_order("100", "0.04")
+    # 100 * 0.05 == 5 is exactly the minimum
+    make_order("100", "0.05")
+
+
+def test_market_order_skips_price_rules():
+    order = make_order("0", "1", order_type=OrderType.MARKET)
+    assert order.order_type == OrderType.MARKET
+
+
+def test_default_rules_keep_global_limits():
+    with pytest.raises(PriceOutOfRangeException):
+        make_order("0.001", "1", rules=DEFAULT_SYMBOL_RULES)
+    with pytest.raises(QuantityAboveMaximumException):
+        make_order("1", "1000001", rules=DEFAULT_SYMBOL_RULES)
+    make_order("0.01", "0.00000001", rules=DEFAULT_SYMBOL_RULES)
+
+
+# ============= API Tests =============
+
+
+def get_token(client):
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 200
+    return resp.json()["access_token"]
+
+
+def test_listing_rules_enforced_on_order_entry(client):
+    token = get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    rules = {
+        "tick_size": "0.5",
+        "step_size": "0.001",
+        "min_price": "10",
+        "max_price": "500000",
+        "min_quantity": "0.001",
+        "max_quantity": "100",
+        "min_notional": "5",
+    }
+    resp = client.post(
+        "/api/pairs/", json={"symbol": "BTC/USDT", "rules": rules}, headers=headers
+    )
+    assert resp.status_code == 201
+    assert Decimal(resp.json()["rules"]["tick_size"]) == Decimal("0.5")
+
+    payload = {
+        "user_id": "LeonArif",
+        "symbol": "BTC/USDT",
+        "side": "BUY",
+        "order_type": "LIMIT",
+        "quantity": "0.01",
+        "price": "1000.25",
+    }
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 400
+    assert "tick size" in resp.json()["detail"]
+
+    payload["price"] = "1000.5"
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 201
+
+    payload["price"] = "1000000"
+    resp = client.post("/api/orders/", json=payload, headers=headers)
+    assert resp.status_code == 400
+    assert "out of range" in resp.json()["detail"]
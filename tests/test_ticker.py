@@ -0,0 +1,124 @@
+"""Tests for rolling 24h ticker statistics"""
+
+from decimal import Decimal
+from datetime import datetime, timedelta, timezone
+
+from trading.application import market_data
+from trading.domain.ticker import RollingTicker, TickerBook, WINDOW_MINUTES
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+# ============= Rolling Ticker Tests =============
+def test_ticker_empty_snapshot():
+    stats = RollingTicker("BTC/USDT").snapshot(T0)
+
+    assert stats.last_price is None
+    assert stats.high is None
+    assert stats.volume == Decimal("0")
+    assert stats.vwap is None
+
+
+def test_ticker_accumulates_trades():
+    ticker = RollingTicker("BTC/USDT")
+    ticker.apply_trade(Decimal("100"), Decimal("1"), T0)
+    ticker.apply_trade(Decimal("110"), Decimal("3"), T0 + timedelta(minutes=1))
+    ticker.apply_trade(Decimal("90"), Decimal("1"), T0 + timedelta(minutes=2))
+
+    stats = ticker.snapshot(T0 + timedelta(minutes=2))
+    assert stats.last_price == Decimal("90")
+    assert stats.high == Decimal("110")
+    assert stats.low == Decimal("90")
+    assert stats.volume == Decimal("5")
+    assert stats.quote_volume == Decimal("520")
+    assert stats.vwap == Decimal("104")
+    assert stats.trade_count == 3
+
+
+def test_ticker_expires_old_minutes():
+    ticker = RollingTicker("BTC/USDT")
+    ticker.apply_trade(Decimal("200"), Decimal("1"), T0)
+    ticker.apply_trade(Decimal("100"), Decimal("2"), T0 + timedelta(hours=12))
+
+    stats = ticker.snapshot(T0 + timedelta(minutes=WINDOW_MINUTES))
+    assert stats.high == Decimal("100")
+    assert stats.volume == Decimal("2")
+    assert stats.trade_count == 1
+    # Last price survives the window
+    assert stats.last_price == Decimal("100")
+
+
+def test_ticker_expires_everything_after_long_gap():
+    ticker = RollingTicker("BTC/USDT")
+    ticker.apply_trade(Decimal("100"), Decimal("1"), T0)
+
+    stats = ticker.snapshot(T0 + timedelta(days=3))
+    assert stats.volume == Decimal("0")
+    assert stats.high is None
+    assert stats.last_price == Decimal("100")
+
+
+def test_ticker_late_trade_updates_extremes():
+    ticker = RollingTicker("BTC/USDT")
+    ticker.apply_trade(Decimal("100"), Decimal("1"), T0 + timedelta(minutes=10))
+    ticker.apply_trade(Decimal("150"), Decimal("1"), T0 + timedelta(minutes=5))
+
+    stats = ticker.snapshot(T0 + timedelta(minutes=10))
+    assert stats.high == Decimal("150")
+    assert stats.low == Decimal("100")
+    assert stats.last_price == Decimal("100")
+    assert stats.volume == Decimal("2")
+
+
+def test_ticker_ignores_trades_older_than_window():
+    ticker = RollingTicker("BTC/USDT")
+    ticker.apply_trade(Decimal("100"), Decimal("1"), T0 + timedelta(days=2))
+    ticker.apply_trade(Decimal("999"), Decimal("1"), T0)
+
+    stats = ticker.snapshot(T0 + timedelta(days=2))
+    assert stats.high == Decimal("100")
+    assert stats.volume == Decimal("1")
+
+
+def test_ticker_book_snapshots():
+    book = TickerBook()
+    book.apply_trade("BTC/USDT", Decimal("100"), Decimal("1"), T0)
+    book.apply_trade("ETH/USDT", Decimal("10"), Decimal("1"), T0)
+
+    assert book.snapshot("SOL/USDT", T0) is None
+    assert {s.symbol for s in book.snapshots(T0)} == {"BTC/USDT", "ETH/USDT"}
+
+
+# ============= Ticker Endpoint Tests =============
+def test_get_ticker_endpoint(client):
+    now = datetime.now(timezone.utc)
+    market_data.ticker_book.apply_trade("BTC/USDT", Decimal("100"), Decimal("2"), now)
+
+    resp = client.get("/api/markets/BTC-USDT/ticker")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert Decimal(body["last_price"]) == Decimal("100")
+    assert Decimal(body["volume"]) == Decimal("2")
+    assert Decimal(body["vwap"]) == Decimal("100")
+
+
+def test_get_ticker_without_trades_is_empty(client):
+    resp = client.get("/api/markets/SOL-USDT/ticker")
+    assert resp.status_code == 200
+    assert resp.json()["last_price"] is None
+    assert resp.json()["trade_count"] == 0
+
+
+def test_get_ticker_unlisted_symbol(client):
+    resp = client.get("/api/markets/DOGE-USDT/ticker")
+    assert resp.status_code == 404
+
+
+def test_get_all_tickers_endpoint(client):
+    now = datetime.now(timezone.utc)
+    market_data.ticker_book.apply_trade("BTC/USDT", Decimal("100"), Decimal("1"), now)
+    market_data.ticker_book.apply_trade("ETH/USDT", Decimal("10"), Decimal("1"), now)
+
+    resp = client.get("/api/markets/ticker")
+    assert resp.status_code == 200
+    assert {t["symbol"] for t in resp.json()} == {"BTC/USDT", "ETH/USDT"}
@@ -0,0 +1,69 @@
+"""Tests for the verified-JWT cache"""
+
+from datetime import timedelta
+
+from trading.api import auth
+from trading.api.auth import create_access_token
+from trading.api.token_cache import TokenCache, token_cache
+
+CLAIMS = {"sub": "alice", "exp": 100}
+
+
+# ============= Cache Tests =============
+
+
+def test_hit_until_expiry():
+    cache = TokenCache()
+    cache.put("t1", CLAIMS)
+
+    assert cache.get("t1", now=50) is CLAIMS
+    assert cache.get("t1", now=100) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = TokenCache(max_entries=2)
+    cache.put("t1", CLAIMS)
+    cache.put("t2", CLAIMS)
+    cache.get("t1", now=0)
+    cache.put("t3", CLAIMS)
+
+    # t2 was least recently used
+    assert cache.get("t2", now=0) is None
+    assert cache.get("t1", now=0) is CLAIMS
+    assert cache.stats()["evictions"] == 1
+
+
+def test_token_without_exp_not_cached():
+    cache = TokenCache()
+    cache.put("t1", {"sub": "alice"})
+    assert len(cache) == 0
+
+
+# ============= API Tests =============
+
+
+def test_repeat_requests_skip_jwt_decode(client, monkeypatch):
+    token = create_access_token({"sub": "LeonArif"}, timedelta(minutes=5))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/api/balances/", headers=headers).status_code == 200
+
+    calls = []
+    original = auth.jwt.decode
+    monkeypatch.setattr(
+        auth.jwt, "decode", lambda *a, **kw: calls.append(1) or original(*a, **kw)
+    )
+    assert client.get("/api/balances/", headers=headers).status_code == 200
+    assert calls == []
+    assert token_cache.stats()["hits"] == 1
+
+
+def test_expired_token_rejected(client):
+    token = create_access_token({"sub": "LeonArif"}, timedelta(seconds=-1))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/api/balances/", headers=headers).status_code == 401
+    assert len(token_cache) == 0
@@ -0,0 +1,131 @@
+"""Tests for Trade domain entity and TradeRepository"""
+
+from decimal import Decimal
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from trading.infrastructure.repository import OrderRepository, TradeRepository
+from trading.infrastructure import models  # Import to register models
+from trading.domain.order import Order
+from trading.domain.trade import Trade
+from trading.domain.value_objects import Money, TradingPair, OrderSide
+from trading.domain.exceptions import InvalidTradeException, TradeNotFoundException
+
+
+TEST_DATABASE_URL = "sqlite:///:memory:"
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+
+@pytest.fixture
+def db_session():
+    """Create a fresh database session for each test"""
+    Base.metadata.create_all(bind=test_engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=test_engine)
+
+
+@pytest.fixture
+def trade_repo(db_session):
+    return TradeRepository(db_session)
+
+
+def make_trade(buyer="alice", seller="bob", symbol="BTC/USDT", **kwargs):
+    pair = TradingPair.from_symbol(symbol)
+    return Trade.create(
+        trading_pair=pair,
+        buy_order_id=kwargs.get("buy_order_id", "ORD-BUY"),
+        sell_order_id=kwargs.get("sell_order_id", "ORD-SELL"),
+        buyer_user_id=buyer,
+        seller_user_id=seller,
+        price=Money(kwargs.get("price", Decimal("50000")), pair.quote_currency),
+        quantity=kwargs.get("quantity", Decimal("0.5")),
+        executed_at=kwargs.get("executed_at"),
+    )
+
+
+# ============= Trade Domain Tests =============
+def test_trade_create_generates_id():
+    trade = make_trade()
+
+    assert trade.trade_id.startswith("TRD-")
+    assert trade.quote_quantity == Money(Decimal("25000"), "USDT")
+    assert trade.involves("alice")
+    assert trade.involves("bob")
+    assert not trade.involves("carol")
+
+
+def test_trade_create_rejects_zero_quantity():
+    with pytest.raises(InvalidTradeException):
+        make_trade(quantity=Decimal("0"))
+
+
+def test_trade_create_rejects_self_match():
+    with pytest.raises(InvalidTradeException):
+        make_trade(buy_order_id="ORD-1", sell_order_id="ORD-1")
+
+
+# ============= Trade Repository Tests =============
+def test_trade_repository_save_and_find(trade_repo, db_session):
+    trade = make_trade()
+    trade_repo.save(trade)
+    db_session.commit()
+
+    saved = trade_repo.find_by_id(trade.trade_id)
+    assert saved.price.amount == Decimal("50000")
+    assert saved.quantity == Decimal("0.5")
+    assert saved.trading_pair.symbol == "BTC/USDT"
+
+
+def test_trade_repository_find_by_id_not_found(trade_repo):
+    with pytest.raises(TradeNotFoundException):
+        trade_repo.find_by_id("TRD-MISSING")
+
+
+def test_trade_repository_find_by_symbol(trade_repo, db_session):
+    trade_repo.save(make_trade(symbol="BTC/USDT"))
+    trade_repo.save(make_trade(symbol="ETH/USDT"))
+    db_session.commit()
+
+    trades = trade_repo.find_by_symbol("ETH/USDT")
+    assert len(trades) == 1
+    assert trades[0].trading_pair.symbol == "ETH/USDT"
+
+
+def test_trade_repository_iter_by_user_id_both_sides(trade_repo, db_session):
+    now = datetime.now(timezone.utc)
+    trade_repo.save(make_trade(buyer="alice", seller="bob", executed_at=now))
+    trade_repo.save(
+        make_trade(buyer="bob", seller="alice", executed_at=now + timedelta(seconds=1))
+    )
+    trade_repo.save(make_trade(buyer="bob", seller="carol"))
+    db_session.commit()
+
+    trades = list(trade_repo.iter_by_user_id("alice", batch_size=1))
+    assert len(trades) == 2
+    # Newest first
+    assert trades[0].buyer_user_id == "bob"
+
+
+def test_order_repository_iter_by_user_id_with_symbol(db_session):
+    order_repo = OrderRepository(db_session)
+    for symbol in ["BTC/USDT", "ETH/USDT", "BTC/USDT"]:
+        order_repo.save(
+            Order.place_limit_order(
+                "alice", symbol, OrderSide.BUY, Decimal("100"), Decimal("1")
+            )
+        )
+    db_session.commit()
+
+    assert len(list(order_repo.iter_by_user_id("alice", batch_size=2))) == 3
+    assert len(list(order_repo.iter_by_user_id("alice", symbol="BTC/USDT"))) == 2
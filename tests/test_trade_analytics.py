@@ -0,0 +1,141 @@
+"""Tests for vectorized trade analytics"""
+
+from decimal import Decimal
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from trading.application.trade_analytics import (
+    TRADE_DTYPE,
+    TradeAnalytics,
+    fee_totals,
+    summarize,
+    volume_profile,
+    vwap,
+)
+from trading.domain.trade import Trade
+from trading.domain.value_objects import Money, TradingPair
+from trading.infrastructure import models  # Import to register models
+from trading.infrastructure.repository import TradeRepository
+
+
+TEST_DATABASE_URL = "sqlite:///:memory:"
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+DAY = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=test_engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=test_engine)
+
+
+def save_trade(repo, price, quantity, executed_at, symbol="BTC/USDT", fee="0"):
+    pair = TradingPair.from_symbol(symbol)
+    trade = Trade.create(
+        trading_pair=pair,
+        buy_order_id="ORD-B",
+        sell_order_id="ORD-S",
+        buyer_user_id="alice",
+        seller_user_id="bob",
+        price=Money(Decimal(price), pair.quote_currency),
+        quantity=Decimal(quantity),
+        executed_at=executed_at,
+    )
+    trade.buyer_fee = Decimal(fee)
+    trade.seller_fee = Decimal(fee)
+    repo.save(trade)
+
+
+def make_array(rows):
+    return np.array(rows, dtype=TRADE_DTYPE)
+
+
+# ============= Vectorized Function Tests =============
+def test_vwap():
+    trades = make_array([(100.0, 1.0, 0, 0, 0), (110.0, 3.0, 0, 0, 0)])
+    assert vwap(trades) == pytest.approx(107.5)
+
+
+def test_vwap_empty():
+    assert vwap(make_array([])) is None
+
+
+def test_volume_profile_buckets_prices():
+    trades = make_array(
+        [(100.2, 1.0, 0, 0, 0), (100.8, 2.0, 0, 0, 0), (102.5, 4.0, 0, 0, 0)]
+    )
+    levels, volumes = volume_profile(trades, price_step=1.0)
+
+    assert levels.tolist() == [100.0, 102.0]
+    assert volumes.tolist() == [3.0, 4.0]
+
+
+def test_fee_totals_per_currency():
+    trades = make_array([(100.0, 1.0, 0.5, 0.25, 0), (200.0, 1.0, 0.5, 0.25, 0)])
+    assert fee_totals(trades) == {
+        "buyer_base": 1.0,
+        "seller_quote": 0.5,
+        # 0.5 BTC at 100 + 0.5 BTC at 200, plus the quote fees
+        "total_quote": 150.5,
+    }
+
+
+def test_summarize_empty():
+    report = summarize(make_array([]))
+    assert report["trade_count"] == 0
+    assert report["vwap"] is None
+
+
+# ============= Loading Tests =============
+def test_load_filters_symbol_and_range(db_session):
+    repo = TradeRepository(db_session)
+    save_trade(repo, "100", "1", DAY + timedelta(hours=1))
+    save_trade(repo, "105", "2", DAY + timedelta(hours=2))
+    save_trade(repo, "999", "1", DAY + timedelta(days=1, hours=1))
+    save_trade(repo, "10", "1", DAY + timedelta(hours=1), symbol="ETH/USDT")
+    db_session.commit()
+
+    trades = TradeAnalytics(db_session).load("BTC/USDT", DAY, DAY + timedelta(days=1))
+
+    assert trades.dtype == TRADE_DTYPE
+    assert trades["price"].tolist() == [100.0, 105.0]
+    assert trades["timestamp"][0] == np.datetime64("2024-03-01T01:00:00", "ms")
+
+
+def test_daily_report(db_session):
+    repo = TradeRepository(db_session)
+    save_trade(repo, "100", "1", DAY + timedelta(hours=1), fee="0.1")
+    save_trade(repo, "120", "1", DAY + timedelta(hours=2), fee="0.1")
+    save_trade(repo, "90", "2", DAY + timedelta(hours=3), fee="0.1")
+    db_session.commit()
+
+    report = TradeAnalytics(db_session).daily_report("BTC/USDT", DAY, price_step=10)
+
+    assert report["date"] == "2024-03-01"
+    assert report["trade_count"] == 3
+    assert report["volume"] == pytest.approx(4.0)
+    assert report["vwap"] == pytest.approx(100.0)
+    assert (report["open"], report["high"], report["low"], report["close"]) == (
+        100.0,
+        120.0,
+        90.0,
+        90.0,
+    )
+    assert report["fees"]["buyer_base"] == pytest.approx(0.3)
+    assert report["fees"]["seller_quote"] == pytest.approx(0.3)
+    assert report["fees"]["total_quote"] == pytest.approx(0.1 * 310 + 0.3)
+    assert [level["price"] for level in report["volume_profile"]] == [90, 100, 120]
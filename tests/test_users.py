@@ -0,0 +1,202 @@
+"""Tests for the persistent user store and its cache"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from trading.application.users import (
+    UserCache,
+    UserService,
+    bootstrap_admin,
+)
+from trading.domain.exceptions import (
+    UserAlreadyExistsException,
+    UserNotFoundException,
+    UserValidationException,
+)
+from trading.domain.user import User, ROLE_ADMIN
+from trading.infrastructure import models  # Import to register models
+from trading.infrastructure.repository import UserRepository
+
+
+TEST_DATABASE_URL = "sqlite:///:memory:"
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+
+@pytest.fixture
+def db_session():
+    Base.metadata.create_all(bind=test_engine)
+    db = TestingSessionLocal()
+    yield db
+    db.close()
+    Base.metadata.drop_all(bind=test_engine)
+
+
+def get_token(client, username="LeonArif", password="password123"):
+    resp = client.post("/api/token", data={"username": username, "password": password})
+    assert resp.status_code == 200
+    return resp.json()["access_token"]
+
+
+# ============= Domain Tests =============
+
+
+def test_user_rejects_unknown_role():
+    with pytest.raises(UserValidationException):
+        User.create("alice", "hash", role="superuser")
+
+
+def test_user_requires_username():
+    with pytest.raises(UserValidationException):
+        User.create(" ", "hash")
+
+
+# ============= Service Tests =============
+
+
+def test_bootstrap_admin_is_idempotent(db_session):
+    admin = bootstrap_admin(TestingSessionLocal, "root", "s3cret-admin")
+    again = bootstrap_admin(TestingSessionLocal, "other", "s3cret-admin")
+
+    assert admin.role == ROLE_ADMIN
+    assert again is None
+    assert UserRepository(db_session).count() == 1
+
+
+def test_bootstrap_admin_needs_credentials(db_session):
+    assert bootstrap_admin(TestingSessionLocal, None, None) is None
+    assert UserRepository(db_session).count() == 0
+
+    with pytest.raises(UserValidationException):
+        bootstrap_admin(TestingSessionLocal, "root", "short")
+    assert UserRepository(db_session).count() == 0
+
+
+def test_no_admin_ships_with_the_code(db_session):
+    # Module defaults come from the environment, which tests leave unset
+    bootstrap_admin(TestingSessionLocal)
+    assert UserRepository(db_session).find_by_username("LeonArif") is None
+
+
+def test_find_hits_cache_after_first_lookup(db_session):
+    bootstrap_admin(TestingSessionLocal, "LeonArif", "password123")
+    cache = UserCache()
+    service = UserService(db_session, cache)
+
+    assert service.find("LeonArif")["role"] == ROLE_ADMIN
+    assert service.find("LeonArif")["role"] == ROLE_ADMIN
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+    assert service.find("nobody") is None
+
+
+def test_role_change_invalidates_on_commit(db_session):
+    cache = UserCache()
+    service = UserService(db_session, cache)
+    UserRepository(db_session).save(User.create("alice", "hash"))
+    db_session.commit()
+    assert service.find("alice")["role"] == "user"
+
+    service.change_role("alice", ROLE_ADMIN)
+    assert cache.get("alice")["role"] == "user"
+
+    db_session.commit()
+    assert cache.get("alice") is None
+    assert service.find("alice")["role"] == ROLE_ADMIN
+
+
+def test_stale_lookup_cannot_repopulate_cache():
+    cache = UserCache()
+    generation = cache.generation("alice")
+    cache.invalidate("alice")
+
+    cache.put("alice", {"username": "alice", "role": "user"}, generation)
+    assert cache.get("alice") is None
+
+
+def test_change_role_unknown_user(db_session):
+    with pytest.raises(UserNotFoundException):
+        UserService(db_session, UserCache()).change_role("ghost", ROLE_ADMIN)
+
+
+def test_register_duplicate_user(db_session):
+    bootstrap_admin(TestingSessionLocal, "LeonArif", "password123")
+    with pytest.raises(UserAlreadyExistsException):
+        UserService(db_session, UserCache()).register("LeonArif", "password123")
+
+
+# ============= API Tests =============
+
+
+def test_admin_registers_user_who_can_log_in(client):
+    headers = {"Authorization": f"Bearer {get_token(client)}"}
+
+    resp = client.post(
+        "/api/users/",
+        json={"username": "bot1", "password": "botpassword"},
+        headers=headers,
+    )
+    assert resp.status_code == 201
+    assert resp.json()["role"] == "user"
+
+    bot_headers = {
+        "Authorization": f"Bearer {get_token(client, 'bot1', 'botpassword')}"
+    }
+    resp = client.post(
+        "/api/users/",
+        json={"username": "bot2", "password": "botpassword"},
+        headers=bot_headers,
+    )
+    assert resp.status_code == 403
+
+
+def test_role_change_applies_to_existing_token(client):
+    admin_headers = {"Authorization": f"Bearer {get_token(client)}"}
+    client.post(
+        "/api/users/",
+        json={"username": "bot1", "password": "botpassword"},
+        headers=admin_headers,
+    )
+    bot_headers = {
+        "Authorization": f"Bearer {get_token(client, 'bot1', 'botpassword')}"
+    }
+    assert client.get("/api/pairs/").status_code == 200
+
+    resp = client.put(
+        "/api/users/bot1/role", json={"role": "admin"}, headers=admin_headers
+    )
+    assert resp.status_code == 200
+
+    # Same (cached) token, fresh role
+    resp = client.post("/api/pairs/", json={"symbol": "DOGE/USDT"}, headers=bot_headers)
+    assert resp.status_code == 201
+
+
+def test_change_password(client):
+    headers = {"Authorization": f"Bearer {get_token(client)}"}
+
+    resp = client.put(
+        "/api/users/me/password",
+        json={"current_password": "wrong-password", "new_password": "newpassword"},
+        headers=headers,
+    )
+    assert resp.status_code == 400
+
+    resp = client.put(
+        "/api/users/me/password",
+        json={"current_password": "password123", "new_password": "newpassword"},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+
+    resp = client.post(
+        "/api/token", data={"username": "LeonArif", "password": "password123"}
+    )
+    assert resp.status_code == 401
+    get_token(client, password="newpassword")
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from database import get_db
+from .auth import get_current_user
+from .server_timing import TimedRoute
+from trading.application.manage_api_keys import (
+    CreateApiKeyUseCase,
+    RevokeApiKeyUseCase,
+)
+from trading.application.dto import ApiKeyResponse
+from trading.domain.exceptions import ApiKeyNotFoundException, TradingDomainException
+
+router = APIRouter(prefix="/api/keys", tags=["API Keys"], route_class=TimedRoute)
+
+
+@router.post("/", response_model=ApiKeyResponse, status_code=201)
+def create_api_key(
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    try:
+        use_case = CreateApiKeyUseCase(db)
+        result = use_case.execute(current_user["username"])
+        db.commit()
+        return result
+
+    except TradingDomainException as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/{key_id}", response_model=ApiKeyResponse)
+def revoke_api_key(
+    key_id: str,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    try:
+        use_case = RevokeApiKeyUseCase(db)
+        result = use_case.execute(current_user["username"], key_id)
+        db.commit()
+        return result
+
+    except ApiKeyNotFoundException as e:
+        db.rollback()
+        raise HTTPException(status_code=404, detail=str(e))
+
+    except TradingDomainException as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
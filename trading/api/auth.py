@@ -1,50 +1,52 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Optional
 from jose import JWTError, jwt
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.orm import Session
+
+from database import get_db
+from trading.application.users import UserService, user_cache
+from trading.domain.user import ROLE_ADMIN
+from trading.infrastructure.password_hashing import password_pool
+from trading.infrastructure.request_timing import timed_stage
+from .token_cache import token_cache
 
 SECRET_KEY = "supersecretjwtkeygantilah"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
-# Argon2 password hasher
-ph = PasswordHasher()
-
-# Pre-hashed password untuk "password123"
-# Hash: $argon2id$v=19$m=65536,t=3,p=4$...
-fake_users_db = {
-    "LeonArif": {
-        "username": "LeonArif",
-        # Hash untuk password: password123
-        "hashed_password": "$argon2id$v=19$m=65536,t=3,p=4$zwWjjyzAm4tCUyeeXRCIFw$WvzW2LGByKzgEGiF9dmCPOOu4r/BpYffWUr7kfoc2kk",
-    }
-}
-
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/token")
 
 
-def verify_password(plain: str, hashed: str) -> bool:
-    """Verify password using Argon2"""
-    try:
-        ph.verify(hashed, plain)
-        return True
-    except VerifyMismatchError:
-        return False
-
+async def authenticate_user(
+    session_factory: Callable[[], Session], username: str, password: str
+):
+    """Authenticate user with username and password.
 
-def authenticate_user(username: str, password: str):
-    """Authenticate user with username and password"""
-    user = fake_users_db.get(username)
+    Argon2 runs in the password process pool; raises PasswordPoolSaturated
+    when too many verifications are already queued.
+    """
+    user = user_cache.get(username)
+    if user is None:
+        # Miss: short-lived session in the threadpool, off the event loop
+        user = await run_in_threadpool(_find_user, session_factory, username)
     if not user:
         return False
-    if not verify_password(password, user["hashed_password"]):
+    if not await password_pool.verify(user["hashed_password"], password):
         return False
     return user
 
 
+def _find_user(session_factory: Callable[[], Session], username: str):
+    db = session_factory()
+    try:
+        return UserService(db).find(username)
+    finally:
+        db.close()
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
     to_encode = data.copy()
@@ -58,22 +60,61 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
+def get_current_user(
+    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+):
     """Get current authenticated user from JWT token"""
+    with timed_stage("auth"):
+        return user_from_token(token, db)
+
+
+def user_from_token(token: str, db: Session) -> dict:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
+
+    # Tokens verified earlier are served from cache until they expire
+    payload = token_cache.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
             raise credentials_exception
-    except JWTError:
+        token_cache.put(token, payload)
+
+    username: str = payload.get("sub")
+    if username is None:
         raise credentials_exception
 
-    user = fake_users_db.get(username)
+    # Record comes from the user cache, so role changes apply immediately
+    user = UserService(db).find(username)
     if user is None:
         raise credentials_exception
     return user
+
+
+def user_from_token_session(session_factory: Callable[[], Session], token: str) -> dict:
+    """``user_from_token`` with its own session, for async callers"""
+    db = session_factory()
+    try:
+        return user_from_token(token, db)
+    finally:
+        db.close()
+
+
+def token_expiry(token: str) -> Optional[float]:
+    """``exp`` of a token ``user_from_token`` has already accepted"""
+    expires_at = jwt.get_unverified_claims(token).get("exp")
+    return None if expires_at is None else float(expires_at)
+
+
+def get_current_admin(current_user: dict = Depends(get_current_user)):
+    """Require the authenticated user to have the admin role"""
+    if current_user.get("role") != ROLE_ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
+    return current_user
@@ -1,14 +1,30 @@
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from datetime import timedelta
+from database import get_session_factory
 from .auth import authenticate_user, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
+from .server_timing import TimedRoute
+from trading.infrastructure.password_hashing import PasswordPoolSaturated
 
-router = APIRouter(prefix="/api", tags=["Authentication"])
+router = APIRouter(prefix="/api", tags=["Authentication"], route_class=TimedRoute)
 
 
 @router.post("/token")
-def login(form_data: OAuth2PasswordRequestForm = Depends()):
-    user = authenticate_user(form_data.username, form_data.password)
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    session_factory=Depends(get_session_factory),
+):
+    # async: the event loop only awaits the process pool, no threadpool slot
+    try:
+        user = await authenticate_user(
+            session_factory, form_data.username, form_data.password
+        )
+    except PasswordPoolSaturated:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many concurrent logins, retry shortly",
+            headers={"Retry-After": "1"},
+        )
     if not user:
         raise HTTPException(status_code=401, detail="Incorrect username or password")
 
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from database import get_db
+from .api_key_auth import get_authenticated_user
+from .auth import get_current_admin
+from .server_timing import TimedRoute
+from trading.application.deposit_funds import DepositFundsUseCase
+from trading.application.get_balances import GetBalancesUseCase
+from trading.application.dto import BalanceListResponse, DepositRequest
+from trading.domain.exceptions import TradingDomainException, UserNotFoundException
+
+router = APIRouter(prefix="/api/balances", tags=["Balances"], route_class=TimedRoute)
+
+
+@router.get("/", response_model=BalanceListResponse)
+def get_balances(
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_authenticated_user),
+):
+    try:
+        use_case = GetBalancesUseCase(db)
+        return use_case.execute(current_user["username"])
+
+    except TradingDomainException as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/deposit", response_model=BalanceListResponse)
+def deposit(
+    request: DepositRequest,
+    db: Session = Depends(get_db),
+    admin: dict = Depends(get_current_admin),
+):
+    try:
+        use_case = DepositFundsUseCase(db)
+        result = use_case.execute(request)
+        db.commit()
+        return result
+
+    except UserNotFoundException as e:
+        db.rollback()
+        raise HTTPException(status_code=404, detail=str(e))
+
+    except TradingDomainException as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
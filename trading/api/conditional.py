@@ -0,0 +1,39 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+
+NOT_MODIFIED = 304
+# Clients may reuse a stored copy but must revalidate it every time
+REVALIDATE = "private, no-cache"
+
+
+def make_etag(version: str) -> str:
+    # Weak: the same version always renders the same JSON, but the
+    # guarantee is semantic rather than byte-for-byte
+    return 'W/"' + hashlib.sha1(version.encode()).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison as RFC 9110 requires for If-None-Match"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": REVALIDATE},
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = REVALIDATE
@@ -0,0 +1,90 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from typing import Callable, List, Optional
+
+from database import get_db, get_session_factory
+from .websocket_stream import CLOSE_POLICY_VIOLATION, stream_subscription
+from .server_timing import TimedRoute
+from trading.application.get_candles import GetCandlesUseCase
+from trading.application.get_ticker import GetTickerUseCase
+from trading.application.dto import CandleListResponse, TickerResponse
+from trading.application.market_stream import MarketSubscription, market_events
+from trading.application.pairs import PairRegistryService
+from trading.domain.candle import CandleInterval
+from trading.domain.value_objects import TradingPair
+from trading.domain.exceptions import TradingDomainException
+
+router = APIRouter(prefix="/api/markets", tags=["Markets"], route_class=TimedRoute)
+
+
+def _normalize_symbol(symbol: str) -> str:
+    """Path symbols use BTC-USDT since '/' cannot appear in a path segment"""
+    try:
+        return TradingPair.from_symbol(symbol).symbol
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _listed_symbol(symbol: str, db: Session) -> str:
+    """Only listed pairs have market data; other symbols are a 404"""
+    symbol = _normalize_symbol(symbol)
+    if PairRegistryService(db).find(symbol) is None:
+        raise HTTPException(
+            status_code=404, detail=f"Trading pair not listed: {symbol}"
+        )
+    return symbol
+
+
+def _find_listed(session_factory: Callable[[], Session], symbol: str) -> Optional[str]:
+    try:
+        symbol = TradingPair.from_symbol(symbol).symbol
+    except ValueError:
+        return None
+    db = session_factory()
+    try:
+        return symbol if PairRegistryService(db).find(symbol) else None
+    finally:
+        db.close()
+
+
+@router.get("/{symbol}/candles", response_model=CandleListResponse)
+def get_candles(
+    symbol: str,
+    interval: CandleInterval = Query(CandleInterval.ONE_MINUTE),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    try:
+        use_case = GetCandlesUseCase(db)
+        return use_case.execute(_listed_symbol(symbol, db), interval, limit)
+
+    except TradingDomainException as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/ticker", response_model=List[TickerResponse])
+def get_all_tickers():
+    return GetTickerUseCase().execute_all()
+
+
+@router.get("/{symbol}/ticker", response_model=TickerResponse)
+def get_ticker(symbol: str, db: Session = Depends(get_db)):
+    return GetTickerUseCase().execute(_listed_symbol(symbol, db))
+
+
+@router.websocket("/{symbol}/ws")
+async def market_stream(
+    websocket: WebSocket,
+    symbol: str,
+    session_factory=Depends(get_session_factory),
+):
+    """Public depth + trade stream; starts with a full depth snapshot"""
+    # Every symbol gets a book and snapshot cache, so only listed pairs qualify
+    symbol = await run_in_threadpool(_find_listed, session_factory, symbol)
+    if symbol is None:
+        await websocket.close(code=CLOSE_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    await stream_subscription(websocket, market_events, MarketSubscription(symbol))
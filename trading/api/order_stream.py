@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket
+from fastapi.concurrency import run_in_threadpool
+from typing import Optional
+
+from database import get_session_factory
+from .auth import token_expiry, user_from_token_session
+from .websocket_stream import CLOSE_POLICY_VIOLATION, stream_subscription
+from .server_timing import TimedRoute
+from trading.application.order_events import order_events, order_topic
+from trading.infrastructure.pubsub import Subscription
+
+router = APIRouter(prefix="/api/orders", tags=["Orders"], route_class=TimedRoute)
+
+
+@router.websocket("/ws")
+async def order_updates(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None),
+    session_factory=Depends(get_session_factory),
+):
+    """Push the user's order changes (open, fill, cancel) instead of polling"""
+    # Browsers cannot set headers on a WebSocket, so the token may come as ?token=
+    if token is None:
+        authorization = websocket.headers.get("authorization", "")
+        if authorization.lower().startswith("bearer "):
+            token = authorization[7:]
+    if token is None:
+        await websocket.close(code=CLOSE_POLICY_VIOLATION)
+        return
+
+    try:
+        user = await run_in_threadpool(user_from_token_session, session_factory, token)
+    except HTTPException:
+        await websocket.close(code=CLOSE_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    # The handshake check alone would let a socket outlive its token
+    await stream_subscription(
+        websocket,
+        order_events,
+        Subscription(order_topic(user["username"])),
+        expires_at=token_expiry(token),
+    )
@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from typing import List
+
+from database import get_db
+from .auth import get_current_admin
+from .server_timing import TimedRoute
+from trading.application.manage_pairs import (
+    ListTradingPairsUseCase,
+    SetTradingPairStatusUseCase,
+)
+from trading.application.dto import ListTradingPairRequest, TradingPairResponse
+from trading.domain.exceptions import (
+    InvalidTradingPairException,
+    TradingDomainException,
+)
+
+router = APIRouter(prefix="/api/pairs", tags=["Trading Pairs"], route_class=TimedRoute)
+
+
+@router.get("/", response_model=List[TradingPairResponse])
+def list_pairs(db: Session = Depends(get_db)):
+    try:
+        use_case = ListTradingPairsUseCase(db)
+        return use_case.execute()
+
+    except TradingDomainException as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/", response_model=TradingPairResponse, status_code=201)
+def list_pair(
+    request: ListTradingPairRequest,
+    db: Session = Depends(get_db),
+    admin: dict = Depends(get_current_admin),
+):
+    try:
+        use_case = SetTradingPairStatusUseCase(db)
+        result = use_case.execute(request.symbol, is_active=True, rules=request.rules)
+        db.commit()
+        return result
+
+    except InvalidTradingPairException as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except ValueError as e:
+        # Inconsistent rules, e.g. min_price above max_price
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except TradingDomainException as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/{symbol}", response_model=TradingPairResponse)
+def delist_pair(
+    symbol: str,
+    db: Session = Depends(get_db),
+    admin: dict = Depends(get_current_admin),
+):
+    try:
+        use_case = SetTradingPairStatusUseCase(db)
+        result = use_case.execute(symbol, is_active=False)
+        db.commit()
+        return result
+
+    except InvalidTradingPairException as e:
+        db.rollback()
+        raise HTTPException(status_code=404, detail=str(e))
+
+    except TradingDomainException as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from .auth import get_current_admin
+from .server_timing import TimedRoute
+from trading.infrastructure.sampling_profiler import (
+    MAX_PROFILE_SECONDS,
+    ProfilerBusy,
+    collapse,
+    profiler,
+)
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"], route_class=TimedRoute)
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+def profile(
+    seconds: float = Query(5.0, gt=0, le=MAX_PROFILE_SECONDS),
+    interval_ms: float = Query(5.0, ge=1, le=100),
+    include_idle: bool = Query(False),
+    min_count: int = Query(1, ge=1),
+    admin: dict = Depends(get_current_admin),
+):
+    """Sample the live process and return collapsed stacks for a flamegraph.
+
+    Runs in the threadpool for ``seconds``; the rest of the process keeps
+    serving requests and is what gets profiled.
+    """
+    try:
+        stacks = profiler.profile(seconds, interval_ms / 1000, include_idle)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    return PlainTextResponse("\n".join(collapse(stacks, min_count)) + "\n")
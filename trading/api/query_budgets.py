@@ -0,0 +1,60 @@
+"""Checks each request's SQL statement and row counts against its route budget.
+
+Off unless ``QUERY_BUDGET_MODE`` is ``warn`` or ``raise``; when off the
+counting hooks see no counter and cost one context lookup per statement.
+"""
+
+from trading.infrastructure.query_budget import (
+    QueryBudget,
+    QueryBudgets,
+    current_counter,
+    query_budgets,
+)
+
+# Hot order paths get tight statement budgets, so an extra lookup per
+# order (N+1) or per save fails the suite as soon as it is introduced
+query_budgets.set_route("/api/orders/", QueryBudget(max_statements=6))
+query_budgets.set_route("/api/orders/{order_id}", QueryBudget(max_statements=6))
+
+# Exports stream whole histories by design; only their statements count
+query_budgets.set_route("/api/orders/export", QueryBudget(max_rows=None))
+query_budgets.set_route("/api/trades/export", QueryBudget(max_rows=None))
+
+
+class QueryBudgetMiddleware:
+    def __init__(self, app, budgets: QueryBudgets = query_budgets):
+        self.app = app
+        self.budgets = budgets
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.budgets.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        token = self.budgets.start()
+        counter = current_counter()
+        over_budget = False
+
+        def check(can_fail: bool) -> bool:
+            route = scope.get("route")
+            return self.budgets.check(
+                scope["method"],
+                route.path if route is not None else None,
+                counter,
+                can_fail,
+            )
+
+        async def checked_send(message):
+            nonlocal over_budget
+            # Before the status goes out, so raise mode can still fail it
+            if message["type"] == "http.response.start":
+                over_budget = check(can_fail=True)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, checked_send)
+            # Streamed bodies keep querying after the start; too late to fail
+            if not over_budget:
+                check(can_fail=False)
+        finally:
+            self.budgets.end(token)
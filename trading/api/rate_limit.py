@@ -0,0 +1,247 @@
+"""In-process token-bucket admission control.
+
+Runs as plain ASGI middleware, ahead of routing, dependencies and the DB
+session, so a client over budget costs one dict lookup and a 429.
+
+The per-class bucket is keyed by user, but only when the credential was
+already verified by an earlier request: a bearer token found in the token
+cache, or an API key id in the key index. Logins and unknown, missing or
+forged credentials share their address's bucket, so rotating header
+values never buys a fresh budget. Those unverified requests can also be
+held to a ceiling per address across all classes.
+
+Configuration (environment):
+    RATE_LIMIT_CLIENT_CEILING    "rate/burst" per address, e.g. "50/100";
+                                 unset (default) disables the ceiling
+    RATE_LIMIT_TRUSTED_PROXIES   comma-separated proxy addresses whose
+                                 X-Forwarded-For header is believed
+"""
+
+import json
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from trading.application.api_keys import api_key_index
+from .token_cache import token_cache
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    rate: float  # tokens per second
+    burst: int  # bucket capacity
+
+
+class TokenBucket:
+    __slots__ = ("tokens", "updated_at")
+
+    def __init__(self, capacity: float, now: float):
+        self.tokens = capacity
+        self.updated_at = now
+
+    def take(self, limit: RateLimit, now: float) -> float:
+        """Consume one token; returns 0 when admitted, else seconds to wait"""
+        self.tokens = min(
+            limit.burst, self.tokens + (now - self.updated_at) * limit.rate
+        )
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / limit.rate
+
+
+CLIENT_CEILING = "client"
+
+
+def parse_limit(text: Optional[str]) -> Optional[RateLimit]:
+    """``"50/100"`` -> RateLimit(rate=50, burst=100); empty -> None"""
+    if not text:
+        return None
+    rate, _, burst = text.partition("/")
+    return RateLimit(rate=float(rate), burst=int(burst or rate))
+
+
+# Behind a proxy every client shares one address, so this is opt-in
+RATE_LIMIT_CLIENT_CEILING = parse_limit(os.getenv("RATE_LIMIT_CLIENT_CEILING"))
+RATE_LIMIT_TRUSTED_PROXIES: FrozenSet[str] = frozenset(
+    address.strip()
+    for address in os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "").split(",")
+    if address.strip()
+)
+
+# Separate budgets so a flood of one kind cannot eat into another
+DEFAULT_LIMITS: Dict[str, RateLimit] = {
+    "place": RateLimit(rate=10, burst=20),
+    "cancel": RateLimit(rate=10, burst=20),
+    "query": RateLimit(rate=20, burst=40),
+    "login": RateLimit(rate=1, burst=5),
+}
+if RATE_LIMIT_CLIENT_CEILING is not None:
+    # Per address across all of the classes above, for unverified requests
+    DEFAULT_LIMITS[CLIENT_CEILING] = RATE_LIMIT_CLIENT_CEILING
+
+# Drop idle buckets every this many decisions to bound memory
+PRUNE_EVERY = 10000
+
+
+class RateLimiter:
+    """Buckets per (client key, endpoint class); single event-loop thread"""
+
+    def __init__(self, limits: Optional[Dict[str, RateLimit]] = None):
+        self._configured = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.limits = dict(self._configured)
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._decisions = 0
+        self.rejected = 0
+
+    def check(self, key: str, endpoint_class: str, now: float = None) -> float:
+        limit = self.limits.get(endpoint_class)
+        if limit is None:
+            return 0.0
+
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get((key, endpoint_class))
+        if bucket is None:
+            bucket = self._buckets[(key, endpoint_class)] = TokenBucket(
+                limit.burst, now
+            )
+
+        self._decisions += 1
+        if self._decisions % PRUNE_EVERY == 0:
+            self._prune(now)
+
+        wait = bucket.take(limit, now)
+        if wait:
+            self.rejected += 1
+        return wait
+
+    def _prune(self, now: float):
+        # A bucket idle long enough to have refilled is the same as a new one
+        self._buckets = {
+            (key, cls): bucket
+            for (key, cls), bucket in self._buckets.items()
+            if cls in self.limits
+            and now - bucket.updated_at < self.limits[cls].burst / self.limits[cls].rate
+        }
+
+    def clear(self):
+        self.limits = dict(self._configured)
+        self._buckets.clear()
+        self._decisions = 0
+        self.rejected = 0
+
+
+rate_limiter = RateLimiter()
+
+
+def classify(method: str, path: str) -> Optional[str]:
+    """Endpoint class of a request, or None if it is not rate limited"""
+    if path == "/api/token":
+        return "login" if method == "POST" else None
+    if not path.startswith("/api/"):
+        return None
+    if method == "POST" and path.rstrip("/") == "/api/orders":
+        return "place"
+    if method == "DELETE" and path.startswith("/api/orders/"):
+        return "cancel"
+    if method == "GET":
+        return "query"
+    return None
+
+
+def client_address(
+    scope, trusted_proxies: FrozenSet[str] = RATE_LIMIT_TRUSTED_PROXIES
+) -> Optional[str]:
+    """Peer address, or the client a trusted proxy forwarded the request for"""
+    client = scope.get("client")
+    address = client[0] if client else None
+    if address not in trusted_proxies:
+        return address
+
+    forwarded = [
+        value.decode("latin-1")
+        for name, value in scope["headers"]
+        if name == b"x-forwarded-for"
+    ]
+    hops = [hop.strip() for value in forwarded for hop in value.split(",")]
+    # Rightmost hop not added by one of our own proxies; the rest is spoofable
+    for hop in reversed(hops):
+        if hop and hop not in trusted_proxies:
+            return hop
+    return address
+
+
+def address_key(
+    scope, trusted_proxies: FrozenSet[str] = RATE_LIMIT_TRUSTED_PROXIES
+) -> str:
+    address = client_address(scope, trusted_proxies)
+    return f"ip:{address}" if address else "ip:unknown"
+
+
+def client_key(
+    scope,
+    endpoint_class: Optional[str] = None,
+    trusted_proxies: FrozenSet[str] = RATE_LIMIT_TRUSTED_PROXIES,
+) -> str:
+    """User behind an already verified credential, else the client address"""
+    if endpoint_class != "login":
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                claims = token_cache.peek(token) if scheme.lower() == "bearer" else None
+                if claims is not None and claims.get("sub"):
+                    return f"user:{claims['sub']}"
+            elif name == b"x-api-key":
+                api_key = api_key_index.get(value.decode("latin-1"))
+                if api_key is not None:
+                    return f"user:{api_key.username}"
+    return address_key(scope, trusted_proxies)
+
+
+class RateLimitMiddleware:
+    def __init__(
+        self,
+        app,
+        limiter: RateLimiter = rate_limiter,
+        trusted_proxies: FrozenSet[str] = RATE_LIMIT_TRUSTED_PROXIES,
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.trusted_proxies = trusted_proxies
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        endpoint_class = classify(scope["method"], scope["path"])
+        if endpoint_class is not None:
+            key = client_key(scope, endpoint_class, self.trusted_proxies)
+            # Verified users already have their own buckets
+            wait = (
+                key.startswith("ip:") and self.limiter.check(key, CLIENT_CEILING)
+            ) or self.limiter.check(key, endpoint_class)
+            if wait:
+                await _reject(send, wait)
+                return
+
+        await self.app(scope, receive, send)
+
+
+async def _reject(send, wait: float):
+    body = json.dumps({"detail": "Rate limit exceeded"}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(math.ceil(wait)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,43 @@
+"""Per-route request latency, recorded as plain ASGI middleware.
+
+Requests are labelled with the matched route template (``/api/orders/{order_id}``),
+never the raw path, so order ids cannot blow up the label set.
+"""
+
+import time
+
+from trading.infrastructure.metrics import Histogram, request_duration
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app, histogram: Histogram = request_duration):
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Routing fills in scope["route"] on the way down
+            route = scope.get("route")
+            self.histogram.observe(
+                time.perf_counter() - start,
+                scope["method"],
+                route.path if route is not None else UNMATCHED_ROUTE,
+                str(status),
+            )
@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from database import get_db
-from .auth import get_current_user
+from database import get_db, get_session_factory
+from .api_key_auth import get_authenticated_user
+from .conditional import etag_matches, make_etag, not_modified, set_etag
+from .streaming import ndjson_export_response
+from .server_timing import TimedRoute
 from trading.application.place_order import PlaceOrderUseCase
 from trading.application.cancel_order import CancelOrderUseCase
 from trading.application.get_order import GetOrderUseCase
 from trading.application.list_orders import ListOrdersUseCase
+from trading.application.export_history import ExportOrdersUseCase
 from trading.application.dto import (
     PlaceOrderRequest,
     CancelOrderRequest,
@@ -22,17 +26,21 @@ from trading.domain.exceptions import (
     InvalidPriceException,
     InvalidQuantityException,
     UnauthorizedOrderAccessException,
+    InsufficientBalanceException,
+    InvalidTradingPairException,
+    TradingPairNotActiveException,
+    PriceOutOfRangeException,
     TradingDomainException,
 )
 
-router = APIRouter(prefix="/api/orders", tags=["Orders"])
+router = APIRouter(prefix="/api/orders", tags=["Orders"], route_class=TimedRoute)
 
 
 @router.post("/", response_model=OrderResponse, status_code=201)
 def place_order(
     request: PlaceOrderRequest,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(get_authenticated_user),
 ):
     try:
         if request.user_id != current_user["username"]:
@@ -49,6 +57,10 @@ def place_order(
         InvalidPriceException,
         InvalidQuantityException,
         OrderValidationException,
+        InsufficientBalanceException,
+        InvalidTradingPairException,
+        TradingPairNotActiveException,
+        PriceOutOfRangeException,
     ) as e:
         db.rollback()
         raise HTTPException(status_code=400, detail=str(e))
@@ -58,12 +70,32 @@ def place_order(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/export")
+def export_orders(
+    user_id: str = Query(...),
+    symbol: Optional[str] = Query(None),
+    gzip: bool = Query(False),
+    session_factory=Depends(get_session_factory),
+    current_user: dict = Depends(get_authenticated_user),
+):
+    if user_id != current_user["username"]:
+        raise HTTPException(
+            status_code=403, detail="Cannot export another user's orders"
+        )
+
+    return ndjson_export_response(
+        session_factory, ExportOrdersUseCase, user_id, symbol, gzip
+    )
+
+
 @router.get("/{order_id}", response_model=OrderDetailResponse)
 def get_order(
     order_id: str,
+    response: Response,
     user_id: str = Query(...),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(get_authenticated_user),
 ):
     try:
         if user_id != current_user["username"]:
@@ -72,6 +104,13 @@ def get_order(
             )
 
         use_case = GetOrderUseCase(db)
+        # Pollers mostly see unchanged orders: answer those from the version
+        # alone, before the row is loaded or serialized
+        etag = make_etag(use_case.version(order_id, user_id))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        set_etag(response, etag)
         return use_case.execute(order_id, user_id)
 
     except OrderNotFoundException as e:
@@ -86,10 +125,12 @@ def get_order(
 
 @router.get("/", response_model=OrderListResponse)
 def list_orders(
+    response: Response,
     user_id: str = Query(...),
     symbol: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(get_authenticated_user),
 ):
     try:
         if user_id != current_user["username"]:
@@ -98,6 +139,11 @@ def list_orders(
             )
 
         use_case = ListOrdersUseCase(db)
+        etag = make_etag(use_case.version(user_id, symbol))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        set_etag(response, etag)
         return use_case.execute(user_id, symbol)
 
     except TradingDomainException as e:
@@ -109,7 +155,7 @@ def cancel_order(
     order_id: str,
     user_id: str = Query(...),
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(get_authenticated_user),
 ):
     try:
         if user_id != current_user["username"]:
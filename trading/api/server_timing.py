@@ -0,0 +1,164 @@
+"""Server-Timing breakdown of every HTTP request.
+
+``ServerTimingMiddleware`` opens the request's timings and reports them in
+a ``Server-Timing`` header and a structured ``trading.request`` log record.
+``TimedRoute`` splits the route itself into validation (body parsing,
+pydantic and dependencies, minus auth), the handler, and response
+serialization. Auth, repository (``db``) and commit time are added by
+hooks further down. Stages may overlap: ``db`` includes lookups made while
+authenticating.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from typing import Callable
+
+from fastapi.routing import APIRoute
+
+from trading.infrastructure.request_timing import (
+    RequestTimings,
+    current_timings,
+    end_request,
+    start_request,
+)
+
+logger = logging.getLogger("trading.request")
+
+STAGE_ORDER = ("auth", "validation", "handler", "db", "commit", "serialize")
+
+
+class ServerTimingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_request()
+        timings = current_timings()
+        start = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total = time.perf_counter() - start
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", _header(timings, total).encode()))
+                message = {**message, "headers": headers}
+                _log(scope, message["status"], timings, total)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request(token)
+
+
+class TimedRoute(APIRoute):
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _marked(endpoint), **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            timings = current_timings()
+            if timings is None:
+                return await handler(request)
+
+            timings.route = self.path
+            start = time.perf_counter()
+            response = await handler(request)
+            end = time.perf_counter()
+
+            # Both marks are missing when a dependency rejected the request
+            entered = timings.marks.get("endpoint_start")
+            returned = timings.marks.get("endpoint_end")
+            if entered is not None and returned is not None:
+                auth = timings.stages.get("auth", 0.0)
+                timings.add("validation", max(0.0, entered - start - auth))
+                timings.add("handler", returned - entered)
+                timings.add("serialize", end - returned)
+            return response
+
+        return timed_handler
+
+
+def _marked(endpoint: Callable) -> Callable:
+    """Wrap an endpoint to mark when it starts and returns.
+
+    ``functools.wraps`` keeps the signature visible to FastAPI, and the
+    wrapper stays sync or async like the endpoint so it runs where it did.
+    ``include_router`` rebuilds routes from their (already wrapped)
+    endpoints, so a marked endpoint is returned as is.
+    """
+    if getattr(endpoint, "_timing_marked", False):
+        return endpoint
+
+    if asyncio.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            timings = current_timings()
+            if timings is not None:
+                timings.mark("endpoint_start")
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                if timings is not None:
+                    timings.mark("endpoint_end")
+
+        async_wrapper._timing_marked = True
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        timings = current_timings()
+        if timings is not None:
+            timings.mark("endpoint_start")
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            if timings is not None:
+                timings.mark("endpoint_end")
+
+    wrapper._timing_marked = True
+    return wrapper
+
+
+def _stages_ms(timings: RequestTimings, total: float) -> dict:
+    stages = {
+        stage: round(timings.stages[stage] * 1000, 3)
+        for stage in STAGE_ORDER
+        if stage in timings.stages
+    }
+    stages["total"] = round(total * 1000, 3)
+    return stages
+
+
+def _header(timings: RequestTimings, total: float) -> str:
+    return ", ".join(
+        f"{stage};dur={duration}"
+        for stage, duration in _stages_ms(timings, total).items()
+    )
+
+
+def _log(scope, status: int, timings: RequestTimings, total: float):
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    route = scope.get("route")
+    logger.info(
+        "%s %s %s",
+        scope["method"],
+        scope["path"],
+        status,
+        extra={
+            "method": scope["method"],
+            "route": route.path if route is not None else None,
+            "status": status,
+            "timings_ms": _stages_ms(timings, total),
+        },
+    )
@@ -0,0 +1,32 @@
+from typing import Callable, Optional
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from trading.application.export_history import encode_ndjson
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def ndjson_export_response(
+    session_factory: Callable[[], Session],
+    use_case_cls,
+    user_id: str,
+    symbol: Optional[str] = None,
+    gzip: bool = False,
+) -> StreamingResponse:
+    """Stream an export use case as NDJSON.
+
+    The body outlives the request-scoped ``get_db`` session, so the stream
+    opens (and closes) its own session once the client starts reading.
+    """
+
+    def body():
+        db = session_factory()
+        try:
+            lines = use_case_cls(db).execute(user_id, symbol)
+            yield from encode_ndjson(lines, gzip=gzip)
+        finally:
+            db.close()
+
+    headers = {"Content-Encoding": "gzip"} if gzip else None
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,84 @@
+"""Bounded cache of verified bearer tokens.
+
+A hit skips ``jwt.decode`` (HMAC check and JSON parse) entirely. Only the
+claims are cached; the user record comes from the user cache, which is
+invalidated on password or role changes. Entries are only served until
+the token's own ``exp``, so the cache never extends a token's lifetime.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+TOKEN_CACHE_MAX_ENTRIES = 10000
+
+
+class TokenCache:
+    def __init__(self, max_entries: int = TOKEN_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token: str, now: Optional[float] = None) -> Optional[dict]:
+        """Verified claims of ``token``, or None if absent or expired"""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, claims = entry
+            if expires_at <= now:
+                del self._entries[token]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return claims
+
+    def peek(self, token: str, now: Optional[float] = None) -> Optional[dict]:
+        """Like ``get`` but leaves recency and hit counters untouched"""
+        now = time.time() if now is None else now
+        entry = self._entries.get(token)
+        if entry is None or entry[0] <= now:
+            return None
+        return entry[1]
+
+    def put(self, token: str, claims: dict):
+        expires_at = claims.get("exp")
+        if expires_at is None:
+            # Without an expiry there is no safe point to drop it
+            return
+        with self._lock:
+            self._entries[token] = (float(expires_at), claims)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+token_cache = TokenCache()
@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from database import get_db, get_session_factory
+from .api_key_auth import get_authenticated_user
+from .auth import get_current_admin
+from .streaming import ndjson_export_response
+from .server_timing import TimedRoute
+from trading.application.dto import RecordTradesRequest, TradeResponse
+from trading.application.export_history import ExportTradesUseCase
+from trading.application.record_trades import RecordTradesUseCase
+from trading.domain.exceptions import (
+    InsufficientBalanceException,
+    InvalidQuantityException,
+    InvalidTradeException,
+    OrderException,
+    OrderNotFoundException,
+    TradingDomainException,
+)
+
+router = APIRouter(prefix="/api/trades", tags=["Trades"], route_class=TimedRoute)
+
+
+@router.get("/export")
+def export_trades(
+    user_id: str = Query(...),
+    symbol: Optional[str] = Query(None),
+    gzip: bool = Query(False),
+    session_factory=Depends(get_session_factory),
+    current_user: dict = Depends(get_authenticated_user),
+):
+    if user_id != current_user["username"]:
+        raise HTTPException(
+            status_code=403, detail="Cannot export another user's trades"
+        )
+
+    return ndjson_export_response(
+        session_factory, ExportTradesUseCase, user_id, symbol, gzip
+    )
+
+
+@router.post("/", response_model=List[TradeResponse], status_code=201)
+def record_trades(
+    request: RecordTradesRequest,
+    db: Session = Depends(get_db),
+    admin: dict = Depends(get_current_admin),
+):
+    # Settlement entry point for an external matching engine; there is
+    # no matching engine in this service
+    try:
+        use_case = RecordTradesUseCase(db)
+        result = use_case.execute(request)
+        db.commit()
+        return result
+
+    except OrderNotFoundException as e:
+        db.rollback()
+        raise HTTPException(status_code=404, detail=str(e))
+
+    except (
+        InvalidTradeException,
+        OrderException,
+        InvalidQuantityException,
+        InsufficientBalanceException,
+    ) as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except TradingDomainException as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
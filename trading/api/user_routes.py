@@ -0,0 +1,139 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from typing import Callable
+
+from database import get_db, get_session_factory
+from .auth import get_current_user, get_current_admin
+from .server_timing import TimedRoute
+from trading.application.manage_users import (
+    RegisterUserUseCase,
+    ChangePasswordUseCase,
+    ChangeRoleUseCase,
+)
+from trading.application.dto import (
+    RegisterUserRequest,
+    ChangePasswordRequest,
+    ChangeRoleRequest,
+    UserResponse,
+)
+from trading.domain.exceptions import (
+    UserAlreadyExistsException,
+    UserNotFoundException,
+    UserValidationException,
+    TradingDomainException,
+)
+from trading.infrastructure.password_hashing import (
+    PasswordPoolSaturated,
+    password_pool,
+)
+
+router = APIRouter(prefix="/api/users", tags=["Users"], route_class=TimedRoute)
+
+
+@router.post("/", response_model=UserResponse, status_code=201)
+def register_user(
+    request: RegisterUserRequest,
+    db: Session = Depends(get_db),
+    admin: dict = Depends(get_current_admin),
+):
+    try:
+        use_case = RegisterUserUseCase(db)
+        result = use_case.execute(request)
+        db.commit()
+        return result
+
+    except UserAlreadyExistsException as e:
+        db.rollback()
+        raise HTTPException(status_code=409, detail=str(e))
+
+    except PasswordPoolSaturated:
+        db.rollback()
+        raise HTTPException(
+            status_code=503,
+            detail="Too many concurrent password operations, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    except UserValidationException as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except TradingDomainException as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.put("/me/password", response_model=UserResponse)
+async def change_password(
+    request: ChangePasswordRequest,
+    session_factory=Depends(get_session_factory),
+    current_user: dict = Depends(get_current_user),
+):
+    # Argon2 is awaited in the password pool, as at login; only the
+    # update itself takes a threadpool thread
+    try:
+        if not await password_pool.verify(
+            current_user["hashed_password"], request.current_password
+        ):
+            raise HTTPException(status_code=400, detail="Current password is incorrect")
+        hashed_password = await password_pool.hash(request.new_password)
+
+    except PasswordPoolSaturated:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many concurrent password operations, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    return await run_in_threadpool(
+        _store_password, session_factory, current_user["username"], hashed_password
+    )
+
+
+def _store_password(
+    session_factory: Callable[[], Session], username: str, hashed_password: str
+) -> UserResponse:
+    db = session_factory()
+    try:
+        use_case = ChangePasswordUseCase(db)
+        result = use_case.execute(username, hashed_password)
+        db.commit()
+        return result
+
+    except UserNotFoundException as e:
+        db.rollback()
+        raise HTTPException(status_code=404, detail=str(e))
+
+    except TradingDomainException as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    finally:
+        db.close()
+
+
+@router.put("/{username}/role", response_model=UserResponse)
+def change_role(
+    username: str,
+    request: ChangeRoleRequest,
+    db: Session = Depends(get_db),
+    admin: dict = Depends(get_current_admin),
+):
+    try:
+        use_case = ChangeRoleUseCase(db)
+        result = use_case.execute(username, request)
+        db.commit()
+        return result
+
+    except UserNotFoundException as e:
+        db.rollback()
+        raise HTTPException(status_code=404, detail=str(e))
+
+    except UserValidationException as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    except TradingDomainException as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,67 @@
+from fastapi import WebSocket, WebSocketDisconnect
+from typing import Optional
+import asyncio
+import time
+
+from trading.infrastructure.pubsub import PubSub, Subscription, SubscriptionClosed
+
+# Close codes (RFC 6455)
+CLOSE_POLICY_VIOLATION = 1008
+CLOSE_TRY_AGAIN_LATER = 1013
+
+
+async def stream_subscription(
+    websocket: WebSocket,
+    hub: PubSub,
+    subscription: Subscription,
+    expires_at: Optional[float] = None,
+):
+    """Forward a subscription to an accepted WebSocket until either side ends.
+
+    Messages arrive pre-serialized and are sent as-is. A client that
+    disconnects closes the subscription immediately; one that falls too
+    far behind is closed with 1013 so it reconnects and resyncs. With
+    ``expires_at`` (epoch seconds, e.g. a token's ``exp``) the socket is
+    closed with 1008 once it passes and nothing is sent after it.
+    """
+    hub.add(subscription)
+    watcher = asyncio.create_task(_close_on_disconnect(websocket, subscription))
+    expiry = None
+    if expires_at is not None:
+        expiry = asyncio.get_running_loop().call_later(
+            max(0.0, expires_at - time.time()), subscription.close
+        )
+    try:
+        while True:
+            message = await subscription.get()
+            if _expired(expires_at):
+                await websocket.close(code=CLOSE_POLICY_VIOLATION)
+                break
+            await websocket.send_text(message)
+    except SubscriptionClosed:
+        if subscription.overflowed:
+            await websocket.close(code=CLOSE_TRY_AGAIN_LATER)
+        elif _expired(expires_at) and not watcher.done():
+            # Not closed by the client disconnecting
+            await websocket.close(code=CLOSE_POLICY_VIOLATION)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        hub.remove(subscription)
+        watcher.cancel()
+        if expiry is not None:
+            expiry.cancel()
+
+
+def _expired(expires_at: Optional[float]) -> bool:
+    return expires_at is not None and time.time() >= expires_at
+
+
+async def _close_on_disconnect(websocket: WebSocket, subscription: Subscription):
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
+        subscription.close()
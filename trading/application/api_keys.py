@@ -0,0 +1,46 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from trading.domain.api_key import ApiKey, ApiKeyIndex, ReplayGuard
+from trading.domain.exceptions import ApiKeyNotFoundException
+from trading.infrastructure.repository import ApiKeyRepository
+from trading.infrastructure.transaction_hooks import on_commit
+
+# Other worker processes stop accepting a revoked key within this interval
+API_KEY_INDEX_TTL_SECONDS = 60.0
+
+api_key_index = ApiKeyIndex(API_KEY_INDEX_TTL_SECONDS)
+replay_guard = ReplayGuard()
+
+
+class ApiKeyService:
+    def __init__(self, db: Session, index: ApiKeyIndex = api_key_index):
+        self.db = db
+        self.index = index
+        self.key_repo = ApiKeyRepository(db)
+
+    def resolve(self, key_id: str) -> Optional[ApiKey]:
+        """Active key by id; a SELECT when the key is not (or no longer) indexed"""
+        api_key = self.index.get(key_id)
+        if api_key is None:
+            api_key = self.key_repo.find_by_id(key_id)
+            if api_key is None or not api_key.is_active:
+                return None
+            self.index.put(api_key)
+        return api_key
+
+    def create(self, username: str) -> ApiKey:
+        api_key = ApiKey.create(username)
+        self.key_repo.save(api_key)
+        return api_key
+
+    def revoke(self, username: str, key_id: str) -> ApiKey:
+        api_key = self.key_repo.find_by_id(key_id)
+        # Someone else's key is reported the same as a missing one
+        if api_key is None or api_key.username != username:
+            raise ApiKeyNotFoundException(key_id)
+
+        api_key.revoke()
+        self.key_repo.save(api_key)
+        on_commit(self.db, lambda: self.index.invalidate(key_id))
+        return api_key
@@ -1,22 +1,42 @@
 from sqlalchemy.orm import Session
 
+from trading.domain.balance import order_reservation
 from trading.domain.exceptions import UnauthorizedOrderAccessException
 from trading.infrastructure.repository import OrderRepository
+from trading.infrastructure.metrics import timed_use_case
 from .dto import CancelOrderRequest, OrderResponse
+from .ledger import LedgerService
+from .market_stream import order_level_changes, publish_depth_changes
+from .order_events import publish_order_event
 
 
 class CancelOrderUseCase:
     def __init__(self, db: Session):
+        self.db = db
         self.order_repo = OrderRepository(db)
+        self.ledger = LedgerService(db)
 
+    @timed_use_case
     def execute(self, request: CancelOrderRequest) -> OrderResponse:
         order = self.order_repo.find_by_id(request.order_id)
 
         if order.user_id != request.user_id:
             raise UnauthorizedOrderAccessException(request.user_id, request.order_id)
 
+        resting = order.remaining_quantity
         order.cancel()
+
+        # Give back whatever the unfilled part of the order was holding
+        reservation = order_reservation(order)
+        if reservation is not None and reservation.amount > 0:
+            self.ledger.release(order.user_id, reservation)
+
         self.order_repo.save(order)
+        self.ledger.flush_if_due()
+        publish_order_event(self.db, order, "cancel")
+        publish_depth_changes(
+            self.db, order.trading_pair.symbol, order_level_changes(order, -resting)
+        )
 
         return OrderResponse(
             order_id=order.order_id,
@@ -0,0 +1,34 @@
+from sqlalchemy.orm import Session
+
+from trading.domain.exceptions import UserNotFoundException
+from trading.domain.value_objects import Money
+from trading.infrastructure.metrics import timed_use_case
+from .dto import BalanceListResponse, DepositRequest
+from .get_balances import balance_list_response
+from .ledger import LedgerService
+from .users import UserService
+
+
+class DepositFundsUseCase:
+    """Credit a user's available balance through the ledger.
+
+    The ledger owns resident accounts and writes them back in batches, so
+    balances must change through it; rows edited directly in ``balances``
+    are overwritten by the next flush.
+    """
+
+    def __init__(self, db: Session):
+        self.ledger = LedgerService(db)
+        self.users = UserService(db)
+
+    @timed_use_case
+    def execute(self, request: DepositRequest) -> BalanceListResponse:
+        if self.users.find(request.username) is None:
+            raise UserNotFoundException(request.username)
+
+        self.ledger.deposit(request.username, Money(request.amount, request.currency))
+        # Deposits are rare; persist with this transaction instead of batching
+        self.ledger.flush()
+        return balance_list_response(
+            request.username, self.ledger.account(request.username).snapshot()
+        )
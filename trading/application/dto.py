@@ -69,6 +69,137 @@ class OrderListResponse(BaseModel):
     orders: List[OrderResponse]
 
 
+class TradeResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    trade_id: str
+    symbol: str
+    buy_order_id: str
+    sell_order_id: str
+    buyer_user_id: str
+    seller_user_id: str
+    price: Decimal
+    quantity: Decimal
+    buyer_fee: Decimal
+    seller_fee: Decimal
+    executed_at: datetime
+
+
+class TradeFillRequest(BaseModel):
+    buy_order_id: str
+    sell_order_id: str
+    price: Decimal = Field(gt=0)
+    quantity: Decimal = Field(gt=0)
+    executed_at: Optional[datetime] = None
+
+
+class RecordTradesRequest(BaseModel):
+    fills: List[TradeFillRequest]
+
+
+class CandleResponse(BaseModel):
+    open_time: datetime
+    close_time: datetime
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    volume: Decimal
+    quote_volume: Decimal
+    trade_count: int
+
+
+class CandleListResponse(BaseModel):
+    symbol: str
+    interval: str
+    candles: List[CandleResponse]
+
+
+class TickerResponse(BaseModel):
+    symbol: str
+    last_price: Optional[Decimal] = None
+    high: Optional[Decimal] = None
+    low: Optional[Decimal] = None
+    volume: Decimal
+    quote_volume: Decimal
+    vwap: Optional[Decimal] = None
+    trade_count: int
+    last_trade_at: Optional[datetime] = None
+
+
+class BalanceResponse(BaseModel):
+    currency: str
+    available: Decimal
+    locked: Decimal
+    total: Decimal
+
+
+class BalanceListResponse(BaseModel):
+    user_id: str
+    balances: List[BalanceResponse]
+
+
+class DepositRequest(BaseModel):
+    username: str = Field(min_length=1, max_length=50)
+    currency: str = Field(pattern=r"^[A-Z0-9]{2,10}$")
+    amount: Decimal = Field(gt=0)
+
+
+class SymbolRulesPayload(BaseModel):
+    tick_size: Decimal = Field(gt=0)
+    step_size: Decimal = Field(gt=0)
+    min_price: Decimal = Field(ge=0)
+    max_price: Decimal = Field(gt=0)
+    min_quantity: Decimal = Field(ge=0)
+    max_quantity: Decimal = Field(gt=0)
+    min_notional: Decimal = Field(ge=0)
+
+
+class ListTradingPairRequest(BaseModel):
+    symbol: str
+    # Omitted: keep the pair's current rules (defaults for a new pair)
+    rules: Optional[SymbolRulesPayload] = None
+
+
+class TradingPairResponse(BaseModel):
+    symbol: str
+    base_currency: str
+    quote_currency: str
+    is_active: bool
+    rules: SymbolRulesPayload
+
+
+class RegisterUserRequest(BaseModel):
+    username: str = Field(min_length=1, max_length=50)
+    password: str = Field(min_length=8)
+    role: str = "user"
+
+
+class ChangePasswordRequest(BaseModel):
+    current_password: str
+    new_password: str = Field(min_length=8)
+
+
+class ChangeRoleRequest(BaseModel):
+    role: str
+
+
+class UserResponse(BaseModel):
+    username: str
+    role: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class ApiKeyResponse(BaseModel):
+    key_id: str
+    username: str
+    is_active: bool
+    created_at: datetime
+    # Only returned once, when the key is created
+    secret: Optional[str] = None
+
+
 class ErrorResponse(BaseModel):
     error: str
     message: str
@@ -0,0 +1,80 @@
+import zlib
+from typing import Iterable, Iterator, Optional
+from sqlalchemy.orm import Session
+
+from trading.infrastructure.repository import OrderRepository, TradeRepository
+from .dto import OrderResponse, TradeResponse
+
+# Encoded lines are buffered up to this many bytes before being yielded
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# zlib window bits for a gzip container (header + CRC trailer)
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def encode_ndjson(
+    lines: Iterable[str], gzip: bool = False, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Join JSON lines into NDJSON chunks, optionally gzip-compressed on the fly"""
+    compressor = zlib.compressobj(wbits=GZIP_WBITS) if gzip else None
+    buffer = bytearray()
+
+    for line in lines:
+        buffer += line.encode()
+        buffer += b"\n"
+
+        if len(buffer) >= chunk_size:
+            data = bytes(buffer)
+            buffer.clear()
+            if compressor:
+                data = compressor.compress(data)
+            if data:
+                yield data
+
+    data = bytes(buffer)
+    if compressor:
+        data = compressor.compress(data) + compressor.flush()
+    if data:
+        yield data
+
+
+class ExportOrdersUseCase:
+    def __init__(self, db: Session):
+        self.order_repo = OrderRepository(db)
+
+    def execute(self, user_id: str, symbol: Optional[str] = None) -> Iterator[str]:
+        for order in self.order_repo.iter_by_user_id(user_id, symbol):
+            yield OrderResponse(
+                order_id=order.order_id,
+                user_id=order.user_id,
+                symbol=order.trading_pair.symbol,
+                side=order.side.value,
+                order_type=order.order_type.value,
+                price=order.price.amount,
+                quantity=order.quantity,
+                filled_quantity=order.filled_quantity,
+                status=order.status.value,
+                created_at=order.created_at,
+                updated_at=order.updated_at,
+            ).model_dump_json()
+
+
+class ExportTradesUseCase:
+    def __init__(self, db: Session):
+        self.trade_repo = TradeRepository(db)
+
+    def execute(self, user_id: str, symbol: Optional[str] = None) -> Iterator[str]:
+        for trade in self.trade_repo.iter_by_user_id(user_id, symbol):
+            yield TradeResponse(
+                trade_id=trade.trade_id,
+                symbol=trade.trading_pair.symbol,
+                buy_order_id=trade.buy_order_id,
+                sell_order_id=trade.sell_order_id,
+                buyer_user_id=trade.buyer_user_id,
+                seller_user_id=trade.seller_user_id,
+                price=trade.price.amount,
+                quantity=trade.quantity,
+                buyer_fee=trade.buyer_fee,
+                seller_fee=trade.seller_fee,
+                executed_at=trade.executed_at,
+            ).model_dump_json()
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import Session
+from typing import List
+
+from trading.domain.fees import FeeEngine, VOLUME_WINDOW_DAYS
+from trading.domain.trade import Trade
+from trading.domain.value_objects import OrderSide
+from trading.infrastructure.repository import TradeRepository
+from trading.infrastructure.transaction_hooks import on_rollback
+
+fee_engine = FeeEngine()
+
+
+class FeeService:
+    """Applies the fee engine to a match batch.
+
+    Users the engine has not seen yet are warmed with one grouped volume
+    query for the whole batch; every other fill is priced from the cache.
+    """
+
+    def __init__(self, db: Session, engine: FeeEngine = fee_engine):
+        self.db = db
+        self.engine = engine
+        self.trade_repo = TradeRepository(db)
+
+    def apply(self, trades: List[Trade], taker_sides: List[OrderSide]) -> None:
+        self._warm_up(trades)
+        self.engine.assign_fees(trades, taker_sides)
+        self.engine.record(trades)
+        on_rollback(self.db, lambda: self.engine.record(trades, sign=-1))
+
+    def _warm_up(self, trades: List[Trade]) -> None:
+        unknown = {
+            user_id
+            for trade in trades
+            for user_id in (trade.buyer_user_id, trade.seller_user_id)
+            if not self.engine.is_known(user_id)
+        }
+        if not unknown:
+            return
+
+        since = datetime.now(timezone.utc) - timedelta(days=VOLUME_WINDOW_DAYS)
+        volumes = self.trade_repo.daily_quote_volumes(unknown, since)
+        for user_id in unknown:
+            self.engine.seed(user_id, volumes.get(user_id, {}))
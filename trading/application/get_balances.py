@@ -0,0 +1,32 @@
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from trading.domain.balance import Balance
+from trading.infrastructure.metrics import timed_use_case
+from .dto import BalanceListResponse, BalanceResponse
+from .ledger import LedgerService
+
+
+def balance_list_response(user_id: str, balances: List[Balance]) -> BalanceListResponse:
+    return BalanceListResponse(
+        user_id=user_id,
+        balances=[
+            BalanceResponse(
+                currency=b.currency,
+                available=b.available,
+                locked=b.locked,
+                total=b.total,
+            )
+            for b in sorted(balances, key=lambda b: b.currency)
+        ],
+    )
+
+
+class GetBalancesUseCase:
+    def __init__(self, db: Session):
+        self.ledger = LedgerService(db)
+
+    @timed_use_case
+    def execute(self, user_id: str) -> BalanceListResponse:
+        return balance_list_response(user_id, self.ledger.account(user_id).snapshot())
@@ -0,0 +1,36 @@
+from sqlalchemy.orm import Session
+
+from trading.domain.candle import CandleInterval
+from trading.infrastructure.repository import CandleRepository
+from trading.infrastructure.metrics import timed_use_case
+from .dto import CandleListResponse, CandleResponse
+
+
+class GetCandlesUseCase:
+    def __init__(self, db: Session):
+        self.candle_repo = CandleRepository(db)
+
+    @timed_use_case
+    def execute(
+        self, symbol: str, interval: CandleInterval, limit: int = 100
+    ) -> CandleListResponse:
+        candles = self.candle_repo.find_recent(symbol, interval, limit)
+
+        return CandleListResponse(
+            symbol=symbol,
+            interval=interval.value,
+            candles=[
+                CandleResponse(
+                    open_time=c.open_time,
+                    close_time=c.close_time,
+                    open=c.open,
+                    high=c.high,
+                    low=c.low,
+                    close=c.close,
+                    volume=c.volume,
+                    quote_volume=c.quote_volume,
+                    trade_count=c.trade_count,
+                )
+                for c in candles
+            ],
+        )
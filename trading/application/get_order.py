@@ -1,7 +1,11 @@
 from sqlalchemy.orm import Session
 
-from trading.domain.exceptions import UnauthorizedOrderAccessException
+from trading.domain.exceptions import (
+    OrderNotFoundException,
+    UnauthorizedOrderAccessException,
+)
 from trading.infrastructure.repository import OrderRepository
+from trading.infrastructure.metrics import timed_use_case
 from .dto import OrderDetailResponse
 
 
@@ -9,6 +13,18 @@ class GetOrderUseCase:
     def __init__(self, db: Session):
         self.order_repo = OrderRepository(db)
 
+    def version(self, order_id: str, user_id: str) -> str:
+        """Changes whenever the order does; read without loading the row"""
+        row = self.order_repo.find_version(order_id)
+
+        if row is None:
+            raise OrderNotFoundException(order_id)
+        if row.user_id != user_id:
+            raise UnauthorizedOrderAccessException(user_id, order_id)
+
+        return f"{order_id}:{row.updated_at.isoformat()}"
+
+    @timed_use_case
     def execute(self, order_id: str, user_id: str) -> OrderDetailResponse:
         order = self.order_repo.find_by_id(order_id)
 
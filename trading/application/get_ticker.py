@@ -0,0 +1,39 @@
+from typing import List, Optional
+
+from trading.domain.ticker import TickerBook, TickerStats
+from trading.infrastructure.metrics import timed_use_case
+from .dto import TickerResponse
+from .market_data import ticker_book
+
+
+class GetTickerUseCase:
+    """Reads rolling 24h tickers; served from memory, never from ``trades``"""
+
+    def __init__(self, tickers: TickerBook = ticker_book):
+        self.tickers = tickers
+
+    @timed_use_case
+    def execute(self, symbol: str) -> TickerResponse:
+        stats = self.tickers.snapshot(symbol)
+        if stats is None:
+            return TickerResponse(
+                symbol=symbol, volume=0, quote_volume=0, trade_count=0
+            )
+        return self._to_response(stats)
+
+    @timed_use_case
+    def execute_all(self) -> List[TickerResponse]:
+        return [self._to_response(stats) for stats in self.tickers.snapshots()]
+
+    def _to_response(self, stats: TickerStats) -> TickerResponse:
+        return TickerResponse(
+            symbol=stats.symbol,
+            last_price=stats.last_price,
+            high=stats.high,
+            low=stats.low,
+            volume=stats.volume,
+            quote_volume=stats.quote_volume,
+            vwap=stats.vwap,
+            trade_count=stats.trade_count,
+            last_trade_at=stats.last_trade_at,
+        )
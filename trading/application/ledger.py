@@ -0,0 +1,109 @@
+import time
+from decimal import Decimal
+from sqlalchemy.orm import Session
+
+from trading.domain.balance import BalanceAccount, BalanceLedger
+from trading.domain.value_objects import Money
+from trading.infrastructure.repository import BalanceRepository
+from trading.infrastructure.transaction_hooks import on_rollback
+
+# Dirty accounts are written back once this many pile up ...
+LEDGER_FLUSH_BATCH_SIZE = 100
+# ... or once this much time has passed since the last write
+LEDGER_FLUSH_INTERVAL_SECONDS = 1.0
+
+balance_ledger = BalanceLedger()
+
+
+class LedgerService:
+    """Pre-trade balance checks against the in-memory ledger.
+
+    An account is read from ``balances`` once, the first time its user is
+    seen; after that, checks and locks never touch the database. Every
+    change is undone if the caller's transaction rolls back, and changed
+    accounts are persisted in batches by ``flush_if_due``.
+    """
+
+    _last_flush = time.monotonic()
+
+    def __init__(self, db: Session, ledger: BalanceLedger = balance_ledger):
+        self.db = db
+        self.ledger = ledger
+        self.balance_repo = BalanceRepository(db)
+
+    def account(self, user_id: str) -> BalanceAccount:
+        account = self.ledger.get(user_id)
+        if account is None:
+            account = self.ledger.load(
+                user_id, self.balance_repo.find_by_user_id(user_id)
+            )
+        return account
+
+    def adjust(
+        self,
+        user_id: str,
+        currency: str,
+        available_delta: Decimal = Decimal("0"),
+        locked_delta: Decimal = Decimal("0"),
+    ) -> None:
+        account = self.account(user_id)
+        account.apply(currency, available_delta, locked_delta)
+        self.ledger.mark_dirty(user_id)
+
+        def undo():
+            account.apply(currency, -available_delta, -locked_delta, check=False)
+            self.ledger.mark_dirty(user_id)
+
+        on_rollback(self.db, undo)
+
+    def lock(self, user_id: str, funds: Money) -> None:
+        self.adjust(user_id, funds.currency, -funds.amount, funds.amount)
+
+    def release(self, user_id: str, funds: Money) -> Decimal:
+        """Release an order's hold; never more than is actually locked"""
+        account = self.account(user_id)
+        released = account.release_up_to(funds.currency, funds.amount)
+        if released:
+            self.ledger.mark_dirty(user_id)
+
+            def undo():
+                account.apply(funds.currency, -released, released, check=False)
+                self.ledger.mark_dirty(user_id)
+
+            on_rollback(self.db, undo)
+        return released
+
+    def spend_held(self, user_id: str, held: Money, amount: Decimal) -> None:
+        """Pay ``amount`` out of an order's hold of ``held``.
+
+        Orders opened before the ledger existed hold nothing; whatever the
+        hold lacks is taken from available funds instead.
+        """
+        self.release(user_id, held)
+        self.adjust(user_id, held.currency, -amount)
+
+    def deposit(self, user_id: str, funds: Money) -> None:
+        self.adjust(user_id, funds.currency, available_delta=funds.amount)
+
+    def flush_if_due(self) -> None:
+        elapsed = time.monotonic() - LedgerService._last_flush
+        if (
+            self.ledger.dirty_count >= LEDGER_FLUSH_BATCH_SIZE
+            or elapsed >= LEDGER_FLUSH_INTERVAL_SECONDS
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist every dirty account as part of the current transaction"""
+        accounts = self.ledger.drain_dirty()
+        LedgerService._last_flush = time.monotonic()
+        if not accounts:
+            return
+
+        self.balance_repo.save_accounts(accounts)
+
+        def redirty():
+            for account in accounts:
+                self.ledger.mark_dirty(account.user_id)
+
+        on_rollback(self.db, redirty)
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 
 from trading.infrastructure.repository import OrderRepository
+from trading.infrastructure.metrics import timed_use_case
 from .dto import OrderListResponse, OrderResponse
 
 
@@ -9,6 +10,13 @@ class ListOrdersUseCase:
     def __init__(self, db: Session):
         self.order_repo = OrderRepository(db)
 
+    def version(self, user_id: str, symbol: Optional[str] = None) -> str:
+        """Changes when an order is added, removed or updated"""
+        count, latest = self.order_repo.list_version(user_id, symbol)
+        latest = latest.isoformat() if latest else "-"
+        return f"{user_id}:{symbol or '*'}:{count}:{latest}"
+
+    @timed_use_case
     def execute(self, user_id: str, symbol: Optional[str] = None) -> OrderListResponse:
         orders = self.order_repo.find_by_user_id(user_id)
 
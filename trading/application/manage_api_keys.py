@@ -0,0 +1,36 @@
+from sqlalchemy.orm import Session
+
+from trading.infrastructure.metrics import timed_use_case
+from .api_keys import ApiKeyService
+from .dto import ApiKeyResponse
+
+
+class CreateApiKeyUseCase:
+    def __init__(self, db: Session):
+        self.keys = ApiKeyService(db)
+
+    @timed_use_case
+    def execute(self, username: str) -> ApiKeyResponse:
+        api_key = self.keys.create(username)
+        return ApiKeyResponse(
+            key_id=api_key.key_id,
+            username=api_key.username,
+            is_active=api_key.is_active,
+            created_at=api_key.created_at,
+            secret=api_key.secret,
+        )
+
+
+class RevokeApiKeyUseCase:
+    def __init__(self, db: Session):
+        self.keys = ApiKeyService(db)
+
+    @timed_use_case
+    def execute(self, username: str, key_id: str) -> ApiKeyResponse:
+        api_key = self.keys.revoke(username, key_id)
+        return ApiKeyResponse(
+            key_id=api_key.key_id,
+            username=api_key.username,
+            is_active=api_key.is_active,
+            created_at=api_key.created_at,
+        )
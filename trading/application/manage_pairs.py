@@ -0,0 +1,49 @@
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from trading.domain.pair_registry import PairListing
+from trading.domain.symbol_rules import RULE_FIELDS, SymbolRules
+from trading.infrastructure.metrics import timed_use_case
+from .dto import SymbolRulesPayload, TradingPairResponse
+from .pairs import PairRegistryService
+
+
+def _to_response(listing: PairListing) -> TradingPairResponse:
+    return TradingPairResponse(
+        symbol=listing.symbol,
+        base_currency=listing.trading_pair.base_currency,
+        quote_currency=listing.trading_pair.quote_currency,
+        is_active=listing.is_active,
+        rules=SymbolRulesPayload(
+            **{name: getattr(listing.rules, name) for name in RULE_FIELDS}
+        ),
+    )
+
+
+class ListTradingPairsUseCase:
+    def __init__(self, db: Session):
+        self.pairs = PairRegistryService(db)
+
+    @timed_use_case
+    def execute(self) -> List[TradingPairResponse]:
+        self.pairs.ensure_loaded()
+        return [_to_response(listing) for listing in self.pairs.registry.listings()]
+
+
+class SetTradingPairStatusUseCase:
+    def __init__(self, db: Session):
+        self.pairs = PairRegistryService(db)
+
+    @timed_use_case
+    def execute(
+        self,
+        symbol: str,
+        is_active: bool,
+        rules: Optional[SymbolRulesPayload] = None,
+    ) -> TradingPairResponse:
+        listing = self.pairs.set_active(
+            symbol,
+            is_active,
+            rules=SymbolRules(**rules.model_dump()) if rules else None,
+        )
+        return _to_response(listing)
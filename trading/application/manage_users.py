@@ -0,0 +1,51 @@
+from sqlalchemy.orm import Session
+
+from trading.domain.user import User
+from trading.infrastructure.metrics import timed_use_case
+from .dto import (
+    RegisterUserRequest,
+    ChangeRoleRequest,
+    UserResponse,
+)
+from .users import UserService
+
+
+def _to_response(user: User) -> UserResponse:
+    return UserResponse(
+        username=user.username,
+        role=user.role,
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
+
+
+class RegisterUserUseCase:
+    def __init__(self, db: Session):
+        self.users = UserService(db)
+
+    @timed_use_case
+    def execute(self, request: RegisterUserRequest) -> UserResponse:
+        user = self.users.register(request.username, request.password, request.role)
+        return _to_response(user)
+
+
+class ChangePasswordUseCase:
+    """Store a new password; the route awaits verify and hash in the pool"""
+
+    def __init__(self, db: Session):
+        self.users = UserService(db)
+
+    @timed_use_case
+    def execute(self, username: str, hashed_password: str) -> UserResponse:
+        user = self.users.change_password(username, hashed_password)
+        return _to_response(user)
+
+
+class ChangeRoleUseCase:
+    def __init__(self, db: Session):
+        self.users = UserService(db)
+
+    @timed_use_case
+    def execute(self, username: str, request: ChangeRoleRequest) -> UserResponse:
+        user = self.users.change_role(username, request.role)
+        return _to_response(user)
@@ -0,0 +1,40 @@
+"""Process-wide market data state, fed by the trade recording path"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from trading.domain.candle import CandleAggregator
+from trading.domain.price_band import ReferencePriceCache
+from trading.domain.ticker import TickerBook
+from trading.infrastructure.repository import CandleRepository, TradeRepository
+
+# LIMIT orders may not deviate more than this from the last traded price
+PRICE_BAND_MAX_DEVIATION = Decimal("0.10")
+
+candle_aggregator = CandleAggregator()
+ticker_book = TickerBook()
+reference_prices = ReferencePriceCache(PRICE_BAND_MAX_DEVIATION)
+
+
+def warm_market_data(session_factory: Callable[[], Session]):
+    """Seed candles, 24h tickers and price-band references from storage.
+
+    Without this every restart starts with empty tickers and a price band
+    that fails open until the next trade of each symbol.
+    """
+    since = datetime.now(timezone.utc) - timedelta(hours=24)
+    db = session_factory()
+    try:
+        candles = CandleRepository(db).find_latest()
+        trades = TradeRepository(db).fetch_market_snapshot(since)
+    finally:
+        db.close()
+
+    candle_aggregator.install(candles)
+    for symbol, price, quantity, executed_at in trades:
+        price, quantity = Decimal(str(price)), Decimal(str(quantity))
+        ticker_book.apply_trade(symbol, price, quantity, executed_at)
+        reference_prices.update(symbol, price, executed_at)
@@ -0,0 +1,203 @@
+"""Public per-symbol market data stream: depth deltas and trades.
+
+Messages are serialized once when published and shared by every
+subscriber. Each subscriber has a bounded inbox; one that falls behind
+has its queued depth deltas collapsed into a single snapshot, so a slow
+client costs at most ``max_pending`` messages and never slows the
+publisher.
+"""
+
+import json
+from collections import deque
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List
+from sqlalchemy.orm import Session
+
+from trading.domain.depth import DepthBook, DepthBookRegistry, LevelChange
+from trading.domain.order import Order
+from trading.domain.trade import Trade
+from trading.domain.value_objects import OrderSide, OrderType
+from trading.infrastructure.pubsub import PubSub, Subscription
+from trading.infrastructure.repository import OrderRepository
+from trading.infrastructure.transaction_hooks import on_commit
+
+SNAPSHOT_DEPTH = 50
+
+market_events = PubSub()
+depth_books = DepthBookRegistry()
+
+
+def market_topic(symbol: str) -> str:
+    return f"market:{symbol}"
+
+
+class DepthDelta:
+    """A serialized depth update; conflatable, unlike trades"""
+
+    __slots__ = ("seq", "text")
+
+    def __init__(self, seq: int, text: str):
+        self.seq = seq
+        self.text = text
+
+
+class _SnapshotMarker:
+    pass
+
+
+SNAPSHOT = _SnapshotMarker()
+
+
+class SnapshotCache:
+    """Serialized snapshot of a book, rebuilt only when its seq moves"""
+
+    def __init__(self, book: DepthBook):
+        self.book = book
+        self._seq = -1
+        self._text = ""
+
+    def text(self) -> str:
+        if self._seq != self.book.seq:
+            seq, bids, asks = self.book.snapshot(SNAPSHOT_DEPTH)
+            self._text = json.dumps(
+                {
+                    "type": "snapshot",
+                    "symbol": self.book.symbol,
+                    "seq": seq,
+                    "bids": [[str(p), str(q)] for p, q in bids],
+                    "asks": [[str(p), str(q)] for p, q in asks],
+                }
+            )
+            self._seq = seq
+        return self._text
+
+
+_snapshots: Dict[str, SnapshotCache] = {}
+
+
+def snapshot_text(symbol: str) -> str:
+    cache = _snapshots.get(symbol)
+    if cache is None:
+        cache = _snapshots.setdefault(symbol, SnapshotCache(depth_books.get(symbol)))
+    return cache.text()
+
+
+class MarketSubscription(Subscription):
+    """Starts with a snapshot; conflates depth deltas when it falls behind"""
+
+    def __init__(self, symbol: str, max_pending: int = 256):
+        super().__init__(market_topic(symbol), max_pending)
+        self.symbol = symbol
+        self.conflations = 0
+        self._snapshot_queued = False
+        self._queue_snapshot()
+
+    def offer(self, message):
+        if self.closed:
+            return
+        if isinstance(message, DepthDelta) and self._snapshot_queued:
+            # The queued snapshot is taken when sent, so it covers this delta
+            return
+        if len(self._queue) >= self.max_pending:
+            self._conflate()
+            if isinstance(message, DepthDelta) and self._snapshot_queued:
+                return
+            if len(self._queue) >= self.max_pending:
+                # Only trades left and still full: resync from scratch
+                super().offer(message)
+                return
+        self._enqueue(message)
+
+    def _conflate(self):
+        kept = deque(m for m in self._queue if not isinstance(m, DepthDelta))
+        if len(kept) == len(self._queue):
+            return
+        self._queue = kept
+        self.conflations += 1
+        self._queue_snapshot()
+
+    def _queue_snapshot(self):
+        self._snapshot_queued = True
+        self._enqueue(SNAPSHOT)
+
+    async def get(self) -> str:
+        message = await super().get()
+        if message is SNAPSHOT:
+            self._snapshot_queued = False
+            return snapshot_text(self.symbol)
+        if isinstance(message, DepthDelta):
+            return message.text
+        return message
+
+
+def order_level_changes(order: Order, quantity: Decimal) -> List[LevelChange]:
+    """Resting-quantity change of ``quantity`` at the order's limit price"""
+    if order.order_type != OrderType.LIMIT or quantity == 0:
+        return []
+    return [(order.side, order.price.amount, quantity)]
+
+
+def publish_depth_changes(db: Session, symbol: str, changes: Iterable[LevelChange]):
+    """Apply ``changes`` to the symbol's book and broadcast once ``db`` commits"""
+    changes = list(changes)
+    if changes:
+        on_commit(db, lambda: _apply_and_publish(symbol, changes))
+
+
+def publish_trades(db: Session, trades: List[Trade]):
+    on_commit(db, lambda: _publish_trades(trades))
+
+
+def _apply_and_publish(symbol: str, changes: List[LevelChange]):
+    seq, levels = depth_books.get(symbol).apply(changes)
+    if not levels:
+        return
+    text = json.dumps(
+        {
+            "type": "depth",
+            "symbol": symbol,
+            "seq": seq,
+            "bids": [[str(p), str(q)] for s, p, q in levels if s == OrderSide.BUY],
+            "asks": [[str(p), str(q)] for s, p, q in levels if s == OrderSide.SELL],
+        }
+    )
+    market_events.publish(market_topic(symbol), DepthDelta(seq, text))
+
+
+def _publish_trades(trades: List[Trade]):
+    for trade in trades:
+        symbol = trade.trading_pair.symbol
+        market_events.publish(
+            market_topic(symbol),
+            json.dumps(
+                {
+                    "type": "trade",
+                    "symbol": symbol,
+                    "trade_id": trade.trade_id,
+                    "price": str(trade.price.amount),
+                    "quantity": str(trade.quantity),
+                    "executed_at": trade.executed_at.isoformat(),
+                }
+            ),
+        )
+
+
+def load_depth_books(session_factory: Callable[[], Session]):
+    """Rebuild every book from the open orders in storage"""
+    db = session_factory()
+    try:
+        changes: Dict[str, List[LevelChange]] = {}
+        for order in OrderRepository(db).find_open_orders():
+            changes.setdefault(order.trading_pair.symbol, []).extend(
+                order_level_changes(order, order.remaining_quantity)
+            )
+    finally:
+        db.close()
+    for symbol, symbol_changes in changes.items():
+        depth_books.get(symbol).apply(symbol_changes)
+
+
+def clear_market_stream():
+    market_events.clear()
+    depth_books.clear()
+    _snapshots.clear()
@@ -0,0 +1,38 @@
+"""Order state changes pushed to the owning user's WebSocket streams"""
+
+import json
+from sqlalchemy.orm import Session
+
+from trading.domain.order import Order
+from trading.infrastructure.pubsub import PubSub
+from trading.infrastructure.transaction_hooks import on_commit
+
+order_events = PubSub()
+
+
+def order_topic(user_id: str) -> str:
+    return f"orders:{user_id}"
+
+
+def publish_order_event(db: Session, order: Order, event: str):
+    """Queue an ``open`` / ``fill`` / ``cancel`` event; sent once ``db`` commits"""
+    # Serialized once here, before fan-out
+    message = json.dumps(
+        {
+            "event": event,
+            "order": {
+                "order_id": order.order_id,
+                "user_id": order.user_id,
+                "symbol": order.trading_pair.symbol,
+                "side": order.side.value,
+                "order_type": order.order_type.value,
+                "price": str(order.price.amount),
+                "quantity": str(order.quantity),
+                "filled_quantity": str(order.filled_quantity),
+                "status": order.status.value,
+                "updated_at": order.updated_at.isoformat(),
+            },
+        }
+    )
+    topic = order_topic(order.user_id)
+    on_commit(db, lambda: order_events.publish(topic, message))
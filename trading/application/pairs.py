@@ -0,0 +1,75 @@
+import time
+from typing import Optional
+from sqlalchemy.orm import Session
+
+from trading.domain.exceptions import InvalidTradingPairException
+from trading.domain.pair_registry import PairListing, TradingPairRegistry
+from trading.domain.symbol_rules import SymbolRules
+from trading.domain.value_objects import TradingPair
+from trading.infrastructure.repository import TradingPairRepository
+from trading.infrastructure.transaction_hooks import on_commit
+
+# Listed until an admin manages pairs for the first time
+DEFAULT_PAIRS = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "BNB/USDT", "XRP/USDT", "ETH/BTC"]
+
+# Other worker processes pick up listing changes within this interval
+PAIR_REGISTRY_REFRESH_SECONDS = 60.0
+
+pair_registry = TradingPairRegistry()
+
+
+class PairRegistryService:
+    def __init__(self, db: Session, registry: TradingPairRegistry = pair_registry):
+        self.db = db
+        self.registry = registry
+        self.pair_repo = TradingPairRepository(db)
+
+    def require(self, symbol: str) -> PairListing:
+        self.ensure_loaded()
+        return self.registry.require(symbol)
+
+    def find(self, symbol: str) -> Optional[PairListing]:
+        """Listing of an active or delisted pair; None if it was never listed"""
+        self.ensure_loaded()
+        return self.registry.get(symbol)
+
+    def ensure_loaded(self) -> None:
+        loaded_at = self.registry.loaded_at
+        if loaded_at is None or (
+            time.monotonic() - loaded_at > PAIR_REGISTRY_REFRESH_SECONDS
+        ):
+            self.registry.replace(self._stored_or_default())
+
+    def set_active(
+        self, symbol: str, is_active: bool, rules: Optional[SymbolRules] = None
+    ) -> PairListing:
+        """List or delist a pair; the registry is swapped once this commits"""
+        self.ensure_loaded()
+        try:
+            trading_pair = TradingPair.from_symbol(symbol)
+        except ValueError as e:
+            raise InvalidTradingPairException(symbol, str(e))
+
+        current = self.registry.get(trading_pair.symbol)
+        if not is_active and current is None:
+            raise InvalidTradingPairException(symbol, "Trading pair is not listed")
+
+        if rules is None:
+            rules = current.rules if current else SymbolRules()
+
+        listings = {listing.symbol: listing for listing in self._stored_or_default()}
+        listing = PairListing(trading_pair, is_active, rules)
+        listings[listing.symbol] = listing
+
+        # The first admin change also persists the default listings
+        for stored in listings.values():
+            self.pair_repo.save(stored)
+
+        on_commit(self.db, lambda: self.registry.replace(listings.values()))
+        return listing
+
+    def _stored_or_default(self):
+        listings = self.pair_repo.find_all()
+        if not listings:
+            listings = [PairListing(TradingPair.from_symbol(s)) for s in DEFAULT_PAIRS]
+        return listings
@@ -3,16 +3,31 @@ from decimal import Decimal
 
 from trading.infrastructure.repository import OrderRepository
 from trading.application.dto import PlaceOrderRequest, OrderResponse
+from trading.domain.balance import order_reservation
 from trading.domain.order import Order
-from trading.domain.value_objects import TradingPair, OrderSide, OrderType, Money
+from trading.domain.value_objects import OrderSide, OrderType, Money
+from trading.domain.price_band import ReferencePriceCache
+from trading.infrastructure.metrics import timed_use_case
+from .ledger import LedgerService
+from .market_data import reference_prices
+from .market_stream import order_level_changes, publish_depth_changes
+from .order_events import publish_order_event
+from .pairs import PairRegistryService
 
 
 class PlaceOrderUseCase:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, references: ReferencePriceCache = reference_prices):
+        self.db = db
         self.order_repo = OrderRepository(db)
+        self.ledger = LedgerService(db)
+        self.pairs = PairRegistryService(db)
+        self.references = references
 
+    @timed_use_case
     def execute(self, request: PlaceOrderRequest) -> OrderResponse:
-        trading_pair = TradingPair.from_symbol(request.symbol)
+        # Raises for unlisted or delisted pairs; a dict lookup, no query
+        listing = self.pairs.require(request.symbol)
+        trading_pair = listing.trading_pair
         price = Money(
             amount=Decimal(str(request.price)), currency=trading_pair.quote_currency
         )
@@ -24,12 +39,28 @@ class PlaceOrderUseCase:
             order_type=OrderType[request.order_type],
             price=price,
             quantity=Decimal(str(request.quantity)),
+            rules=listing.rules,
         )
 
+        # Band around the cached last trade price; never touches the trades table
+        self.references.check(order)
+
+        # Hold the funds the order needs; raises if the user cannot cover it
+        reservation = order_reservation(order)
+        if reservation is not None:
+            self.ledger.lock(order.user_id, reservation)
+
         # Transition order from PENDING to OPEN status
         order.open()
 
         self.order_repo.save(order)
+        self.ledger.flush_if_due()
+        publish_order_event(self.db, order, "open")
+        publish_depth_changes(
+            self.db,
+            trading_pair.symbol,
+            order_level_changes(order, order.remaining_quantity),
+        )
 
         return OrderResponse(
             order_id=order.order_id,
@@ -0,0 +1,193 @@
+from sqlalchemy.orm import Session
+from typing import Dict, List, Tuple
+
+from trading.domain.balance import order_reservation
+from trading.domain.candle import CandleAggregator, StagedCandles
+from trading.domain.depth import LevelChange
+from trading.domain.exceptions import InvalidTradeException
+from trading.domain.order import Order
+from trading.domain.price_band import ReferencePriceCache
+from trading.domain.ticker import TickerBook
+from trading.domain.trade import Trade
+from trading.domain.value_objects import Money, OrderSide
+from trading.infrastructure.repository import (
+    OrderRepository,
+    TradeRepository,
+    CandleRepository,
+)
+from trading.infrastructure.transaction_hooks import on_commit
+from trading.infrastructure.metrics import timed_use_case
+from .dto import RecordTradesRequest, TradeFillRequest, TradeResponse
+from .fee_service import FeeService
+from .ledger import LedgerService
+from .market_data import candle_aggregator, ticker_book, reference_prices
+from .market_stream import (
+    order_level_changes,
+    publish_depth_changes,
+    publish_trades,
+)
+from .order_events import publish_order_event
+
+
+class RecordTradesUseCase:
+    """Entry point for fills produced by the matching path.
+
+    Each fill fills both orders and is stored in ``trades``. The candles it
+    touches are updated incrementally on staged copies and written back
+    with one upsert per batch, and both sides are charged fees and settled
+    against the balance ledger. Fees for the whole batch are computed in
+    one pass. Once the batch commits, the staged candles replace the
+    cached ones, the rolling 24h tickers take the trades, and the last
+    price per symbol becomes the price-band reference.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        candles: CandleAggregator = candle_aggregator,
+        tickers: TickerBook = ticker_book,
+        references: ReferencePriceCache = reference_prices,
+    ):
+        self.db = db
+        self.order_repo = OrderRepository(db)
+        self.trade_repo = TradeRepository(db)
+        self.candle_repo = CandleRepository(db)
+        self.ledger = LedgerService(db)
+        self.fees = FeeService(db)
+        self.candles = candles
+        self.tickers = tickers
+        self.references = references
+
+    @timed_use_case
+    def execute(self, request: RecordTradesRequest) -> List[TradeResponse]:
+        orders: Dict[str, Order] = {}
+        matched = [self._match_fill(fill, orders) for fill in request.fills]
+        trades = [trade for trade, _, _ in matched]
+
+        depth_changes: Dict[str, List[LevelChange]] = {}
+        for fill in request.fills:
+            for order_id in (fill.buy_order_id, fill.sell_order_id):
+                order = orders[order_id]
+                depth_changes.setdefault(order.trading_pair.symbol, []).extend(
+                    order_level_changes(order, -fill.quantity)
+                )
+
+        self.fees.apply(trades, [taker_side for _, _, taker_side in matched])
+        for trade, buy_order, _ in matched:
+            self._settle(trade, buy_order)
+
+        for order in orders.values():
+            self.order_repo.save(order)
+            # One event per order per batch, carrying its final state
+            publish_order_event(self.db, order, "fill")
+
+        staged = {}
+        for trade in trades:
+            self.trade_repo.save(trade)
+            self.candles.stage_trade(
+                staged,
+                trade.trading_pair.symbol,
+                trade.price.amount,
+                trade.quantity,
+                trade.executed_at,
+                loader=self.candle_repo.find_one,
+            )
+
+        self.candle_repo.upsert(list(staged.values()))
+        self.ledger.flush_if_due()
+        # Process-wide market data only moves once the trades are durable
+        on_commit(self.db, lambda: self._publish_market_data(trades, staged))
+        for symbol, changes in depth_changes.items():
+            publish_depth_changes(self.db, symbol, changes)
+        publish_trades(self.db, trades)
+
+        return [
+            TradeResponse(
+                trade_id=trade.trade_id,
+                symbol=trade.trading_pair.symbol,
+                buy_order_id=trade.buy_order_id,
+                sell_order_id=trade.sell_order_id,
+                buyer_user_id=trade.buyer_user_id,
+                seller_user_id=trade.seller_user_id,
+                price=trade.price.amount,
+                quantity=trade.quantity,
+                buyer_fee=trade.buyer_fee,
+                seller_fee=trade.seller_fee,
+                executed_at=trade.executed_at,
+            )
+            for trade in trades
+        ]
+
+    def _match_fill(
+        self, fill: TradeFillRequest, orders: Dict[str, Order]
+    ) -> Tuple[Trade, Order, OrderSide]:
+        buy_order = self._load_order(fill.buy_order_id, orders)
+        sell_order = self._load_order(fill.sell_order_id, orders)
+
+        if buy_order.side != OrderSide.BUY or sell_order.side != OrderSide.SELL:
+            raise InvalidTradeException(
+                f"Fill must match a BUY order against a SELL order: "
+                f"{fill.buy_order_id} / {fill.sell_order_id}"
+            )
+
+        if buy_order.trading_pair != sell_order.trading_pair:
+            raise InvalidTradeException(
+                f"Cannot match {buy_order.trading_pair.symbol} "
+                f"against {sell_order.trading_pair.symbol}"
+            )
+
+        buy_order.fill(fill.quantity)
+        sell_order.fill(fill.quantity)
+
+        trading_pair = buy_order.trading_pair
+        trade = Trade.create(
+            trading_pair=trading_pair,
+            buy_order_id=buy_order.order_id,
+            sell_order_id=sell_order.order_id,
+            buyer_user_id=buy_order.user_id,
+            seller_user_id=sell_order.user_id,
+            price=Money(fill.price, trading_pair.quote_currency),
+            quantity=fill.quantity,
+            executed_at=fill.executed_at,
+        )
+
+        # The order that arrived later crossed the resting one: it is the taker
+        taker_side = (
+            OrderSide.BUY
+            if buy_order.created_at >= sell_order.created_at
+            else OrderSide.SELL
+        )
+        return trade, buy_order, taker_side
+
+    def _settle(self, trade: Trade, buy_order: Order):
+        base = trade.trading_pair.base_currency
+        quote = trade.trading_pair.quote_currency
+        cost = trade.quote_quantity.amount
+
+        # Buyer pays quote out of the order's hold (or straight from available
+        # for MARKET orders) and receives base minus its fee
+        held = order_reservation(buy_order, trade.quantity)
+        if held is not None:
+            self.ledger.spend_held(trade.buyer_user_id, held, cost)
+        else:
+            self.ledger.adjust(trade.buyer_user_id, quote, -cost)
+        self.ledger.adjust(trade.buyer_user_id, base, trade.quantity - trade.buyer_fee)
+
+        # Seller delivers held base and receives quote minus its fee
+        self.ledger.spend_held(
+            trade.seller_user_id, Money(trade.quantity, base), trade.quantity
+        )
+        self.ledger.adjust(trade.seller_user_id, quote, cost - trade.seller_fee)
+
+    def _publish_market_data(self, trades: List[Trade], staged: StagedCandles):
+        self.candles.install(staged.values())
+        for trade in trades:
+            symbol, price = trade.trading_pair.symbol, trade.price.amount
+            self.tickers.apply_trade(symbol, price, trade.quantity, trade.executed_at)
+            self.references.update(symbol, price, trade.executed_at)
+
+    def _load_order(self, order_id: str, orders: Dict[str, Order]) -> Order:
+        # Orders hit by several fills in one batch are loaded once
+        if order_id not in orders:
+            orders[order_id] = self.order_repo.find_by_id(order_id)
+        return orders[order_id]
@@ -0,0 +1,120 @@
+"""Vectorized end-of-day analytics over trades.
+
+Trades for a symbol and time range are loaded with one columnar fetch into
+a NumPy structured array; every statistic below is a vectorized reduction
+over that array. Values are float64, which is fine for reporting but not
+for settlement: use the Decimal-based domain objects for anything that
+moves balances.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from trading.infrastructure.repository import TradeRepository
+
+TRADE_DTYPE = np.dtype(
+    [
+        ("price", "f8"),
+        ("quantity", "f8"),
+        ("buyer_fee", "f8"),
+        ("seller_fee", "f8"),
+        ("timestamp", "datetime64[ms]"),
+    ]
+)
+
+
+def vwap(trades: np.ndarray) -> Optional[float]:
+    volume = trades["quantity"].sum()
+    if volume == 0:
+        return None
+    return float(np.dot(trades["price"], trades["quantity"]) / volume)
+
+
+def volume_profile(
+    trades: np.ndarray, price_step: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Traded base volume per price level, levels ``price_step`` wide"""
+    if len(trades) == 0:
+        return np.empty(0), np.empty(0)
+
+    level_index = np.floor(trades["price"] / price_step).astype(np.int64)
+    levels, inverse = np.unique(level_index, return_inverse=True)
+    volumes = np.bincount(inverse, weights=trades["quantity"])
+    return levels * price_step, volumes
+
+
+def fee_totals(trades: np.ndarray) -> Dict[str, float]:
+    """Buyers pay fees in base currency, sellers in quote currency.
+
+    ``total_quote`` converts each buyer fee at the price of its trade.
+    """
+    buyer = float(trades["buyer_fee"].sum())
+    seller = float(trades["seller_fee"].sum())
+    buyer_quote = float(np.dot(trades["buyer_fee"], trades["price"]))
+    return {
+        "buyer_base": buyer,
+        "seller_quote": seller,
+        "total_quote": buyer_quote + seller,
+    }
+
+
+def summarize(trades: np.ndarray) -> Dict[str, Optional[float]]:
+    if len(trades) == 0:
+        return {
+            "trade_count": 0,
+            "volume": 0.0,
+            "quote_volume": 0.0,
+            "vwap": None,
+            "open": None,
+            "high": None,
+            "low": None,
+            "close": None,
+            "fees": fee_totals(trades),
+        }
+
+    prices = trades["price"]
+    return {
+        "trade_count": len(trades),
+        "volume": float(trades["quantity"].sum()),
+        "quote_volume": float(np.dot(prices, trades["quantity"])),
+        "vwap": vwap(trades),
+        "open": float(prices[0]),
+        "high": float(prices.max()),
+        "low": float(prices.min()),
+        "close": float(prices[-1]),
+        "fees": fee_totals(trades),
+    }
+
+
+class TradeAnalytics:
+    def __init__(self, db: Session):
+        self.trade_repo = TradeRepository(db)
+
+    def load(
+        self,
+        symbol: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """Trades of ``symbol`` in [start, end) ordered by execution time"""
+        rows = self.trade_repo.fetch_columns(symbol, start, end)
+        return np.fromiter(map(tuple, rows), dtype=TRADE_DTYPE, count=len(rows))
+
+    def daily_report(
+        self, symbol: str, day: datetime, price_step: float = 1.0
+    ) -> Dict[str, object]:
+        start = day.replace(hour=0, minute=0, second=0, microsecond=0)
+        trades = self.load(symbol, start, start + timedelta(days=1))
+
+        levels, volumes = volume_profile(trades, price_step)
+        report = summarize(trades)
+        report["symbol"] = symbol
+        report["date"] = start.date().isoformat()
+        report["volume_profile"] = [
+            {"price": float(level), "volume": float(volume)}
+            for level, volume in zip(levels, volumes)
+        ]
+        return report
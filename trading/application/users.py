@@ -0,0 +1,160 @@
+import logging
+import os
+import threading
+from typing import Callable, Dict, Optional
+from sqlalchemy.orm import Session
+
+from trading.domain.exceptions import (
+    UserAlreadyExistsException,
+    UserNotFoundException,
+    UserValidationException,
+)
+from trading.domain.user import User, ROLE_ADMIN, ROLE_USER
+from trading.infrastructure.password_hashing import password_pool
+from trading.infrastructure.repository import UserRepository
+from trading.infrastructure.transaction_hooks import on_commit
+
+# First admin of an empty users table; nothing is created without them
+ADMIN_USERNAME = os.getenv("ADMIN_USERNAME")
+ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD")
+ADMIN_PASSWORD_MIN_LENGTH = 8
+
+logger = logging.getLogger("trading.users")
+
+
+class UserCache:
+    """User records read on every authenticated request.
+
+    ``invalidate`` bumps a per-user generation; a lookup that started
+    before the invalidation cannot put its (possibly stale) row back.
+    """
+
+    def __init__(self):
+        self._records: Dict[str, dict] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, username: str) -> Optional[dict]:
+        record = self._records.get(username)
+        if record is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return record
+
+    def generation(self, username: str) -> int:
+        return self._generations.get(username, 0)
+
+    def put(self, username: str, record: dict, generation: int):
+        with self._lock:
+            if self._generations.get(username, 0) == generation:
+                self._records[username] = record
+
+    def invalidate(self, username: str):
+        with self._lock:
+            self._records.pop(username, None)
+            self._generations[username] = self._generations.get(username, 0) + 1
+
+    def stats(self) -> dict:
+        return {"entries": len(self._records), "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+            self._generations.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+user_cache = UserCache()
+
+
+class UserService:
+    def __init__(self, db: Session, cache: UserCache = user_cache):
+        self.db = db
+        self.cache = cache
+        self.user_repo = UserRepository(db)
+
+    def find(self, username: str) -> Optional[dict]:
+        """User record by username; a SELECT only on a cache miss"""
+        record = self.cache.get(username)
+        if record is not None:
+            return record
+
+        generation = self.cache.generation(username)
+        user = self.user_repo.find_by_username(username)
+        if user is None:
+            return None
+        record = user.as_record()
+        self.cache.put(username, record, generation)
+        return record
+
+    def register(self, username: str, password: str, role: str = ROLE_USER) -> User:
+        if self.user_repo.find_by_username(username) is not None:
+            raise UserAlreadyExistsException(username)
+
+        user = User.create(username, password_pool.hash_blocking(password), role)
+        self.user_repo.save(user)
+        # A lookup that missed before the insert must not linger
+        on_commit(self.db, self._invalidator(username))
+        return user
+
+    def change_password(self, username: str, hashed_password: str) -> User:
+        """Store a password the caller already hashed in the password pool"""
+        user = self._require(username)
+        user.change_password(hashed_password)
+        self.user_repo.save(user)
+        on_commit(self.db, self._invalidator(username))
+        return user
+
+    def change_role(self, username: str, role: str) -> User:
+        user = self._require(username)
+        user.change_role(role)
+        self.user_repo.save(user)
+        on_commit(self.db, self._invalidator(username))
+        return user
+
+    def _require(self, username: str) -> User:
+        user = self.user_repo.find_by_username(username)
+        if user is None:
+            raise UserNotFoundException(username)
+        return user
+
+    def _invalidator(self, username: str) -> Callable[[], None]:
+        return lambda: self.cache.invalidate(username)
+
+
+def bootstrap_admin(
+    session_factory: Callable[[], Session],
+    username: Optional[str] = ADMIN_USERNAME,
+    password: Optional[str] = ADMIN_PASSWORD,
+) -> Optional[User]:
+    """Create the first admin while the users table is empty.
+
+    Credentials come from ADMIN_USERNAME / ADMIN_PASSWORD; without them no
+    account is created and admin endpoints stay unreachable.
+    """
+    db = session_factory()
+    try:
+        user_repo = UserRepository(db)
+        if user_repo.count() > 0:
+            return None
+        if not username or not password:
+            logger.warning(
+                "users table is empty; set ADMIN_USERNAME and ADMIN_PASSWORD "
+                "to bootstrap an admin"
+            )
+            return None
+        if len(password) < ADMIN_PASSWORD_MIN_LENGTH:
+            raise UserValidationException(
+                f"ADMIN_PASSWORD must be at least {ADMIN_PASSWORD_MIN_LENGTH} "
+                "characters"
+            )
+
+        user = UserService(db).register(username, password, ROLE_ADMIN)
+        db.commit()
+        return user
+    finally:
+        db.close()
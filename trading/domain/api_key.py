@@ -0,0 +1,135 @@
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, Optional, Set, Tuple
+
+# Requests signed further than this from server time are refused
+SIGNATURE_WINDOW_SECONDS = 30
+
+
+class ApiKey:
+    def __init__(
+        self,
+        key_id: str,
+        username: str,
+        secret: str,
+        is_active: bool = True,
+        created_at: Optional[datetime] = None,
+    ):
+        self.key_id = key_id
+        self.username = username
+        self.secret = secret
+        self.is_active = is_active
+        self.created_at = created_at or datetime.now(timezone.utc)
+        self._secret_bytes = secret.encode()
+
+    @classmethod
+    def create(cls, username: str) -> "ApiKey":
+        return cls(
+            key_id=f"AK-{secrets.token_hex(8).upper()}",
+            username=username,
+            secret=secrets.token_urlsafe(32),
+        )
+
+    def revoke(self):
+        self.is_active = False
+
+    def signature(
+        self, timestamp: str, nonce: str, method: str, path: str, body: bytes
+    ) -> str:
+        return sign_request(self._secret_bytes, timestamp, nonce, method, path, body)
+
+    def verify(
+        self,
+        signature: str,
+        timestamp: str,
+        nonce: str,
+        method: str,
+        path: str,
+        body: bytes,
+    ) -> bool:
+        expected = self.signature(timestamp, nonce, method, path, body)
+        return hmac.compare_digest(expected, signature)
+
+
+def sign_request(
+    secret: bytes, timestamp: str, nonce: str, method: str, path: str, body: bytes
+) -> str:
+    """Hex HMAC-SHA256 over ``timestamp\\nnonce\\nMETHOD\\npath?query\\n`` + body"""
+    mac = hmac.new(secret, digestmod=hashlib.sha256)
+    mac.update(f"{timestamp}\n{nonce}\n{method.upper()}\n{path}\n".encode())
+    mac.update(body)
+    return mac.hexdigest()
+
+
+class ApiKeyIndex:
+    """Active API keys by key id; filled lazily, dropped on revocation.
+
+    Revocation only invalidates the index of the process that committed it,
+    so entries also expire ``ttl_seconds`` after they were loaded and other
+    processes re-read the key from storage.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        self.ttl_seconds = ttl_seconds
+        self._keys: Dict[str, Tuple[ApiKey, float]] = {}
+
+    def get(self, key_id: str, now: Optional[float] = None) -> Optional[ApiKey]:
+        entry = self._keys.get(key_id)
+        if entry is None:
+            return None
+        api_key, expires_at = entry
+        if (now if now is not None else time.monotonic()) >= expires_at:
+            self._keys.pop(key_id, None)
+            return None
+        return api_key
+
+    def put(self, api_key: ApiKey, now: Optional[float] = None):
+        if api_key.is_active:
+            now = now if now is not None else time.monotonic()
+            self._keys[api_key.key_id] = (api_key, now + self.ttl_seconds)
+
+    def invalidate(self, key_id: str):
+        self._keys.pop(key_id, None)
+
+    def clear(self):
+        self._keys = {}
+
+
+class ReplayGuard:
+    """Remembers (key, nonce) pairs for the length of the signature window.
+
+    Anything older than the window is already refused by its timestamp, so
+    only the window's worth of nonces has to be kept.
+    """
+
+    def __init__(self, window_seconds: int = SIGNATURE_WINDOW_SECONDS):
+        self.window_ms = window_seconds * 1000
+        self._seen: Set[Tuple[str, str]] = set()
+        self._expiry: Deque[Tuple[int, Tuple[str, str]]] = deque()
+        self._lock = threading.Lock()
+
+    def check(self, key_id: str, nonce: str, timestamp_ms: int, now_ms: int) -> bool:
+        """True if the request is fresh and its nonce unused; records the nonce"""
+        if abs(now_ms - timestamp_ms) > self.window_ms:
+            return False
+
+        entry = (key_id, nonce)
+        with self._lock:
+            while self._expiry and self._expiry[0][0] < now_ms:
+                self._seen.discard(self._expiry.popleft()[1])
+            if entry in self._seen:
+                return False
+            self._seen.add(entry)
+            # Kept until its timestamp can no longer pass the window check
+            self._expiry.append((max(timestamp_ms, now_ms) + self.window_ms, entry))
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._seen.clear()
+            self._expiry.clear()
@@ -0,0 +1,170 @@
+import threading
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Set
+
+from .order import Order
+from .value_objects import Money, OrderSide, OrderType
+from .exceptions import InsufficientBalanceException, BalanceLockException
+
+
+class Balance:
+    __slots__ = ("currency", "available", "locked")
+
+    def __init__(
+        self,
+        currency: str,
+        available: Decimal = Decimal("0"),
+        locked: Decimal = Decimal("0"),
+    ):
+        self.currency = currency
+        self.available = available
+        self.locked = locked
+
+    @property
+    def total(self) -> Decimal:
+        return self.available + self.locked
+
+    def __repr__(self):
+        return (
+            f"Balance(currency='{self.currency}', "
+            f"available={self.available}, locked={self.locked})"
+        )
+
+
+class BalanceAccount:
+    """Balances of one user, one entry per currency.
+
+    Reads are lock-free; every mutation takes only this user's lock, so
+    order entry for different users never contends.
+    """
+
+    def __init__(self, user_id: str, balances: Iterable[Balance] = ()):
+        self.user_id = user_id
+        self._balances: Dict[str, Balance] = {b.currency: b for b in balances}
+        self._lock = threading.Lock()
+
+    def available(self, currency: str) -> Decimal:
+        balance = self._balances.get(currency)
+        return balance.available if balance else Decimal("0")
+
+    def locked(self, currency: str) -> Decimal:
+        balance = self._balances.get(currency)
+        return balance.locked if balance else Decimal("0")
+
+    def apply(
+        self,
+        currency: str,
+        available_delta: Decimal = Decimal("0"),
+        locked_delta: Decimal = Decimal("0"),
+        check: bool = True,
+    ):
+        """Adjust both sides of a balance atomically.
+
+        With ``check`` the change is refused if it would leave either side
+        negative; undo operations skip the check.
+        """
+        with self._lock:
+            balance = self._balances.get(currency)
+            if balance is None:
+                balance = self._balances[currency] = Balance(currency)
+
+            new_available = balance.available + available_delta
+            new_locked = balance.locked + locked_delta
+
+            if check and new_available < 0:
+                raise InsufficientBalanceException(
+                    self.user_id,
+                    currency,
+                    str(-available_delta),
+                    str(balance.available),
+                )
+            if check and new_locked < 0:
+                raise BalanceLockException(
+                    f"Cannot release {-locked_delta} {currency} for user "
+                    f"{self.user_id}: only {balance.locked} locked"
+                )
+
+            balance.available = new_available
+            balance.locked = new_locked
+
+    def release_up_to(self, currency: str, amount: Decimal) -> Decimal:
+        """Move up to ``amount`` from locked back to available.
+
+        Returns what was actually released: orders opened before balances
+        were tracked hold nothing, so there may be less locked than asked.
+        """
+        with self._lock:
+            balance = self._balances.get(currency)
+            if balance is None:
+                return Decimal("0")
+            released = min(amount, balance.locked)
+            if released <= 0:
+                return Decimal("0")
+            balance.available += released
+            balance.locked -= released
+            return released
+
+    def snapshot(self) -> List[Balance]:
+        with self._lock:
+            return [
+                Balance(b.currency, b.available, b.locked)
+                for b in self._balances.values()
+            ]
+
+
+class BalanceLedger:
+    """In-memory ledger of every loaded account plus the set not yet persisted"""
+
+    def __init__(self):
+        self._accounts: Dict[str, BalanceAccount] = {}
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Optional[BalanceAccount]:
+        return self._accounts.get(user_id)
+
+    def load(self, user_id: str, balances: Iterable[Balance]) -> BalanceAccount:
+        """Register an account loaded from storage; first loader wins"""
+        with self._lock:
+            account = self._accounts.get(user_id)
+            if account is None:
+                account = self._accounts[user_id] = BalanceAccount(user_id, balances)
+            return account
+
+    def mark_dirty(self, user_id: str):
+        self._dirty.add(user_id)
+
+    @property
+    def dirty_count(self) -> int:
+        return len(self._dirty)
+
+    def drain_dirty(self) -> List[BalanceAccount]:
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        return [self._accounts[user_id] for user_id in dirty]
+
+    def clear(self):
+        with self._lock:
+            self._accounts.clear()
+            self._dirty.clear()
+
+
+def order_reservation(
+    order: Order, quantity: Optional[Decimal] = None
+) -> Optional[Money]:
+    """Funds an open order holds for ``quantity`` (default: its remaining quantity).
+
+    SELL orders hold base currency. BUY LIMIT orders hold quote currency at
+    their limit price. BUY MARKET orders have no price until they match,
+    so nothing is held up front.
+    """
+    if quantity is None:
+        quantity = order.remaining_quantity
+
+    if order.side == OrderSide.SELL:
+        return Money(quantity, order.trading_pair.base_currency)
+
+    if order.order_type == OrderType.LIMIT:
+        return Money(order.price.amount * quantity, order.trading_pair.quote_currency)
+
+    return None
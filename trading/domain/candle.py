@@ -0,0 +1,277 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class CandleInterval(str, Enum):
+    ONE_MINUTE = "1m"
+    FIVE_MINUTES = "5m"
+    ONE_HOUR = "1h"
+    ONE_DAY = "1d"
+
+    @property
+    def seconds(self) -> int:
+        return _INTERVAL_SECONDS[self]
+
+    def bucket_start(self, timestamp: datetime) -> datetime:
+        """Open time of the candle that contains ``timestamp`` (UTC)"""
+        timestamp = as_utc(timestamp)
+        epoch = int(timestamp.timestamp())
+        return datetime.fromtimestamp(epoch - epoch % self.seconds, timezone.utc)
+
+
+_INTERVAL_SECONDS = {
+    CandleInterval.ONE_MINUTE: 60,
+    CandleInterval.FIVE_MINUTES: 5 * 60,
+    CandleInterval.ONE_HOUR: 60 * 60,
+    CandleInterval.ONE_DAY: 24 * 60 * 60,
+}
+
+# Base interval first; every following interval is rolled up from the base candle
+ROLLUP_CHAIN = [
+    CandleInterval.ONE_MINUTE,
+    CandleInterval.FIVE_MINUTES,
+    CandleInterval.ONE_HOUR,
+    CandleInterval.ONE_DAY,
+]
+
+
+def as_utc(timestamp: datetime) -> datetime:
+    """SQLite returns naive datetimes; treat them as UTC"""
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+class Candle:
+    def __init__(
+        self,
+        symbol: str,
+        interval: CandleInterval,
+        open_time: datetime,
+        open: Decimal,
+        high: Decimal,
+        low: Decimal,
+        close: Decimal,
+        volume: Decimal = Decimal("0"),
+        quote_volume: Decimal = Decimal("0"),
+        trade_count: int = 0,
+        last_trade_at: Optional[datetime] = None,
+    ):
+        self.symbol = symbol
+        self.interval = interval
+        self.open_time = as_utc(open_time)
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.quote_volume = quote_volume
+        self.trade_count = trade_count
+        self.last_trade_at = as_utc(last_trade_at) if last_trade_at else None
+
+    @classmethod
+    def start(
+        cls, symbol: str, interval: CandleInterval, open_time: datetime, price: Decimal
+    ) -> "Candle":
+        return cls(symbol, interval, open_time, price, price, price, price)
+
+    def copy(self) -> "Candle":
+        return Candle(
+            self.symbol,
+            self.interval,
+            self.open_time,
+            self.open,
+            self.high,
+            self.low,
+            self.close,
+            self.volume,
+            self.quote_volume,
+            self.trade_count,
+            self.last_trade_at,
+        )
+
+    @property
+    def close_time(self) -> datetime:
+        return self.open_time + timedelta(seconds=self.interval.seconds)
+
+    def apply_trade(self, price: Decimal, quantity: Decimal, executed_at: datetime):
+        executed_at = as_utc(executed_at)
+
+        if price > self.high:
+            self.high = price
+        if price < self.low:
+            self.low = price
+
+        # Late trades must not move the close backwards in time
+        if self.last_trade_at is None or executed_at >= self.last_trade_at:
+            self.close = price
+            self.last_trade_at = executed_at
+
+        self.volume += quantity
+        self.quote_volume += price * quantity
+        self.trade_count += 1
+
+    def roll_up(self, child: "Candle", quantity: Decimal, quote_quantity: Decimal):
+        """Fold one trade already applied to a lower-interval candle into this one"""
+        if child.high > self.high:
+            self.high = child.high
+        if child.low < self.low:
+            self.low = child.low
+
+        if self.last_trade_at is None or child.last_trade_at >= self.last_trade_at:
+            self.close = child.close
+            self.last_trade_at = child.last_trade_at
+
+        self.volume += quantity
+        self.quote_volume += quote_quantity
+        self.trade_count += 1
+
+    def __repr__(self):
+        return (
+            f"Candle(symbol='{self.symbol}', interval={self.interval.value}, "
+            f"open_time={self.open_time.isoformat()}, "
+            f"o={self.open}, h={self.high}, l={self.low}, c={self.close}, "
+            f"v={self.volume})"
+        )
+
+
+CandleLoader = Callable[[str, CandleInterval, datetime], Optional[Candle]]
+StagedCandles = Dict[Tuple[str, CandleInterval, datetime], Candle]
+
+
+class CandleAggregator:
+    """Keeps the open candle of every (symbol, interval) in memory.
+
+    Each trade updates the 1m candle, and the 1m candle is rolled up into
+    5m, 1h and 1d, so a trade costs a handful of comparisons regardless of
+    how much history exists. ``loader`` is consulted only when a trade lands
+    in a bucket that is not the cached one (first trade after a restart, or
+    a late trade for an older bucket).
+    """
+
+    def __init__(self):
+        self._current: Dict[Tuple[str, CandleInterval], Candle] = {}
+
+    def current(self, symbol: str, interval: CandleInterval) -> Optional[Candle]:
+        return self._current.get((symbol, interval))
+
+    def apply_trade(
+        self,
+        symbol: str,
+        price: Decimal,
+        quantity: Decimal,
+        executed_at: datetime,
+        loader: Optional[CandleLoader] = None,
+    ) -> List[Candle]:
+        """Apply a trade and return every candle it touched"""
+        return self._apply(
+            lambda interval: self._candle_for(
+                symbol, interval, executed_at, price, loader
+            ),
+            price,
+            quantity,
+            executed_at,
+        )
+
+    def stage_trade(
+        self,
+        staged: StagedCandles,
+        symbol: str,
+        price: Decimal,
+        quantity: Decimal,
+        executed_at: datetime,
+        loader: Optional[CandleLoader] = None,
+    ) -> List[Candle]:
+        """Like ``apply_trade``, but on copies collected in ``staged``.
+
+        The cache is left untouched until ``install`` is given the staged
+        candles, so a batch whose transaction fails leaves no trace.
+        """
+        return self._apply(
+            lambda interval: self._staged_candle(
+                staged, symbol, interval, executed_at, price, loader
+            ),
+            price,
+            quantity,
+            executed_at,
+        )
+
+    def install(self, candles: Iterable[Candle]):
+        """Make candles the cached ones unless a newer bucket is already cached"""
+        for candle in candles:
+            key = (candle.symbol, candle.interval)
+            current = self._current.get(key)
+            if current is None or candle.open_time >= current.open_time:
+                self._current[key] = candle
+
+    def clear(self):
+        self._current.clear()
+
+    @staticmethod
+    def _apply(
+        candle_for: Callable[[CandleInterval], Candle],
+        price: Decimal,
+        quantity: Decimal,
+        executed_at: datetime,
+    ) -> List[Candle]:
+        base = candle_for(ROLLUP_CHAIN[0])
+        base.apply_trade(price, quantity, executed_at)
+
+        quote_quantity = price * quantity
+        touched = [base]
+        for interval in ROLLUP_CHAIN[1:]:
+            candle = candle_for(interval)
+            candle.roll_up(base, quantity, quote_quantity)
+            touched.append(candle)
+
+        return touched
+
+    def _staged_candle(
+        self,
+        staged: StagedCandles,
+        symbol: str,
+        interval: CandleInterval,
+        executed_at: datetime,
+        price: Decimal,
+        loader: Optional[CandleLoader],
+    ) -> Candle:
+        open_time = interval.bucket_start(executed_at)
+        candle = staged.get((symbol, interval, open_time))
+        if candle is not None:
+            return candle
+
+        current = self._current.get((symbol, interval))
+        if current is not None and current.open_time == open_time:
+            candle = current.copy()
+        else:
+            candle = loader(symbol, interval, open_time) if loader else None
+            if candle is None:
+                candle = Candle.start(symbol, interval, open_time, price)
+        staged[(symbol, interval, open_time)] = candle
+        return candle
+
+    def _candle_for(
+        self,
+        symbol: str,
+        interval: CandleInterval,
+        executed_at: datetime,
+        price: Decimal,
+        loader: Optional[CandleLoader],
+    ) -> Candle:
+        key = (symbol, interval)
+        open_time = interval.bucket_start(executed_at)
+        current = self._current.get(key)
+
+        if current is not None and current.open_time == open_time:
+            return current
+
+        candle = loader(symbol, interval, open_time) if loader else None
+        if candle is None:
+            candle = Candle.start(symbol, interval, open_time, price)
+
+        if current is None or open_time > current.open_time:
+            self._current[key] = candle
+
+        return candle
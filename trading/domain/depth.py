@@ -0,0 +1,81 @@
+import threading
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .value_objects import OrderSide
+
+# (side, price, signed change in resting quantity)
+LevelChange = Tuple[OrderSide, Decimal, Decimal]
+# (side, price, new resting quantity; 0 means the level is gone)
+Level = Tuple[OrderSide, Decimal, Decimal]
+
+
+def _level_key(price: Decimal) -> Decimal:
+    # Prices loaded back from storage carry the column scale (105.00000000);
+    # one spelling per level keeps keys and published prices consistent
+    price = price.normalize()
+    return price.quantize(Decimal("1")) if price == price.to_integral() else price
+
+
+class DepthBook:
+    """Aggregated resting LIMIT quantity per price level of one symbol.
+
+    Every applied batch bumps ``seq``; delta and snapshot messages carry it
+    so clients can drop deltas already covered by a snapshot.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.seq = 0
+        self._levels: Dict[OrderSide, Dict[Decimal, Decimal]] = {
+            OrderSide.BUY: {},
+            OrderSide.SELL: {},
+        }
+        self._lock = threading.Lock()
+
+    def apply(self, changes: Iterable[LevelChange]) -> Tuple[int, List[Level]]:
+        """Apply changes; returns the new seq and the levels they touched"""
+        touched: Dict[Tuple[OrderSide, Decimal], Decimal] = {}
+        with self._lock:
+            for side, price, delta in changes:
+                price = _level_key(price)
+                levels = self._levels[side]
+                quantity = levels.get(price, Decimal("0")) + delta
+                if quantity > 0:
+                    levels[price] = quantity
+                else:
+                    levels.pop(price, None)
+                    quantity = Decimal("0")
+                touched[(side, price)] = quantity
+            if touched:
+                self.seq += 1
+            return self.seq, [(s, p, q) for (s, p), q in touched.items()]
+
+    def snapshot(
+        self, limit: Optional[int] = None
+    ) -> Tuple[int, List[Tuple[Decimal, Decimal]], List[Tuple[Decimal, Decimal]]]:
+        """(seq, bids best-first, asks best-first)"""
+        with self._lock:
+            bids = sorted(self._levels[OrderSide.BUY].items(), reverse=True)
+            asks = sorted(self._levels[OrderSide.SELL].items())
+            seq = self.seq
+        if limit is not None:
+            bids, asks = bids[:limit], asks[:limit]
+        return seq, bids, asks
+
+
+class DepthBookRegistry:
+    def __init__(self):
+        self._books: Dict[str, DepthBook] = {}
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str) -> DepthBook:
+        book = self._books.get(symbol)
+        if book is None:
+            with self._lock:
+                book = self._books.setdefault(symbol, DepthBook(symbol))
+        return book
+
+    def clear(self):
+        with self._lock:
+            self._books.clear()
@@ -57,14 +57,19 @@ class InvalidPriceException(TradingDomainException):
         super().__init__(f"Invalid price {price}: {reason}")
 
 
-class PriceOutOfRangeException(TradingDomainException):
-    def __init__(self, price: str, min_price: str, max_price: str):
+class PriceOutOfRangeException(InvalidPriceException):
+    def __init__(self, price: str, min_price: str, max_price: str, reason: str = None):
         self.price = price
         self.min_price = min_price
         self.max_price = max_price
-        super().__init__(
+        message = (
             f"Price {price} out of range. " f"Allowed range: {min_price} - {max_price}"
         )
+        if reason:
+            message += f". {reason}"
+        super().__init__(price, reason or "out of range")
+        # Keep the range in the text rather than the generic invalid-price one
+        self.args = (message,)
 
 
 class InvalidQuantityException(TradingDomainException):
@@ -83,6 +88,32 @@ class QuantityAboveMaximumException(InvalidQuantityException):
         super().__init__(quantity, f"Quantity must not exceed {maximum}")
 
 
+class UserException(TradingDomainException):
+    pass
+
+
+class UserNotFoundException(UserException):
+    def __init__(self, username: str):
+        self.username = username
+        super().__init__(f"User not found: {username}")
+
+
+class UserAlreadyExistsException(UserException):
+    def __init__(self, username: str):
+        self.username = username
+        super().__init__(f"User already exists: {username}")
+
+
+class UserValidationException(UserException):
+    pass
+
+
+class ApiKeyNotFoundException(TradingDomainException):
+    def __init__(self, key_id: str):
+        self.key_id = key_id
+        super().__init__(f"API key not found: {key_id}")
+
+
 class UnauthorizedOrderAccessException(TradingDomainException):
     def __init__(self, user_id: str, order_id: str):
         self.user_id = user_id
@@ -0,0 +1,162 @@
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterable, List, Optional
+
+from .candle import as_utc
+from .trade import Trade
+from .value_objects import OrderSide
+
+VOLUME_WINDOW_DAYS = 30
+FEE_PRECISION = Decimal("0.00000001")
+
+
+@dataclass(frozen=True)
+class FeeTier:
+    min_volume: Decimal
+    maker_rate: Decimal
+    taker_rate: Decimal
+
+
+class FeeSchedule:
+    def __init__(self, tiers: Iterable[FeeTier]):
+        self.tiers = sorted(tiers, key=lambda t: t.min_volume)
+        if not self.tiers or self.tiers[0].min_volume != 0:
+            raise ValueError("Fee schedule needs a tier starting at volume 0")
+        self._thresholds = [t.min_volume for t in self.tiers]
+
+    def tier_for(self, volume: Decimal) -> FeeTier:
+        return self.tiers[bisect_right(self._thresholds, volume) - 1]
+
+
+# 30-day quote volume -> (maker, taker)
+DEFAULT_FEE_SCHEDULE = FeeSchedule(
+    [
+        FeeTier(Decimal("0"), Decimal("0.0010"), Decimal("0.0010")),
+        FeeTier(Decimal("50000"), Decimal("0.0009"), Decimal("0.0010")),
+        FeeTier(Decimal("1000000"), Decimal("0.0007"), Decimal("0.0009")),
+        FeeTier(Decimal("10000000"), Decimal("0.0005"), Decimal("0.0007")),
+    ]
+)
+
+
+class _RollingVolume:
+    """30 daily quote-volume buckets plus their running total"""
+
+    __slots__ = ("days", "total", "tier")
+
+    def __init__(self, tier: FeeTier):
+        self.days: Dict[date, Decimal] = {}
+        self.total = Decimal("0")
+        self.tier = tier
+
+    def expire(self, today: date):
+        cutoff = today - timedelta(days=VOLUME_WINDOW_DAYS - 1)
+        for day in [d for d in self.days if d < cutoff]:
+            self.total -= self.days.pop(day)
+
+
+class FeeEngine:
+    """Maker/taker fees with per-user tiers from 30-day traded volume.
+
+    Each user's volume and tier are cached and updated as trades are
+    recorded, so pricing a batch of fills is a dict lookup per user. The
+    buyer pays its fee in the base currency it receives and the seller in
+    the quote currency it receives.
+    """
+
+    def __init__(self, schedule: FeeSchedule = DEFAULT_FEE_SCHEDULE):
+        self.schedule = schedule
+        self._volumes: Dict[str, _RollingVolume] = {}
+        self._lock = threading.Lock()
+
+    def is_known(self, user_id: str) -> bool:
+        return user_id in self._volumes
+
+    def seed(self, user_id: str, daily_volumes: Dict[date, Decimal]):
+        """Load a user's recent daily volumes; ignored if already cached"""
+        with self._lock:
+            if user_id in self._volumes:
+                return
+            state = _RollingVolume(self.schedule.tier_for(Decimal("0")))
+            for day, volume in daily_volumes.items():
+                state.days[day] = state.days.get(day, Decimal("0")) + volume
+                state.total += volume
+            state.tier = self.schedule.tier_for(state.total)
+            self._volumes[user_id] = state
+
+    def volume(self, user_id: str, today: Optional[date] = None) -> Decimal:
+        state = self._volumes.get(user_id)
+        if state is None:
+            return Decimal("0")
+        if today:
+            with self._lock:
+                state.expire(today)
+        return state.total
+
+    def tier(self, user_id: str, today: Optional[date] = None) -> FeeTier:
+        state = self._volumes.get(user_id)
+        if state is None:
+            return self.schedule.tier_for(Decimal("0"))
+
+        today = today or datetime.now(timezone.utc).date()
+        if state.days and min(state.days) < today - timedelta(
+            days=VOLUME_WINDOW_DAYS - 1
+        ):
+            # Old days fell out of the window since the last trade
+            with self._lock:
+                state.expire(today)
+                state.tier = self.schedule.tier_for(state.total)
+        return state.tier
+
+    def assign_fees(
+        self,
+        trades: List[Trade],
+        taker_sides: List[OrderSide],
+        today: Optional[date] = None,
+    ):
+        """Price a whole match batch with the tiers in force when it started"""
+        tiers: Dict[str, FeeTier] = {}
+
+        def tier(user_id: str) -> FeeTier:
+            if user_id not in tiers:
+                tiers[user_id] = self.tier(user_id, today)
+            return tiers[user_id]
+
+        for trade, taker_side in zip(trades, taker_sides):
+            buyer_tier = tier(trade.buyer_user_id)
+            seller_tier = tier(trade.seller_user_id)
+            buyer_rate, seller_rate = (
+                (buyer_tier.taker_rate, seller_tier.maker_rate)
+                if taker_side == OrderSide.BUY
+                else (buyer_tier.maker_rate, seller_tier.taker_rate)
+            )
+            trade.buyer_fee = _round_fee(trade.quantity * buyer_rate)
+            trade.seller_fee = _round_fee(trade.quote_quantity.amount * seller_rate)
+
+    def record(self, trades: List[Trade], sign: int = 1):
+        """Add (or, with ``sign=-1``, take back) the batch's traded volume"""
+        with self._lock:
+            for trade in trades:
+                day = as_utc(trade.executed_at).date()
+                amount = trade.quote_quantity.amount * sign
+                for user_id in {trade.buyer_user_id, trade.seller_user_id}:
+                    state = self._volumes.get(user_id)
+                    if state is None:
+                        state = self._volumes[user_id] = _RollingVolume(
+                            self.schedule.tier_for(Decimal("0"))
+                        )
+                    state.expire(day)
+                    state.days[day] = state.days.get(day, Decimal("0")) + amount
+                    state.total += amount
+                    state.tier = self.schedule.tier_for(state.total)
+
+    def clear(self):
+        with self._lock:
+            self._volumes.clear()
+
+
+def _round_fee(amount: Decimal) -> Decimal:
+    return amount.quantize(FEE_PRECISION, rounding=ROUND_HALF_UP)
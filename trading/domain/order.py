@@ -4,21 +4,15 @@ from uuid import uuid4
 from typing import Optional
 
 from .value_objects import Money, TradingPair, OrderSide, OrderType, OrderStatus
+from .symbol_rules import SymbolRules, DEFAULT_SYMBOL_RULES
 from .exceptions import (
     InvalidOrderOperationException,
     OrderValidationException,
-    InvalidPriceException,
     InvalidQuantityException,
-    QuantityBelowMinimumException,
 )
 
 
 class Order:
-    MIN_QUANTITY = Decimal("0.00000001")
-    MAX_QUANTITY = Decimal("1000000")
-    MIN_PRICE = Decimal("0.01")
-    MAX_PRICE = Decimal("1000000000")
-
     def __init__(
         self,
         order_id: str,
@@ -54,6 +48,7 @@ class Order:
         order_type: OrderType,
         price: Money,
         quantity: Decimal,
+        rules: SymbolRules = DEFAULT_SYMBOL_RULES,
     ) -> "Order":
         """Factory method untuk membuat order baru (generic)"""
         order_id = f"ORD-{uuid4().hex[:12].upper()}"
@@ -72,9 +67,9 @@ class Order:
 
         # Validasi sesuai order type
         if order_type == OrderType.LIMIT:
-            order._validate()
+            order._validate(rules)
         elif order_type == OrderType.MARKET:
-            order._validate_quantity()
+            order._validate_quantity(rules)
 
         return order
 
@@ -216,28 +211,15 @@ class Order:
             OrderStatus.REJECTED,
         ]
 
-    def _validate(self):
-        self._validate_price()
-        self._validate_quantity()
+    def _validate(self, rules: SymbolRules = DEFAULT_SYMBOL_RULES):
+        price_units = self._validate_price(rules)
+        quantity_units = self._validate_quantity(rules)
+        if price_units is not None:
+            rules.check_notional(price_units, quantity_units)
 
-    def _validate_price(self):
+    def _validate_price(self, rules: SymbolRules = DEFAULT_SYMBOL_RULES):
         if self.order_type == OrderType.MARKET:
-            return
-
-        if self.price.amount <= 0:
-            raise InvalidPriceException(
-                str(self.price.amount), "Price must be greater than 0"
-            )
-
-        if self.price.amount < self.MIN_PRICE:
-            raise InvalidPriceException(
-                str(self.price.amount), f"Price must be at least {self.MIN_PRICE}"
-            )
-
-        if self.price.amount > self.MAX_PRICE:
-            raise InvalidPriceException(
-                str(self.price.amount), f"Price must not exceed {self.MAX_PRICE}"
-            )
+            return None
 
         if self.price.currency != self.trading_pair.quote_currency:
             raise OrderValidationException(
@@ -245,21 +227,10 @@ class Order:
                 f"quote currency {self.trading_pair.quote_currency}"
             )
 
-    def _validate_quantity(self):
-        if self.quantity <= 0:
-            raise InvalidQuantityException(
-                str(self.quantity), "Quantity must be greater than 0"
-            )
-
-        if self.quantity < self.MIN_QUANTITY:
-            raise QuantityBelowMinimumException(
-                str(self.quantity), str(self.MIN_QUANTITY)
-            )
+        return rules.price_units(self.price.amount)
 
-        if self.quantity > self.MAX_QUANTITY:
-            raise InvalidQuantityException(
-                str(self.quantity), f"Quantity must not exceed {self.MAX_QUANTITY}"
-            )
+    def _validate_quantity(self, rules: SymbolRules = DEFAULT_SYMBOL_RULES) -> int:
+        return rules.quantity_units(self.quantity)
 
     def __str__(self):
         return (
@@ -0,0 +1,73 @@
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from .symbol_rules import SymbolRules, DEFAULT_SYMBOL_RULES
+from .value_objects import TradingPair
+from .exceptions import InvalidTradingPairException, TradingPairNotActiveException
+
+
+@dataclass(frozen=True)
+class PairListing:
+    trading_pair: TradingPair
+    is_active: bool = True
+    rules: SymbolRules = DEFAULT_SYMBOL_RULES
+
+    @property
+    def symbol(self) -> str:
+        return self.trading_pair.symbol
+
+
+class TradingPairRegistry:
+    """Listed trading pairs, consulted on every order.
+
+    The index is never mutated in place: ``replace`` builds a new dict and
+    swaps the reference, so readers always see either the old or the new
+    listing set and never take a lock.
+    """
+
+    def __init__(self):
+        self._index: Dict[str, PairListing] = {}
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def replace(self, listings: Iterable[PairListing]):
+        index = {}
+        for listing in listings:
+            pair = listing.trading_pair
+            # Both accepted spellings resolve with a single lookup
+            index[pair.symbol] = listing
+            index[f"{pair.base_currency}-{pair.quote_currency}"] = listing
+        self._index = index
+        self.loaded_at = time.monotonic()
+
+    def listings(self) -> List[PairListing]:
+        return sorted(
+            {listing.symbol: listing for listing in self._index.values()}.values(),
+            key=lambda listing: listing.symbol,
+        )
+
+    def get(self, symbol: str) -> Optional[PairListing]:
+        listing = self._index.get(symbol)
+        if listing is None:
+            # Unusual spelling (lowercase, padding): normalise and retry
+            try:
+                listing = self._index.get(TradingPair.from_symbol(symbol).symbol)
+            except ValueError:
+                return None
+        return listing
+
+    def require(self, symbol: str) -> PairListing:
+        listing = self.get(symbol)
+        if listing is None:
+            raise InvalidTradingPairException(symbol, "Trading pair is not listed")
+        if not listing.is_active:
+            raise TradingPairNotActiveException(listing.symbol)
+        return listing
+
+    def clear(self):
+        self._index = {}
+        self.loaded_at = None
@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Optional
+
+from .candle import as_utc
+from .exceptions import PriceOutOfRangeException
+from .order import Order
+from .value_objects import OrderType
+
+
+@dataclass(frozen=True)
+class ReferencePrice:
+    price: Decimal
+    executed_at: datetime
+    low: Decimal
+    high: Decimal
+
+
+class ReferencePriceCache:
+    """Last traded price per symbol plus the price band derived from it.
+
+    The band is computed when the reference changes, not per order, so the
+    guard on order entry is a dict lookup and two comparisons. Entries are
+    immutable and swapped whole, which keeps readers lock-free.
+    """
+
+    def __init__(self, max_deviation: Decimal = Decimal("0.10")):
+        self.max_deviation = max_deviation
+        self._prices: Dict[str, ReferencePrice] = {}
+
+    def update(self, symbol: str, price: Decimal, executed_at: datetime):
+        executed_at = as_utc(executed_at)
+        current = self._prices.get(symbol)
+        # Fills can arrive out of order; only a newer trade moves the reference
+        if current is not None and current.executed_at > executed_at:
+            return
+        self._prices[symbol] = ReferencePrice(
+            price=price,
+            executed_at=executed_at,
+            low=price * (1 - self.max_deviation),
+            high=price * (1 + self.max_deviation),
+        )
+
+    def get(self, symbol: str) -> Optional[ReferencePrice]:
+        return self._prices.get(symbol)
+
+    def check(self, order: Order):
+        """Reject LIMIT orders priced outside the band of their symbol"""
+        if order.order_type != OrderType.LIMIT:
+            return
+
+        reference = self._prices.get(order.trading_pair.symbol)
+        if reference is None:
+            # No trade seen yet: nothing to anchor a band to
+            return
+
+        price = order.price.amount
+        if price < reference.low or price > reference.high:
+            raise PriceOutOfRangeException(
+                str(price),
+                str(reference.low),
+                str(reference.high),
+                f"Price deviates more than {self.max_deviation * 100}% "
+                f"from last traded price {reference.price}",
+            )
+
+    def clear(self):
+        self._prices = {}
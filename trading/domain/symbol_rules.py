@@ -0,0 +1,140 @@
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
+
+from .exceptions import (
+    InvalidPriceException,
+    InvalidQuantityException,
+    OrderValidationException,
+    PriceOutOfRangeException,
+    QuantityBelowMinimumException,
+    QuantityAboveMaximumException,
+)
+
+RULE_FIELDS = (
+    "tick_size",
+    "step_size",
+    "min_price",
+    "max_price",
+    "min_quantity",
+    "max_quantity",
+    "min_notional",
+)
+
+
+def _exponent(step: Decimal) -> int:
+    """Decimal places needed to express ``step`` as an integer"""
+    return max(0, -step.normalize().as_tuple().exponent)
+
+
+def _units(value: Decimal, exp: int, rounding: str) -> int:
+    return int(value.scaleb(exp).to_integral_value(rounding=rounding))
+
+
+@dataclass(frozen=True)
+class SymbolRules:
+    """Trading rules of one symbol, precompiled into integer units.
+
+    Prices are counted in ticks of ``10^-price_exp`` and quantities in
+    steps of ``10^-quantity_exp``; every bound is converted once when the
+    rules are built, so validating an order is a handful of int checks.
+    """
+
+    tick_size: Decimal = Decimal("0.00000001")
+    step_size: Decimal = Decimal("0.00000001")
+    min_price: Decimal = Decimal("0.01")
+    max_price: Decimal = Decimal("1000000000")
+    min_quantity: Decimal = Decimal("0.00000001")
+    max_quantity: Decimal = Decimal("1000000")
+    min_notional: Decimal = Decimal("0")
+
+    price_exp: int = field(init=False, repr=False, compare=False)
+    quantity_exp: int = field(init=False, repr=False, compare=False)
+    _tick: int = field(init=False, repr=False, compare=False)
+    _step: int = field(init=False, repr=False, compare=False)
+    _min_price: int = field(init=False, repr=False, compare=False)
+    _max_price: int = field(init=False, repr=False, compare=False)
+    _min_quantity: int = field(init=False, repr=False, compare=False)
+    _max_quantity: int = field(init=False, repr=False, compare=False)
+    _min_notional: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.tick_size <= 0 or self.step_size <= 0:
+            raise ValueError("Tick size and step size must be greater than 0")
+        if self.min_price > self.max_price or self.min_quantity > self.max_quantity:
+            raise ValueError("Minimum bounds must not exceed maximum bounds")
+
+        price_exp = _exponent(self.tick_size)
+        quantity_exp = _exponent(self.step_size)
+        compiled = {
+            "price_exp": price_exp,
+            "quantity_exp": quantity_exp,
+            "_tick": _units(self.tick_size, price_exp, ROUND_FLOOR),
+            "_step": _units(self.step_size, quantity_exp, ROUND_FLOOR),
+            "_min_price": _units(self.min_price, price_exp, ROUND_CEILING),
+            "_max_price": _units(self.max_price, price_exp, ROUND_FLOOR),
+            "_min_quantity": _units(self.min_quantity, quantity_exp, ROUND_CEILING),
+            "_max_quantity": _units(self.max_quantity, quantity_exp, ROUND_FLOOR),
+            "_min_notional": _units(
+                self.min_notional, price_exp + quantity_exp, ROUND_CEILING
+            ),
+        }
+        for name, value in compiled.items():
+            object.__setattr__(self, name, value)
+
+    def price_units(self, price: Decimal) -> int:
+        scaled = price.scaleb(self.price_exp)
+        units = int(scaled)
+        if price <= 0:
+            raise InvalidPriceException(str(price), "Price must be greater than 0")
+        if units < self._min_price:
+            raise PriceOutOfRangeException(
+                str(price),
+                str(self.min_price),
+                str(self.max_price),
+                f"Price must be at least {self.min_price}",
+            )
+        if units > self._max_price or (units == self._max_price and units != scaled):
+            raise PriceOutOfRangeException(
+                str(price),
+                str(self.min_price),
+                str(self.max_price),
+                f"Price must not exceed {self.max_price}",
+            )
+        if units != scaled or units % self._tick:
+            raise InvalidPriceException(
+                str(price), f"Price must be a multiple of tick size {self.tick_size}"
+            )
+        return units
+
+    def quantity_units(self, quantity: Decimal) -> int:
+        scaled = quantity.scaleb(self.quantity_exp)
+        units = int(scaled)
+        if quantity <= 0:
+            raise InvalidQuantityException(
+                str(quantity), "Quantity must be greater than 0"
+            )
+        if units < self._min_quantity:
+            raise QuantityBelowMinimumException(str(quantity), str(self.min_quantity))
+        if units > self._max_quantity or (
+            units == self._max_quantity and units != scaled
+        ):
+            raise QuantityAboveMaximumException(str(quantity), str(self.max_quantity))
+        if units != scaled or units % self._step:
+            raise InvalidQuantityException(
+                str(quantity),
+                f"Quantity must be a multiple of step size {self.step_size}",
+            )
+        return units
+
+    def check_notional(self, price_units: int, quantity_units: int):
+        if price_units * quantity_units < self._min_notional:
+            notional = Decimal(price_units * quantity_units).scaleb(
+                -(self.price_exp + self.quantity_exp)
+            )
+            raise OrderValidationException(
+                f"Order value {notional} is below minimum notional "
+                f"{self.min_notional}"
+            )
+
+
+DEFAULT_SYMBOL_RULES = SymbolRules()
@@ -0,0 +1,206 @@
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from .candle import as_utc
+
+WINDOW_MINUTES = 24 * 60
+
+
+class _MinuteBucket:
+    __slots__ = ("minute", "high", "low", "volume", "quote_volume", "trade_count")
+
+    def __init__(self):
+        self.minute = -1
+        self.reset(-1)
+
+    def reset(self, minute: int):
+        self.minute = minute
+        self.high: Optional[Decimal] = None
+        self.low: Optional[Decimal] = None
+        self.volume = Decimal("0")
+        self.quote_volume = Decimal("0")
+        self.trade_count = 0
+
+
+class TickerStats:
+    def __init__(
+        self,
+        symbol: str,
+        last_price: Optional[Decimal],
+        high: Optional[Decimal],
+        low: Optional[Decimal],
+        volume: Decimal,
+        quote_volume: Decimal,
+        trade_count: int,
+        last_trade_at: Optional[datetime],
+    ):
+        self.symbol = symbol
+        self.last_price = last_price
+        self.high = high
+        self.low = low
+        self.volume = volume
+        self.quote_volume = quote_volume
+        self.trade_count = trade_count
+        self.last_trade_at = last_trade_at
+
+    @property
+    def vwap(self) -> Optional[Decimal]:
+        if not self.volume:
+            return None
+        return self.quote_volume / self.volume
+
+
+class RollingTicker:
+    """24h statistics for one symbol over a ring buffer of per-minute buckets.
+
+    Volume totals are kept as running sums: a trade adds to them and an
+    expiring minute subtracts its bucket. High/low use monotonic deques of
+    (minute, price), so both trades and reads are amortized O(1) and never
+    rescan the window.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self._buckets = [_MinuteBucket() for _ in range(WINDOW_MINUTES)]
+        self._head_minute: Optional[int] = None
+        self._max: Deque[Tuple[int, Decimal]] = deque()
+        self._min: Deque[Tuple[int, Decimal]] = deque()
+        self._volume = Decimal("0")
+        self._quote_volume = Decimal("0")
+        self._trade_count = 0
+        self._last_price: Optional[Decimal] = None
+        self._last_trade_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def apply_trade(self, price: Decimal, quantity: Decimal, executed_at: datetime):
+        executed_at = as_utc(executed_at)
+        minute = int(executed_at.timestamp()) // 60
+
+        with self._lock:
+            if self._last_trade_at is None or executed_at >= self._last_trade_at:
+                self._last_price = price
+                self._last_trade_at = executed_at
+
+            if self._head_minute is None or minute > self._head_minute:
+                self._advance(minute)
+            elif minute <= self._head_minute - WINDOW_MINUTES:
+                return  # Older than the window
+
+            bucket = self._buckets[minute % WINDOW_MINUTES]
+            if bucket.minute != minute:
+                bucket.reset(minute)
+
+            quote_quantity = price * quantity
+            bucket.volume += quantity
+            bucket.quote_volume += quote_quantity
+            bucket.trade_count += 1
+            self._volume += quantity
+            self._quote_volume += quote_quantity
+            self._trade_count += 1
+
+            new_high = bucket.high is None or price > bucket.high
+            new_low = bucket.low is None or price < bucket.low
+            if new_high:
+                bucket.high = price
+            if new_low:
+                bucket.low = price
+
+            if minute == self._head_minute:
+                if new_high:
+                    self._push(self._max, minute, price, lambda old: old <= price)
+                if new_low:
+                    self._push(self._min, minute, price, lambda old: old >= price)
+            elif new_high or new_low:
+                # Late trade for an older minute; rare enough to rebuild
+                self._rebuild_extremes()
+
+    def snapshot(self, now: Optional[datetime] = None) -> TickerStats:
+        now = as_utc(now) if now else datetime.now(timezone.utc)
+        minute = int(now.timestamp()) // 60
+
+        with self._lock:
+            if self._head_minute is not None and minute > self._head_minute:
+                self._advance(minute)
+
+            return TickerStats(
+                symbol=self.symbol,
+                last_price=self._last_price,
+                high=self._max[0][1] if self._max else None,
+                low=self._min[0][1] if self._min else None,
+                volume=self._volume,
+                quote_volume=self._quote_volume,
+                trade_count=self._trade_count,
+                last_trade_at=self._last_trade_at,
+            )
+
+    def _advance(self, minute: int):
+        """Move the window head to ``minute``, expiring buckets that fall out"""
+        if self._head_minute is not None:
+            oldest_kept = minute - WINDOW_MINUTES + 1
+            first_expired = self._head_minute - WINDOW_MINUTES + 1
+            # At most one full lap over the ring, however long the gap
+            for expired in range(
+                first_expired, min(oldest_kept, self._head_minute + 1)
+            ):
+                bucket = self._buckets[expired % WINDOW_MINUTES]
+                if bucket.minute == expired:
+                    self._volume -= bucket.volume
+                    self._quote_volume -= bucket.quote_volume
+                    self._trade_count -= bucket.trade_count
+                    bucket.reset(-1)
+
+            while self._max and self._max[0][0] < oldest_kept:
+                self._max.popleft()
+            while self._min and self._min[0][0] < oldest_kept:
+                self._min.popleft()
+
+        self._head_minute = minute
+
+    @staticmethod
+    def _push(extremes: Deque, minute: int, price: Decimal, dominated):
+        while extremes and dominated(extremes[-1][1]):
+            extremes.pop()
+        extremes.append((minute, price))
+
+    def _rebuild_extremes(self):
+        self._max.clear()
+        self._min.clear()
+        live = sorted(
+            (b for b in self._buckets if b.minute >= 0 and b.high is not None),
+            key=lambda b: b.minute,
+        )
+        for bucket in live:
+            high, low = bucket.high, bucket.low
+            self._push(self._max, bucket.minute, high, lambda old: old <= high)
+            self._push(self._min, bucket.minute, low, lambda old: old >= low)
+
+
+class TickerBook:
+    def __init__(self):
+        self._tickers: Dict[str, RollingTicker] = {}
+        self._lock = threading.Lock()
+
+    def apply_trade(
+        self, symbol: str, price: Decimal, quantity: Decimal, executed_at: datetime
+    ):
+        ticker = self._tickers.get(symbol)
+        if ticker is None:
+            with self._lock:
+                ticker = self._tickers.setdefault(symbol, RollingTicker(symbol))
+        ticker.apply_trade(price, quantity, executed_at)
+
+    def snapshot(
+        self, symbol: str, now: Optional[datetime] = None
+    ) -> Optional[TickerStats]:
+        ticker = self._tickers.get(symbol)
+        return ticker.snapshot(now) if ticker else None
+
+    def snapshots(self, now: Optional[datetime] = None) -> List[TickerStats]:
+        return [ticker.snapshot(now) for ticker in list(self._tickers.values())]
+
+    def clear(self):
+        with self._lock:
+            self._tickers.clear()
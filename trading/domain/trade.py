@@ -0,0 +1,110 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+from typing import Optional
+
+from .value_objects import Money, TradingPair
+from .exceptions import InvalidTradeException
+
+
+class Trade:
+    def __init__(
+        self,
+        trade_id: str,
+        trading_pair: TradingPair,
+        buy_order_id: str,
+        sell_order_id: str,
+        buyer_user_id: str,
+        seller_user_id: str,
+        price: Money,
+        quantity: Decimal,
+        buyer_fee: Decimal = Decimal("0"),
+        seller_fee: Decimal = Decimal("0"),
+        executed_at: Optional[datetime] = None,
+    ):
+        self.trade_id = trade_id
+        self.trading_pair = trading_pair
+        self.buy_order_id = buy_order_id
+        self.sell_order_id = sell_order_id
+        self.buyer_user_id = buyer_user_id
+        self.seller_user_id = seller_user_id
+        self.price = price
+        self.quantity = quantity
+        self.buyer_fee = buyer_fee
+        self.seller_fee = seller_fee
+        self.executed_at = executed_at or datetime.now(timezone.utc)
+
+    @classmethod
+    def create(
+        cls,
+        trading_pair: TradingPair,
+        buy_order_id: str,
+        sell_order_id: str,
+        buyer_user_id: str,
+        seller_user_id: str,
+        price: Money,
+        quantity: Decimal,
+        executed_at: Optional[datetime] = None,
+    ) -> "Trade":
+        """Factory method untuk mencatat trade baru hasil matching"""
+        trade_id = f"TRD-{uuid4().hex[:12].upper()}"
+
+        trade = cls(
+            trade_id=trade_id,
+            trading_pair=trading_pair,
+            buy_order_id=buy_order_id,
+            sell_order_id=sell_order_id,
+            buyer_user_id=buyer_user_id,
+            seller_user_id=seller_user_id,
+            price=price,
+            quantity=quantity,
+            executed_at=executed_at,
+        )
+
+        trade._validate()
+        return trade
+
+    @property
+    def quote_quantity(self) -> Money:
+        return Money(self.price.amount * self.quantity, self.price.currency)
+
+    def involves(self, user_id: str) -> bool:
+        return user_id in (self.buyer_user_id, self.seller_user_id)
+
+    def _validate(self):
+        if self.price.amount <= 0:
+            raise InvalidTradeException(
+                f"Invalid trade price {self.price.amount}: must be greater than 0"
+            )
+
+        if self.quantity <= 0:
+            raise InvalidTradeException(
+                f"Invalid trade quantity {self.quantity}: must be greater than 0"
+            )
+
+        if self.buy_order_id == self.sell_order_id:
+            raise InvalidTradeException(
+                f"Trade cannot match order {self.buy_order_id} against itself"
+            )
+
+        if self.price.currency != self.trading_pair.quote_currency:
+            raise InvalidTradeException(
+                f"Price currency {self.price.currency} does not match "
+                f"quote currency {self.trading_pair.quote_currency}"
+            )
+
+    def __str__(self):
+        return (
+            f"Trade({self.trade_id}, "
+            f"{self.quantity} {self.trading_pair.symbol} @ {self.price})"
+        )
+
+    def __repr__(self):
+        return (
+            f"Trade(trade_id='{self.trade_id}', "
+            f"trading_pair={self.trading_pair}, "
+            f"buy_order_id='{self.buy_order_id}', "
+            f"sell_order_id='{self.sell_order_id}', "
+            f"price={self.price}, "
+            f"quantity={self.quantity})"
+        )
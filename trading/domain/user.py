@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from .exceptions import UserValidationException
+
+ROLE_USER = "user"
+ROLE_ADMIN = "admin"
+ROLES = (ROLE_USER, ROLE_ADMIN)
+
+
+class User:
+    def __init__(
+        self,
+        username: str,
+        hashed_password: str,
+        role: str = ROLE_USER,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+    ):
+        self.username = username
+        self.hashed_password = hashed_password
+        self.role = role
+        self.created_at = created_at or datetime.now(timezone.utc)
+        self.updated_at = updated_at or datetime.now(timezone.utc)
+
+    @classmethod
+    def create(
+        cls, username: str, hashed_password: str, role: str = ROLE_USER
+    ) -> "User":
+        if not username or not username.strip():
+            raise UserValidationException("Username is required")
+        if len(username) > 50:
+            raise UserValidationException("Username must not exceed 50 characters")
+        cls._validate_role(role)
+        return cls(username=username, hashed_password=hashed_password, role=role)
+
+    def change_password(self, hashed_password: str):
+        self.hashed_password = hashed_password
+        self.updated_at = datetime.now(timezone.utc)
+
+    def change_role(self, role: str):
+        self._validate_role(role)
+        self.role = role
+        self.updated_at = datetime.now(timezone.utc)
+
+    def as_record(self) -> dict:
+        """Plain record handed to the auth layer as ``current_user``"""
+        return {
+            "username": self.username,
+            "role": self.role,
+            "hashed_password": self.hashed_password,
+        }
+
+    @staticmethod
+    def _validate_role(role: str):
+        if role not in ROLES:
+            raise UserValidationException(
+                f"Invalid role {role}. Expected one of: {', '.join(ROLES)}"
+            )
+
+    def __repr__(self):
+        return f"User(username='{self.username}', role='{self.role}')"
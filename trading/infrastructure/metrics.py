@@ -0,0 +1,268 @@
+"""Latency histograms and gauges rendered in Prometheus text format.
+
+Recording must stay cheap on the hot path, so histograms are sharded per
+thread: ``observe`` only touches the calling thread's own counters and
+never takes a lock. Shards are summed when ``/metrics`` is scraped.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from .request_timing import add_stage, enter_use_case, exit_use_case
+
+# Seconds; covers sub-millisecond repository calls up to slow requests
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards: List[Dict[tuple, list]] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> Dict[tuple, list]:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def observe(self, seconds: float, *labels: str):
+        shard = self._shard()
+        cell = shard.get(labels)
+        if cell is None:
+            # One slot per bucket, one for +Inf, and the running sum
+            cell = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        cell[bisect_left(self.buckets, seconds)] += 1
+        cell[-1] += seconds
+
+    def collect(self) -> Dict[tuple, Tuple[List[int], float]]:
+        """Per label set: cumulative bucket counts (last is +Inf) and sum"""
+        with self._lock:
+            shards = list(self._shards)
+
+        merged: Dict[tuple, list] = {}
+        for shard in shards:
+            for labels, cell in list(shard.items()):
+                total = merged.setdefault(labels, [0] * len(cell))
+                for i, value in enumerate(cell):
+                    total[i] += value
+
+        result = {}
+        for labels, cell in merged.items():
+            counts, running = [], 0
+            for count in cell[:-1]:
+                running += count
+                counts.append(running)
+            result[labels] = (counts, cell[-1])
+        return result
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for labels, (counts, total) in sorted(self.collect().items()):
+            base = list(zip(self.label_names, labels))
+            for bound, count in zip(bounds, counts):
+                lines.append(
+                    f"{self.name}_bucket{_labels(base + [('le', bound)])} {count}"
+                )
+            lines.append(f"{self.name}_sum{_labels(base)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_labels(base)} {counts[-1]}")
+        return lines
+
+    def clear(self):
+        with self._lock:
+            for shard in self._shards:
+                shard.clear()
+
+
+class Gauge:
+    """Sampled from ``read`` at scrape time, so it costs nothing in between"""
+
+    def __init__(self, name: str, help: str, read: Callable[[], float]):
+        self.name = name
+        self.help = help
+        self.read = read
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {_format_value(self.read())}",
+        ]
+
+    def clear(self):
+        pass
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, help: str, label_names: Sequence[str]) -> Histogram:
+        return self._register(Histogram(name, help, label_names))
+
+    def gauge(self, name: str, help: str, read: Callable[[], float]) -> Gauge:
+        # Re-registering replaces the reader, e.g. when the engine is rebuilt
+        with self._lock:
+            gauge = self._metrics[name] = Gauge(name, help, read)
+        return gauge
+
+    def _register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+metrics = MetricsRegistry()
+
+request_duration = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+use_case_duration = metrics.histogram(
+    "use_case_duration_seconds",
+    "Application use case latency",
+    ("use_case",),
+)
+repository_duration = metrics.histogram(
+    "repository_duration_seconds",
+    "Repository method latency",
+    ("repository", "method"),
+)
+
+
+def timed_use_case(execute):
+    """Record each call of a use case method under its class name.
+
+    The name is also made current for the call, for attribution below it.
+    """
+    use_case = execute.__qualname__.split(".")[0]
+
+    @functools.wraps(execute)
+    def wrapper(*args, **kwargs):
+        token = enter_use_case(use_case)
+        start = time.perf_counter()
+        try:
+            return execute(*args, **kwargs)
+        finally:
+            use_case_duration.observe(time.perf_counter() - start, use_case)
+            exit_use_case(token)
+
+    return wrapper
+
+
+def timed_repository(cls):
+    """Time every public method of a repository class.
+
+    Generator methods stream rows lazily after they return, so timing the
+    call would measure nothing; they are left as they are.
+    """
+    for name, method in list(vars(cls).items()):
+        if (
+            name.startswith("_")
+            or not inspect.isfunction(method)
+            or inspect.isgeneratorfunction(method)
+        ):
+            continue
+        setattr(cls, name, _timed_method(method, cls.__name__, name))
+    return cls
+
+
+def _timed_method(method, repository: str, name: str):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            repository_duration.observe(elapsed, repository, name)
+            add_stage("db", elapsed)
+
+    return wrapper
+
+
+def register_pool_metrics(engine):
+    """Connection pool gauges; pools without a counter report 0"""
+    pool = engine.pool
+
+    def reader(attribute: str) -> Callable[[], float]:
+        method = getattr(pool, attribute, None)
+        return method if callable(method) else (lambda: 0)
+
+    metrics.gauge("db_pool_size", "Configured pool size", reader("size"))
+    metrics.gauge(
+        "db_pool_checked_out", "Connections currently in use", reader("checkedout")
+    )
+    metrics.gauge(
+        "db_pool_checked_in", "Idle connections in the pool", reader("checkedin")
+    )
+    metrics.gauge(
+        "db_pool_overflow",
+        "Connections opened beyond the pool size",
+        reader("overflow"),
+    )
+
+
+def _labels(pairs) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
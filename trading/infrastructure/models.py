@@ -1,4 +1,12 @@
-from sqlalchemy import Column, String, Numeric, DateTime, Enum as SQLEnum
+from sqlalchemy import (
+    Column,
+    String,
+    Numeric,
+    DateTime,
+    Integer,
+    Boolean,
+    Enum as SQLEnum,
+)
 from database import Base
 import enum
 
@@ -75,3 +83,97 @@ class TradeModel(Base):
             f"price={self.price}, "
             f"quantity={self.quantity})>"
         )
+
+
+class CandleModel(Base):
+    __tablename__ = "candles"
+
+    symbol = Column(String(20), primary_key=True)
+    interval = Column(String(4), primary_key=True)
+    open_time = Column(DateTime, primary_key=True)
+    open = Column(Numeric(precision=20, scale=8), nullable=False)
+    high = Column(Numeric(precision=20, scale=8), nullable=False)
+    low = Column(Numeric(precision=20, scale=8), nullable=False)
+    close = Column(Numeric(precision=20, scale=8), nullable=False)
+    volume = Column(Numeric(precision=28, scale=8), nullable=False, default=0)
+    quote_volume = Column(Numeric(precision=28, scale=8), nullable=False, default=0)
+    trade_count = Column(Integer, nullable=False, default=0)
+    last_trade_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return (
+            f"<CandleModel(symbol={self.symbol}, "
+            f"interval={self.interval}, "
+            f"open_time={self.open_time}, "
+            f"close={self.close})>"
+        )
+
+
+class BalanceModel(Base):
+    __tablename__ = "balances"
+
+    user_id = Column(String(50), primary_key=True)
+    currency = Column(String(10), primary_key=True)
+    available = Column(Numeric(precision=28, scale=8), nullable=False, default=0)
+    locked = Column(Numeric(precision=28, scale=8), nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<BalanceModel(user_id={self.user_id}, "
+            f"currency={self.currency}, "
+            f"available={self.available}, "
+            f"locked={self.locked})>"
+        )
+
+
+class UserModel(Base):
+    __tablename__ = "users"
+
+    username = Column(String(50), primary_key=True)
+    hashed_password = Column(String(255), nullable=False)
+    role = Column(String(20), nullable=False, default="user")
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<UserModel(username={self.username}, role={self.role})>"
+
+
+class ApiKeyModel(Base):
+    __tablename__ = "api_keys"
+
+    key_id = Column(String(50), primary_key=True)
+    username = Column(String(50), nullable=False, index=True)
+    secret = Column(String(100), nullable=False)
+    is_active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<ApiKeyModel(key_id={self.key_id}, "
+            f"username={self.username}, is_active={self.is_active})>"
+        )
+
+
+class TradingPairModel(Base):
+    __tablename__ = "trading_pairs"
+
+    symbol = Column(String(20), primary_key=True)
+    base_currency = Column(String(10), nullable=False)
+    quote_currency = Column(String(10), nullable=False)
+    is_active = Column(Boolean, nullable=False, default=True)
+    tick_size = Column(Numeric(precision=20, scale=8), nullable=False)
+    step_size = Column(Numeric(precision=20, scale=8), nullable=False)
+    min_price = Column(Numeric(precision=20, scale=8), nullable=False)
+    max_price = Column(Numeric(precision=20, scale=8), nullable=False)
+    min_quantity = Column(Numeric(precision=20, scale=8), nullable=False)
+    max_quantity = Column(Numeric(precision=20, scale=8), nullable=False)
+    min_notional = Column(Numeric(precision=20, scale=8), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<TradingPairModel(symbol={self.symbol}, " f"is_active={self.is_active})>"
+        )
@@ -0,0 +1,160 @@
+"""Argon2 verification in a dedicated, bounded process pool.
+
+Each verification costs ~64 MiB and tens of milliseconds of CPU. Running
+it in worker processes keeps it off the request threadpool and out of the
+GIL, and the pending limit turns a login burst into fast 503s instead of
+a queue that starves order traffic. Async routes (login, password
+changes) await the pool; synchronous hashing (registration) blocks its
+thread but counts against the same limit. A pool whose worker died
+is replaced on the next call instead of failing every call after it.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+
+PASSWORD_VERIFY_WORKERS = int(os.getenv("PASSWORD_VERIFY_WORKERS", "2"))
+PASSWORD_VERIFY_MAX_PENDING = int(os.getenv("PASSWORD_VERIFY_MAX_PENDING", "32"))
+
+_hasher = PasswordHasher()
+
+
+def _verify(hashed: str, plain: str) -> bool:
+    # Runs in a worker process
+    try:
+        return _hasher.verify(hashed, plain)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def _hash(plain: str) -> str:
+    return _hasher.hash(plain)
+
+
+class PasswordPoolSaturated(Exception):
+    pass
+
+
+class PasswordVerifierPool:
+    def __init__(
+        self,
+        workers: int = PASSWORD_VERIFY_WORKERS,
+        max_pending: int = PASSWORD_VERIFY_MAX_PENDING,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # spawn: workers must not inherit the server's threads or DB
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor):
+        # Only the first caller to see a broken pool replaces it
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _admit(self) -> float:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordPoolSaturated(
+                    f"{self.pending} password operations already pending"
+                )
+            self.pending += 1
+        return time.perf_counter()
+
+    def _finish(self, started: float):
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+
+    async def verify(self, hashed: str, plain: str) -> bool:
+        return await self._run(_verify, hashed, plain)
+
+    async def hash(self, plain: str) -> str:
+        return await self._run(_hash, plain)
+
+    async def _run(self, fn, *args):
+        started = self._admit()
+        try:
+            loop = asyncio.get_running_loop()
+            for retry in (True, False):
+                executor = self._get_executor()
+                try:
+                    return await loop.run_in_executor(executor, fn, *args)
+                except BrokenProcessPool:
+                    self._discard(executor)
+                    if not retry:
+                        raise
+        finally:
+            self._finish(started)
+
+    def hash_blocking(self, plain: str) -> str:
+        """Hash from synchronous code; the work still runs in the pool"""
+        return self._run_blocking(_hash, plain)
+
+    def verify_blocking(self, hashed: str, plain: str) -> bool:
+        return self._run_blocking(_verify, hashed, plain)
+
+    def _run_blocking(self, fn, *args):
+        started = self._admit()
+        try:
+            for retry in (True, False):
+                executor = self._get_executor()
+                try:
+                    return executor.submit(fn, *args).result()
+                except BrokenProcessPool:
+                    self._discard(executor)
+                    if not retry:
+                        raise
+        finally:
+            self._finish(started)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_seconds": (
+                self.total_seconds / self.completed if self.completed else 0.0
+            ),
+            "max_seconds": self.max_seconds,
+        }
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+password_pool = PasswordVerifierPool()
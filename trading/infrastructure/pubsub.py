@@ -0,0 +1,121 @@
+"""In-process publish/subscribe for pushing events to WebSocket clients.
+
+Publishers run anywhere (request threads, commit hooks); each subscriber
+lives on an event loop and receives messages through its own bounded
+queue, handed over with ``call_soon_threadsafe``. Messages are published
+already serialized, so fan-out never re-encodes per subscriber.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Set
+
+DEFAULT_MAX_PENDING = 256
+
+_CLOSED = object()
+
+
+class SubscriptionClosed(Exception):
+    pass
+
+
+class Subscription:
+    """Bounded inbox of one subscriber; overflowing it closes the subscription"""
+
+    def __init__(self, topic: str, max_pending: int = DEFAULT_MAX_PENDING):
+        self.topic = topic
+        self.max_pending = max_pending
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        self.overflowed = False
+        self._queue: Deque[Any] = deque()
+        self._ready = asyncio.Event()
+
+    def deliver(self, message: Any):
+        """Thread-safe entry point used by the publisher"""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self.offer(message)
+        else:
+            self.loop.call_soon_threadsafe(self.offer, message)
+
+    def offer(self, message: Any):
+        # Runs on the subscriber's loop
+        if self.closed:
+            return
+        if len(self._queue) >= self.max_pending:
+            # A consumer this far behind resyncs instead of growing memory
+            self.overflowed = True
+            self.close()
+            return
+        self._enqueue(message)
+
+    def _enqueue(self, message: Any):
+        self._queue.append(message)
+        self._ready.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._enqueue(_CLOSED)
+
+    async def get(self) -> Any:
+        while not self._queue:
+            self._ready.clear()
+            await self._ready.wait()
+        message = self._queue.popleft()
+        if message is _CLOSED:
+            raise SubscriptionClosed(self.topic)
+        return message
+
+
+class PubSub:
+    def __init__(self):
+        self._topics: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def add(self, subscription: Subscription) -> Subscription:
+        with self._lock:
+            self._topics.setdefault(subscription.topic, set()).add(subscription)
+        return subscription
+
+    def remove(self, subscription: Subscription):
+        with self._lock:
+            subscribers = self._topics.get(subscription.topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._topics[subscription.topic]
+
+    def subscriber_count(self, topic: str) -> int:
+        return len(self._topics.get(topic, ()))
+
+    def publish(self, topic: str, message: Any):
+        subscribers = self._topics.get(topic)
+        if not subscribers:
+            return
+        with self._lock:
+            subscribers = tuple(subscribers)
+        self.published += 1
+        for subscription in subscribers:
+            try:
+                subscription.deliver(message)
+            except RuntimeError:
+                # Subscriber's loop is gone
+                self.remove(subscription)
+
+    def clear(self):
+        with self._lock:
+            for subscribers in self._topics.values():
+                for subscription in subscribers:
+                    subscription.closed = True
+            self._topics.clear()
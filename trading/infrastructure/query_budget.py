@@ -0,0 +1,188 @@
+"""Per-request SQL statement and row budgets.
+
+While a request is being counted, every statement on any engine and every
+row fetched from its cursor (ORM entities, column-only and Core queries
+alike) is tallied in a context variable. The API layer compares the tally
+with the route's budget before the response starts: N+1 loops and chatty
+repositories (e.g. the SELECT ``merge`` issues before an UPDATE) surface
+as over-budget requests instead of slow ones.
+
+Configuration (environment):
+
+- ``QUERY_BUDGET_MODE``: ``off`` (default), ``warn`` to log over-budget
+  requests, ``raise`` to fail them (used by the test suite)
+- ``QUERY_BUDGET_STATEMENTS``: default statements per request (25)
+- ``QUERY_BUDGET_ROWS``: default rows fetched per request (1000)
+"""
+
+import logging
+import os
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+MODE_OFF = "off"
+MODE_WARN = "warn"
+MODE_RAISE = "raise"
+
+QUERY_BUDGET_MODE = os.getenv("QUERY_BUDGET_MODE", MODE_OFF)
+QUERY_BUDGET_STATEMENTS = int(os.getenv("QUERY_BUDGET_STATEMENTS", "25"))
+QUERY_BUDGET_ROWS = int(os.getenv("QUERY_BUDGET_ROWS", "1000"))
+
+logger = logging.getLogger("trading.sql.budget")
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    max_statements: Optional[int] = QUERY_BUDGET_STATEMENTS
+    max_rows: Optional[int] = QUERY_BUDGET_ROWS  # None: unlimited
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class QueryCounter:
+    __slots__ = ("statements", "rows", "by_statement")
+
+    def __init__(self):
+        self.statements = 0
+        self.rows = 0
+        self.by_statement: Counter = Counter()
+
+    def violations(self, budget: QueryBudget) -> List[str]:
+        problems = []
+        if budget.max_statements is not None and (
+            self.statements > budget.max_statements
+        ):
+            problems.append(
+                f"{self.statements} statements (budget {budget.max_statements})"
+            )
+        if budget.max_rows is not None and self.rows > budget.max_rows:
+            problems.append(f"{self.rows} rows (budget {budget.max_rows})")
+        return problems
+
+    def most_repeated(self) -> Optional[tuple]:
+        """(statement, count) issued most often; the usual N+1 suspect"""
+        common = self.by_statement.most_common(1)
+        return common[0] if common else None
+
+
+_counter: ContextVar[Optional[QueryCounter]] = ContextVar("query_counter", default=None)
+
+
+class QueryBudgets:
+    def __init__(
+        self,
+        mode: str = QUERY_BUDGET_MODE,
+        default: QueryBudget = QueryBudget(),
+    ):
+        self.mode = mode
+        self.default = default
+        self._routes: Dict[str, QueryBudget] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != MODE_OFF
+
+    def set_route(self, route: str, budget: QueryBudget):
+        self._routes[route] = budget
+
+    def budget_for(self, route: Optional[str]) -> QueryBudget:
+        return self._routes.get(route, self.default)
+
+    def start(self) -> Token:
+        return _counter.set(QueryCounter())
+
+    def end(self, token: Token):
+        _counter.reset(token)
+
+    def check(
+        self,
+        method: str,
+        route: Optional[str],
+        counter: QueryCounter,
+        can_fail: bool = True,
+    ) -> bool:
+        """Warn about (or, in raise mode, fail) a request over its budget.
+
+        ``can_fail`` is False once the response has started; it is then
+        only logged. Returns whether the request was over budget.
+        """
+        problems = counter.violations(self.budget_for(route))
+        if not problems:
+            return False
+
+        repeated = counter.most_repeated()
+        message = f"{method} {route or '-'} over query budget: " + ", ".join(problems)
+        if repeated:
+            message += f"; most repeated ({repeated[1]}x): {repeated[0]}"
+
+        if self.mode == MODE_RAISE and can_fail:
+            raise QueryBudgetExceeded(message)
+        logger.warning(
+            message,
+            extra={
+                "method": method,
+                "route": route,
+                "statements": counter.statements,
+                "rows": counter.rows,
+            },
+        )
+        return True
+
+
+def current_counter() -> Optional[QueryCounter]:
+    return _counter.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    counter = _counter.get()
+    if counter is not None:
+        counter.statements += 1
+        counter.by_statement[statement] += 1
+
+
+class _CountingCursor:
+    """DBAPI cursor proxy tallying every row a result fetches through it"""
+
+    __slots__ = ("_cursor", "_counter")
+
+    def __init__(self, cursor, counter: QueryCounter):
+        self._cursor = cursor
+        self._counter = counter
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._counter.rows += 1
+        return row
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        self._counter.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._counter.rows += len(rows)
+        return rows
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _count_rows(conn, cursor, statement, parameters, context, executemany):
+    counter = _counter.get()
+    # Results read rows through context.cursor, so the proxy sees every fetch
+    if counter is not None and context is not None and cursor.description:
+        context.cursor = _CountingCursor(cursor, counter)
+
+
+query_budgets = QueryBudgets()
@@ -0,0 +1,138 @@
+"""Slow-query log for SQLAlchemy engines.
+
+Replaces ``echo=True``: cursor events time each statement and only those
+over the threshold are logged, tagged with the route and use case that
+issued them and, on SQLite, with their ``EXPLAIN QUERY PLAN``. A sample
+rate below 1 times only that fraction of statements, which keeps the
+hooks cheap enough to leave on in production.
+
+Configuration (environment):
+
+- ``SLOW_QUERY_MS``: threshold in milliseconds (default 100)
+- ``SLOW_QUERY_SAMPLE_RATE``: fraction of statements timed (default 1.0)
+- ``SLOW_QUERY_EXPLAIN``: ``0`` disables plan capture (default on)
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .request_timing import current_route, current_use_case
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "100"))
+SLOW_QUERY_SAMPLE_RATE = float(os.getenv("SLOW_QUERY_SAMPLE_RATE", "1.0"))
+SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "1") != "0"
+
+# Statements EXPLAIN QUERY PLAN accepts; DDL and PRAGMAs are skipped
+EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "REPLACE")
+
+_START = "_slow_query_start"
+
+logger = logging.getLogger("trading.sql.slow")
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    statement: str
+    duration_ms: float
+    route: Optional[str]
+    use_case: Optional[str]
+    plan: Optional[List[str]]
+
+
+class SlowQueryLog:
+    def __init__(
+        self,
+        threshold_ms: float = SLOW_QUERY_MS,
+        sample_rate: float = SLOW_QUERY_SAMPLE_RATE,
+        explain: bool = SLOW_QUERY_EXPLAIN,
+        max_recent: int = 100,
+    ):
+        self.threshold = threshold_ms / 1000
+        self.sample_rate = sample_rate
+        self.explain = explain
+        self._recent: deque = deque(maxlen=max_recent)
+        self._lock = threading.Lock()
+
+    def install(self, engine: Engine):
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def uninstall(self, engine: Engine):
+        event.remove(engine, "before_cursor_execute", self._before)
+        event.remove(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        if self.sample_rate >= 1.0 or random.random() < self.sample_rate:
+            setattr(context, _START, time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, _START, None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        if elapsed < self.threshold:
+            return
+
+        plan = None
+        if self.explain and conn.dialect.name == "sqlite":
+            plan = _explain(cursor, statement, parameters, executemany)
+
+        entry = SlowQuery(
+            statement=statement,
+            duration_ms=round(elapsed * 1000, 3),
+            route=current_route(),
+            use_case=current_use_case(),
+            plan=plan,
+        )
+        with self._lock:
+            self._recent.append(entry)
+        logger.warning(
+            "slow query %.1f ms [%s %s]: %s",
+            entry.duration_ms,
+            entry.route or "-",
+            entry.use_case or "-",
+            statement,
+            extra={
+                "duration_ms": entry.duration_ms,
+                "route": entry.route,
+                "use_case": entry.use_case,
+                "statement": statement,
+                "query_plan": plan,
+            },
+        )
+
+    def recent(self) -> List[SlowQuery]:
+        with self._lock:
+            return list(self._recent)
+
+    def clear(self):
+        with self._lock:
+            self._recent.clear()
+
+
+def _explain(cursor, statement: str, parameters, executemany: bool):
+    """EXPLAIN QUERY PLAN on the raw connection, outside SQLAlchemy's events"""
+    if not statement.lstrip().upper().startswith(EXPLAINABLE):
+        return None
+    if executemany:
+        parameters = parameters[0] if parameters else ()
+    try:
+        rows = cursor.connection.execute(
+            "EXPLAIN QUERY PLAN " + statement, parameters
+        ).fetchall()
+    except Exception:
+        # The plan is a diagnostic; never fail the query that was slow
+        return None
+    return [row[-1] for row in rows]
+
+
+slow_query_log = SlowQueryLog()
@@ -1,8 +1,28 @@
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from decimal import Decimal
+from datetime import date, datetime, timezone
+from sqlalchemy import (
+    Float,
+    Integer,
+    cast,
+    func,
+    or_,
+    select,
+    tuple_,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from trading.domain.order import Order
+from trading.domain.trade import Trade
+from trading.domain.candle import Candle, CandleInterval
+from trading.domain.balance import Balance, BalanceAccount
+from trading.domain.pair_registry import PairListing
+from trading.domain.symbol_rules import RULE_FIELDS, SymbolRules
+from trading.domain.user import User
+from trading.domain.api_key import ApiKey
 from trading.domain.value_objects import (
     Money,
     TradingPair,
@@ -10,10 +30,26 @@ from trading.domain.value_objects import (
     OrderType,
     OrderStatus,
 )
-from trading.domain.exceptions import OrderNotFoundException
-from .models import OrderModel, OrderSideDB, OrderTypeDB, OrderStatusDB
+from trading.domain.exceptions import OrderNotFoundException, TradeNotFoundException
+from .metrics import timed_repository
+from .models import (
+    OrderModel,
+    TradeModel,
+    CandleModel,
+    BalanceModel,
+    TradingPairModel,
+    UserModel,
+    ApiKeyModel,
+    OrderSideDB,
+    OrderTypeDB,
+    OrderStatusDB,
+)
 
+# Rows fetched per round trip when streaming large result sets
+STREAM_BATCH_SIZE = 500
 
+
+@timed_repository
 class OrderRepository:
     def __init__(self, db_session: Session):
         self.db = db_session
@@ -41,6 +77,23 @@ class OrderRepository:
 
         return [self._model_to_domain(om) for om in order_models]
 
+    def iter_by_user_id(
+        self,
+        user_id: str,
+        symbol: Optional[str] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Order]:
+        """Stream a user's orders from a server-side cursor, newest first"""
+        query = self.db.query(OrderModel).filter_by(user_id=user_id)
+
+        if symbol:
+            query = query.filter_by(symbol=symbol)
+
+        query = query.order_by(OrderModel.created_at.desc()).yield_per(batch_size)
+
+        for order_model in query:
+            yield self._model_to_domain(order_model)
+
     def find_by_symbol(self, symbol: str) -> List[Order]:
         order_models = (
             self.db.query(OrderModel)
@@ -77,6 +130,25 @@ class OrderRepository:
 
         return [self._model_to_domain(om) for om in order_models]
 
+    def find_version(self, order_id: str) -> Optional[tuple]:
+        """(user_id, updated_at) of one order without loading the row"""
+        return (
+            self.db.query(OrderModel.user_id, OrderModel.updated_at)
+            .filter_by(order_id=order_id)
+            .first()
+        )
+
+    def list_version(self, user_id: str, symbol: Optional[str] = None) -> tuple:
+        """(count, latest updated_at) of a user's orders, optionally per symbol"""
+        query = self.db.query(
+            func.count(OrderModel.order_id), func.max(OrderModel.updated_at)
+        ).filter(OrderModel.user_id == user_id)
+
+        if symbol:
+            query = query.filter(OrderModel.symbol == symbol)
+
+        return query.one()
+
     def delete(self, order_id: str) -> None:
         order_model = self.db.query(OrderModel).filter_by(order_id=order_id).first()
 
@@ -120,15 +192,445 @@ class OrderRepository:
         )
 
 
+@timed_repository
 class TradeRepository:
     def __init__(self, db_session: Session):
         self.db = db_session
 
-    def save(self, trade) -> None:
-        pass
+    def save(self, trade: Trade) -> None:
+        trade_model = self._domain_to_model(trade)
+        self.db.merge(trade_model)
+
+    def find_by_id(self, trade_id: str) -> Trade:
+        trade_model = self.db.query(TradeModel).filter_by(trade_id=trade_id).first()
+
+        if not trade_model:
+            raise TradeNotFoundException(trade_id)
+
+        return self._model_to_domain(trade_model)
+
+    def find_by_symbol(self, symbol: str) -> List[Trade]:
+        trade_models = (
+            self.db.query(TradeModel)
+            .filter_by(symbol=symbol)
+            .order_by(TradeModel.executed_at.desc())
+            .all()
+        )
+
+        return [self._model_to_domain(tm) for tm in trade_models]
+
+    def iter_by_user_id(
+        self,
+        user_id: str,
+        symbol: Optional[str] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[Trade]:
+        """Stream trades where the user was buyer or seller, newest first"""
+        query = self.db.query(TradeModel).filter(
+            or_(
+                TradeModel.buyer_user_id == user_id,
+                TradeModel.seller_user_id == user_id,
+            )
+        )
+
+        if symbol:
+            query = query.filter_by(symbol=symbol)
+
+        query = query.order_by(TradeModel.executed_at.desc()).yield_per(batch_size)
+
+        for trade_model in query:
+            yield self._model_to_domain(trade_model)
+
+    def fetch_columns(
+        self,
+        symbol: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[tuple]:
+        """Raw (price, quantity, buyer_fee, seller_fee, epoch_ms) rows.
+
+        Bypasses the ORM and Decimal conversion so analytics can load
+        millions of rows in one fetch; numbers come back as floats.
+        """
+        epoch_ms = cast(
+            func.round(
+                (func.julianday(TradeModel.executed_at) - 2440587.5) * 86400000.0
+            ),
+            Integer,
+        )
+        statement = select(
+            type_coerce(TradeModel.price, Float),
+            type_coerce(TradeModel.quantity, Float),
+            type_coerce(TradeModel.buyer_fee, Float),
+            type_coerce(TradeModel.seller_fee, Float),
+            epoch_ms,
+        ).where(TradeModel.symbol == symbol)
+
+        if start:
+            statement = statement.where(
+                TradeModel.executed_at >= start.replace(tzinfo=None)
+            )
+        if end:
+            statement = statement.where(
+                TradeModel.executed_at < end.replace(tzinfo=None)
+            )
+
+        statement = statement.order_by(TradeModel.executed_at)
+        return self.db.execute(statement).all()
+
+    def fetch_market_snapshot(self, since: datetime) -> List[tuple]:
+        """(symbol, price, quantity, executed_at) of every trade since ``since``
+        plus the last trade of each symbol, oldest first, in one query
+        """
+        latest = select(TradeModel.symbol, func.max(TradeModel.executed_at)).group_by(
+            TradeModel.symbol
+        )
+        statement = (
+            select(
+                TradeModel.symbol,
+                TradeModel.price,
+                TradeModel.quantity,
+                TradeModel.executed_at,
+            )
+            .where(
+                or_(
+                    TradeModel.executed_at >= since.replace(tzinfo=None),
+                    tuple_(TradeModel.symbol, TradeModel.executed_at).in_(latest),
+                )
+            )
+            .order_by(TradeModel.executed_at)
+        )
+        return self.db.execute(statement).all()
+
+    def daily_quote_volumes(
+        self, user_ids: Iterable[str], since: datetime
+    ) -> Dict[str, Dict[date, Decimal]]:
+        """Quote volume per user per day since ``since``, both sides combined"""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+
+        since = since.replace(tzinfo=None)
+        quote_quantity = type_coerce(TradeModel.price, Float) * type_coerce(
+            TradeModel.quantity, Float
+        )
+        sides = union_all(
+            *(
+                select(
+                    user_column.label("user_id"),
+                    func.date(TradeModel.executed_at).label("day"),
+                    quote_quantity.label("quote_quantity"),
+                ).where(user_column.in_(user_ids), TradeModel.executed_at >= since)
+                for user_column in (
+                    TradeModel.buyer_user_id,
+                    TradeModel.seller_user_id,
+                )
+            )
+        ).subquery()
+        statement = select(
+            sides.c.user_id, sides.c.day, func.sum(sides.c.quote_quantity)
+        ).group_by(sides.c.user_id, sides.c.day)
+
+        volumes: Dict[str, Dict[date, Decimal]] = {}
+        for user_id, day, volume in self.db.execute(statement):
+            volumes.setdefault(user_id, {})[date.fromisoformat(day)] = Decimal(
+                str(volume)
+            )
+        return volumes
+
+    def _domain_to_model(self, trade: Trade) -> TradeModel:
+        return TradeModel(
+            trade_id=trade.trade_id,
+            symbol=trade.trading_pair.symbol,
+            buy_order_id=trade.buy_order_id,
+            sell_order_id=trade.sell_order_id,
+            buyer_user_id=trade.buyer_user_id,
+            seller_user_id=trade.seller_user_id,
+            price=trade.price.amount,
+            quantity=trade.quantity,
+            buyer_fee=trade.buyer_fee,
+            seller_fee=trade.seller_fee,
+            executed_at=trade.executed_at,
+        )
+
+    def _model_to_domain(self, trade_model: TradeModel) -> Trade:
+        trading_pair = TradingPair.from_symbol(trade_model.symbol)
+
+        price = Money(
+            amount=Decimal(str(trade_model.price)), currency=trading_pair.quote_currency
+        )
+
+        return Trade(
+            trade_id=trade_model.trade_id,
+            trading_pair=trading_pair,
+            buy_order_id=trade_model.buy_order_id,
+            sell_order_id=trade_model.sell_order_id,
+            buyer_user_id=trade_model.buyer_user_id,
+            seller_user_id=trade_model.seller_user_id,
+            price=price,
+            quantity=Decimal(str(trade_model.quantity)),
+            buyer_fee=Decimal(str(trade_model.buyer_fee)),
+            seller_fee=Decimal(str(trade_model.seller_fee)),
+            executed_at=trade_model.executed_at,
+        )
+
+
+@timed_repository
+class CandleRepository:
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def upsert(self, candles: List[Candle]) -> None:
+        """Insert or overwrite candles in a single statement"""
+        if not candles:
+            return
 
-    def find_by_id(self, trade_id: str):
-        pass
+        rows = [self._domain_to_row(candle) for candle in candles]
+        statement = sqlite_insert(CandleModel).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=["symbol", "interval", "open_time"],
+            set_={
+                column: statement.excluded[column]
+                for column in (
+                    "open",
+                    "high",
+                    "low",
+                    "close",
+                    "volume",
+                    "quote_volume",
+                    "trade_count",
+                    "last_trade_at",
+                )
+            },
+        )
+        self.db.execute(statement)
+
+    def find_one(
+        self, symbol: str, interval: CandleInterval, open_time: datetime
+    ) -> Optional[Candle]:
+        candle_model = (
+            self.db.query(CandleModel)
+            .filter_by(
+                symbol=symbol,
+                interval=interval.value,
+                open_time=open_time.replace(tzinfo=None),
+            )
+            .first()
+        )
+
+        return self._model_to_domain(candle_model) if candle_model else None
+
+    def find_latest(self) -> List[Candle]:
+        """Newest candle of every (symbol, interval)"""
+        latest = select(
+            CandleModel.symbol, CandleModel.interval, func.max(CandleModel.open_time)
+        ).group_by(CandleModel.symbol, CandleModel.interval)
+        candle_models = (
+            self.db.query(CandleModel)
+            .filter(
+                tuple_(
+                    CandleModel.symbol, CandleModel.interval, CandleModel.open_time
+                ).in_(latest)
+            )
+            .all()
+        )
+
+        return [self._model_to_domain(cm) for cm in candle_models]
+
+    def find_recent(
+        self, symbol: str, interval: CandleInterval, limit: int
+    ) -> List[Candle]:
+        """Latest ``limit`` candles in chronological order"""
+        candle_models = (
+            self.db.query(CandleModel)
+            .filter_by(symbol=symbol, interval=interval.value)
+            .order_by(CandleModel.open_time.desc())
+            .limit(limit)
+            .all()
+        )
+
+        return [self._model_to_domain(cm) for cm in reversed(candle_models)]
+
+    def _domain_to_row(self, candle: Candle) -> dict:
+        return {
+            "symbol": candle.symbol,
+            "interval": candle.interval.value,
+            "open_time": candle.open_time.replace(tzinfo=None),
+            "open": candle.open,
+            "high": candle.high,
+            "low": candle.low,
+            "close": candle.close,
+            "volume": candle.volume,
+            "quote_volume": candle.quote_volume,
+            "trade_count": candle.trade_count,
+            "last_trade_at": (
+                candle.last_trade_at.replace(tzinfo=None)
+                if candle.last_trade_at
+                else None
+            ),
+        }
+
+    def _model_to_domain(self, candle_model: CandleModel) -> Candle:
+        return Candle(
+            symbol=candle_model.symbol,
+            interval=CandleInterval(candle_model.interval),
+            open_time=candle_model.open_time,
+            open=Decimal(str(candle_model.open)),
+            high=Decimal(str(candle_model.high)),
+            low=Decimal(str(candle_model.low)),
+            close=Decimal(str(candle_model.close)),
+            volume=Decimal(str(candle_model.volume)),
+            quote_volume=Decimal(str(candle_model.quote_volume)),
+            trade_count=candle_model.trade_count,
+            last_trade_at=candle_model.last_trade_at,
+        )
+
+
+@timed_repository
+class BalanceRepository:
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def find_by_user_id(self, user_id: str) -> List[Balance]:
+        balance_models = self.db.query(BalanceModel).filter_by(user_id=user_id).all()
+
+        return [
+            Balance(
+                currency=bm.currency,
+                available=Decimal(str(bm.available)),
+                locked=Decimal(str(bm.locked)),
+            )
+            for bm in balance_models
+        ]
+
+    def save_accounts(self, accounts: List[BalanceAccount]) -> None:
+        """Write every balance of the given accounts in a single upsert"""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows = [
+            {
+                "user_id": account.user_id,
+                "currency": balance.currency,
+                "available": balance.available,
+                "locked": balance.locked,
+                "updated_at": now,
+            }
+            for account in accounts
+            for balance in account.snapshot()
+        ]
+        if not rows:
+            return
+
+        statement = sqlite_insert(BalanceModel).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id", "currency"],
+            set_={
+                "available": statement.excluded.available,
+                "locked": statement.excluded.locked,
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+        self.db.execute(statement)
+
+
+@timed_repository
+class TradingPairRepository:
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def find_all(self) -> List[PairListing]:
+        pair_models = self.db.query(TradingPairModel).all()
+        return [self._model_to_domain(pm) for pm in pair_models]
+
+    def save(self, listing: PairListing) -> None:
+        now = datetime.now(timezone.utc)
+        pair_model = self.db.get(TradingPairModel, listing.symbol)
+
+        if pair_model is None:
+            pair_model = TradingPairModel(
+                symbol=listing.symbol,
+                base_currency=listing.trading_pair.base_currency,
+                quote_currency=listing.trading_pair.quote_currency,
+                created_at=now,
+            )
+            self.db.add(pair_model)
+
+        pair_model.is_active = listing.is_active
+        for name in RULE_FIELDS:
+            setattr(pair_model, name, getattr(listing.rules, name))
+        pair_model.updated_at = now
+
+    def _model_to_domain(self, pair_model: TradingPairModel) -> PairListing:
+        return PairListing(
+            trading_pair=TradingPair(
+                pair_model.base_currency, pair_model.quote_currency
+            ),
+            is_active=pair_model.is_active,
+            rules=SymbolRules(
+                **{name: getattr(pair_model, name) for name in RULE_FIELDS}
+            ),
+        )
+
+
+@timed_repository
+class UserRepository:
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def find_by_username(self, username: str) -> Optional[User]:
+        user_model = self.db.get(UserModel, username)
+        if user_model is None:
+            return None
+        return self._model_to_domain(user_model)
 
-    def find_by_symbol(self, symbol: str):
-        pass
+    def count(self) -> int:
+        return self.db.query(func.count(UserModel.username)).scalar()
+
+    def save(self, user: User) -> None:
+        user_model = UserModel(
+            username=user.username,
+            hashed_password=user.hashed_password,
+            role=user.role,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+        self.db.merge(user_model)
+
+    def _model_to_domain(self, user_model: UserModel) -> User:
+        return User(
+            username=user_model.username,
+            hashed_password=user_model.hashed_password,
+            role=user_model.role,
+            created_at=user_model.created_at,
+            updated_at=user_model.updated_at,
+        )
+
+
+@timed_repository
+class ApiKeyRepository:
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def find_by_id(self, key_id: str) -> Optional[ApiKey]:
+        key_model = self.db.get(ApiKeyModel, key_id)
+        if key_model is None:
+            return None
+        return self._model_to_domain(key_model)
+
+    def save(self, api_key: ApiKey) -> None:
+        key_model = ApiKeyModel(
+            key_id=api_key.key_id,
+            username=api_key.username,
+            secret=api_key.secret,
+            is_active=api_key.is_active,
+            created_at=api_key.created_at,
+        )
+        self.db.merge(key_model)
+
+    def _model_to_domain(self, key_model: ApiKeyModel) -> ApiKey:
+        return ApiKey(
+            key_id=key_model.key_id,
+            username=key_model.username,
+            secret=key_model.secret,
+            is_active=key_model.is_active,
+            created_at=key_model.created_at,
+        )
@@ -0,0 +1,101 @@
+"""Per-request stage timings (auth, validation, db, commit, serialize).
+
+The API layer opens a ``RequestTimings`` for each request in a context
+variable; code below it adds time to named stages without knowing whether
+a request is being timed. Outside a request every hook is a no-op.
+
+The same context also records which route and use case are running, so
+lower layers (e.g. the slow-query log) can attribute their work.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_COMMIT_STARTED = "commit_started"
+
+
+class RequestTimings:
+    __slots__ = ("stages", "marks", "route")
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.marks: Dict[str, float] = {}
+        self.route: Optional[str] = None
+
+    def add(self, stage: str, seconds: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def mark(self, name: str):
+        self.marks[name] = time.perf_counter()
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+_use_case: ContextVar[Optional[str]] = ContextVar("use_case", default=None)
+
+
+def start_request() -> Token:
+    return _current.set(RequestTimings())
+
+
+def end_request(token: Token):
+    _current.reset(token)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+def add_stage(stage: str, seconds: float):
+    timings = _current.get()
+    if timings is not None:
+        timings.add(stage, seconds)
+
+
+def current_route() -> Optional[str]:
+    timings = _current.get()
+    return timings.route if timings is not None else None
+
+
+def enter_use_case(name: str) -> Token:
+    return _use_case.set(name)
+
+
+def exit_use_case(token: Token):
+    _use_case.reset(token)
+
+
+def current_use_case() -> Optional[str]:
+    return _use_case.get()
+
+
+@contextmanager
+def timed_stage(stage: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_stage(stage, time.perf_counter() - start)
+
+
+@event.listens_for(Session, "before_commit")
+def _start_commit_timer(session: Session) -> None:
+    session.info[_COMMIT_STARTED] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_commit")
+def _stop_commit_timer(session: Session) -> None:
+    started = session.info.pop(_COMMIT_STARTED, None)
+    if started is not None:
+        add_stage("commit", time.perf_counter() - started)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_commit_timer(session: Session, previous_transaction) -> None:
+    session.info.pop(_COMMIT_STARTED, None)
@@ -0,0 +1,57 @@
+"""Run in-memory side effects only when the surrounding transaction settles.
+
+Use cases mutate process-wide state (ledger, caches) while the route still
+owns the commit. ``on_commit`` callbacks run after a successful commit;
+``on_rollback`` callbacks undo work when the session rolls back instead,
+or when it is closed with the transaction still open (``get_db`` only
+closes, so an unexpected exception before the commit ends up here).
+"""
+
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_COMMIT_CALLBACKS = "on_commit_callbacks"
+_ROLLBACK_CALLBACKS = "on_rollback_callbacks"
+
+
+def on_commit(db: Session, callback: Callable[[], None]) -> None:
+    _ensure_transaction(db)
+    db.info.setdefault(_COMMIT_CALLBACKS, []).append(callback)
+
+
+def on_rollback(db: Session, callback: Callable[[], None]) -> None:
+    _ensure_transaction(db)
+    db.info.setdefault(_ROLLBACK_CALLBACKS, []).append(callback)
+
+
+def _ensure_transaction(db: Session) -> None:
+    # Commit/rollback only fire events once a transaction exists; beginning
+    # one is free until the first statement checks out a connection
+    if not db.in_transaction():
+        db.begin()
+
+
+@event.listens_for(Session, "after_commit")
+def _run_commit_callbacks(session: Session) -> None:
+    callbacks = session.info.pop(_COMMIT_CALLBACKS, [])
+    session.info.pop(_ROLLBACK_CALLBACKS, None)
+    for callback in callbacks:
+        callback()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _run_rollback_callbacks(session: Session, previous_transaction) -> None:
+    callbacks = session.info.pop(_ROLLBACK_CALLBACKS, [])
+    session.info.pop(_COMMIT_CALLBACKS, None)
+    # Undo in reverse order of the original operations
+    for callback in reversed(callbacks):
+        callback()
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _run_abandoned_callbacks(session: Session, transaction) -> None:
+    # Fires after a commit too, but by then both lists have been popped
+    if transaction.parent is None:
+        _run_rollback_callbacks(session, transaction)